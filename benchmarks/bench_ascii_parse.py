@@ -0,0 +1,53 @@
+# benchmarks/bench_ascii_parse.py
+"""
+Microbenchmark for ASCII array parsing in DataProperty.
+
+Compares the per-element path (split, strip and converter call per value,
+used for custom converters) with the NumPy fast path used for numeric
+converters, on comma-separated responses the size of an HP8563A trace
+(601 points), a long ASCII scope waveform (100k) and a deep memory
+record (2M).
+
+Usage:
+    python benchmarks/bench_ascii_parse.py [--repeat 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.properties import DataProperty
+
+
+def best_of(repeat: int, func) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per case (best is reported)")
+    args = parser.parse_args()
+
+    fast = DataProperty("TRA", access='read')
+    generic = DataProperty("TRA", access='read', converter=lambda v: float(v))
+    rng = np.random.default_rng(0)
+
+    print(f"  {'points':>10}{'generic ms':>14}{'fast ms':>12}{'speedup':>10}")
+    for points in (601, 100_000, 2_000_000):
+        response = ",".join(f"{v:.6E}" for v in rng.normal(-60, 5, points))
+        repeat = args.repeat if points < 1_000_000 else max(1, args.repeat // 2)
+        assert np.array_equal(fast.parse(response), generic.parse(response))
+        slow_s = best_of(repeat, lambda: generic.parse(response))
+        fast_s = best_of(repeat, lambda: fast.parse(response))
+        print(f"  {points:>10,}{slow_s * 1e3:>14.3f}{fast_s * 1e3:>12.3f}{slow_s / fast_s:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
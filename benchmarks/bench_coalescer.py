@@ -0,0 +1,96 @@
+# benchmarks/bench_coalescer.py
+"""
+GUI-thread deliveries for worker-thread trace updates, coalesced versus queued.
+
+A worker thread updates a trace's data at --rate Hz for --seconds, the way a
+test script calling plot.set_trace() in a loop does. The main thread runs the
+event loop and counts the deliveries a plot view would repaint for: the
+coalesced column counts ApplicationState subscription callbacks, the queued
+column counts a receiver connected straight to property_changed (one queued
+signal per update, the previous behaviour).
+
+Usage:
+    python benchmarks/bench_coalescer.py [--rate 1000] [--seconds 2]
+"""
+
+import argparse
+import logging
+import threading
+import time
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QEventLoop, QObject, QTimer, Slot
+
+from pymetr.core.state import ApplicationState
+from pymetr.models.trace import Trace
+
+
+class QueuedReceiver(QObject):
+    """Main-thread receiver of property_changed, counting every delivery."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    @Slot(str, str, str, object)
+    def on_change(self, model_id, model_type, prop, value):
+        self.count += 1
+
+
+def push_updates(trace: Trace, rate: float, seconds: float, done: threading.Event):
+    """Set trace.data at `rate` Hz from the calling thread."""
+    x = np.arange(1000)
+    period = 1.0 / rate
+    start = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - start < seconds:
+        trace.data = (x, np.random.random(1000))
+        sent += 1
+        next_time = start + sent * period
+        delay = next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    done.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rate', type=float, default=1000, help="Worker updates per second")
+    parser.add_argument('--seconds', type=float, default=2.0, help="Duration of the run")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841 - state needs an app
+    logging.disable(logging.DEBUG)
+
+    state = ApplicationState()
+    trace = state.create_model(Trace, x_data=np.arange(2), y_data=np.arange(2), name="bench")
+    coalesced = [0]
+    state.subscribe(lambda *change: coalesced.__setitem__(0, coalesced[0] + 1), model_id=trace.id, prop="data")
+    receiver = QueuedReceiver()
+    trace.property_changed.connect(receiver.on_change)
+
+    done = threading.Event()
+    worker = threading.Thread(target=push_updates, args=(trace, args.rate, args.seconds, done))
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: done.is_set() and loop.quit())
+    poll.start(50)
+
+    start = time.perf_counter()
+    worker.start()
+    loop.exec()
+    worker.join()
+    QTimer.singleShot(100, loop.quit)  # let the last frame and queued signals drain
+    loop.exec()
+    elapsed = time.perf_counter() - start
+
+    stats = state.get_update_stats()
+    print(f"  {'':<14}{'deliveries':>12}{'per second':>12}")
+    print(f"  {'worker sets':<14}{stats['queued']:>12,}{stats['queued'] / elapsed:>12,.0f}")
+    print(f"  {'queued':<14}{receiver.count:>12,}{receiver.count / elapsed:>12,.0f}")
+    print(f"  {'coalesced':<14}{coalesced[0]:>12,}{coalesced[0] / elapsed:>12,.0f}")
+    print(f"  dropped {stats['dropped']:,} superseded updates over {stats['frames']:,} frames")
+
+
+if __name__ == '__main__':
+    main()
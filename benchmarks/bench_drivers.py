@@ -0,0 +1,138 @@
+# benchmarks/bench_drivers.py
+"""
+End-to-end driver benchmark against the loopback instrument emulator.
+
+Starts an in-process emulator for each instrument, connects the real driver
+over RawSocketConnection and times typical operations: identity queries,
+property reads, waveform/trace fetches and channel frequency updates.
+Latency and jitter simulate a slow instrument so transport overhead can be
+compared with instrument turnaround.
+
+Usage:
+    python benchmarks/bench_drivers.py [--repeat 200] [--points 62500]
+                                       [--latency 0.0] [--jitter 0.0]
+"""
+
+import argparse
+import time
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.connections import RawSocketConnection
+from pymetr.drivers.emulator import (
+    EmulatorServer, ScopeEmulator, SpectrumAnalyzerEmulator, SynthesizerEmulator
+)
+from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+from pymetr.drivers.instruments.hp8563a import HP8563A
+from pymetr.drivers.instruments.hs9000 import HS9000
+
+
+def timed(label: str, repeat: int, func, payload_bytes: int = 0):
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    rate = f"{payload_bytes * repeat / elapsed / 1e6:>10,.1f}" if payload_bytes else f"{'':>10}"
+    print(f"  {label:<32}{repeat / elapsed:>12,.0f}{elapsed / repeat * 1e3:>12.3f}{rate}")
+
+
+def bench_scope(args, options):
+    with EmulatorServer(ScopeEmulator(points=args.points, **options)) as server:
+        conn = RawSocketConnection(server.resource, timeout=10.0)
+        conn.open()
+        scope = Dsox1204g(conn)
+        scope.waveform.format = "WORD"
+        print(f"Dsox1204g ({args.points} points)")
+        timed("*IDN?", args.repeat, lambda: scope.query("*IDN?"))
+        timed("timebase.scale", args.repeat, lambda: scope.timebase.scale)
+        timed("waveform.preamble", args.repeat, lambda: scope.waveform.preamble)
+        timed("waveform :DATa? (WORD)", max(1, args.repeat // 10),
+              lambda: scope.waveform.query_block(":DATa?", dtype='>u2'), args.points * 2)
+        timed("waveform.voltage (WORD, scaled)", max(1, args.repeat // 10),
+              lambda: scope.waveform.voltage, args.points * 2)
+
+        def raw_four_channels():
+            for n in range(1, 5):
+                scope.waveform.query_block(":DATa?", dtype='>u2')
+
+        scope.format = "WORD"
+        channels = ["CHAN1", "CHAN2", "CHAN3", "CHAN4"]
+        timed("4x :DATa? raw (WORD)", max(1, args.repeat // 10), raw_four_channels, args.points * 8)
+        timed("fetch_trace 4 channels", max(1, args.repeat // 10),
+              lambda: scope.fetch_trace(*channels), args.points * 8)
+        conn.close()
+
+
+def bench_spectrum_analyzer(args, options):
+    with EmulatorServer(SpectrumAnalyzerEmulator(**options)) as server:
+        conn = RawSocketConnection(server.resource, timeout=10.0, read_termination='\r\n')
+        conn.open()
+        sa = HP8563A(conn)
+        print("HP8563A (601 points)")
+        timed("ID?", args.repeat, lambda: sa.query("ID?"))
+        timed("frequency.center", args.repeat, lambda: sa.frequency.center)
+        timed("trace.data (ASCII)", max(1, args.repeat // 10), lambda: sa.trace.data)
+        sa.trace.format = "A"
+        timed("trace.codes (#A block)", max(1, args.repeat // 10), lambda: sa.trace.codes, 1202)
+
+        sa.sweep.time = 0.02
+        for binary in (False, True):
+            sa.binary_transfer = binary
+            label = "binary" if binary else "ASCII"
+            timed(f"fetch_trace ({label}, 20 ms sweep)", max(1, args.repeat // 20), sa.fetch_trace)
+
+        def fetch_and_plot():
+            sa.fetch_trace()
+            time.sleep(0.02)  # stands in for plotting between acquisitions
+
+        for continuous in (False, True):
+            sa.set_continuous_mode(continuous)
+            label = "continuous" if continuous else "single"
+            timed(f"fetch + 20 ms plot ({label})", max(1, args.repeat // 20), fetch_and_plot)
+        sa.set_continuous_mode(False)
+        conn.close()
+
+
+def bench_synthesizer(args, options):
+    with EmulatorServer(SynthesizerEmulator(**options)) as server:
+        conn = RawSocketConnection(server.resource, timeout=10.0)
+        conn.open()
+        synth = HS9000(conn)
+        print("HS9000 (4 channels)")
+
+        def sweep_channels():
+            for channel in synth.channel[1:]:
+                channel.frequency = 2.1e9
+                channel.frequency
+
+        def batched_bring_up():
+            with synth.batch():
+                for channel in synth.channel[1:]:
+                    channel.frequency = 2.1e9
+                    channel.power = 0
+                    channel.phase = 0
+            synth.query("*OPC?")
+
+        timed("*IDN?", args.repeat, lambda: synth.query("*IDN?"))
+        timed("4x :CHn:FREQ set + get", max(1, args.repeat // 4), sweep_channels)
+        timed("batch() 12 sets + *OPC?", max(1, args.repeat // 4), batched_bring_up)
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=200, help="Iterations per small operation")
+    parser.add_argument('--points', type=int, default=62500, help="Scope waveform points")
+    parser.add_argument('--latency', type=float, default=0.0, help="Emulated seconds per command")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Emulated max extra seconds per command")
+    args = parser.parse_args()
+
+    options = dict(latency=args.latency, jitter=args.jitter, seed=0)
+    print(f"  {'operation':<32}{'ops/s':>12}{'ms/op':>12}{'MB/s':>10}")
+    bench_scope(args, options)
+    bench_spectrum_analyzer(args, options)
+    bench_synthesizer(args, options)
+
+
+if __name__ == '__main__':
+    main()
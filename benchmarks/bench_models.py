@@ -0,0 +1,81 @@
+# benchmarks/bench_models.py
+"""
+Creation rate and memory per model: QObject BaseModel versus slotted LiteModel.
+
+Creates --count measurements with the lite Measurement and with an
+equivalent BaseModel subclass (the previous Measurement), standalone and
+registered with an ApplicationState, and reports models per second and
+bytes per model as traced by tracemalloc (Python allocations only; the
+QObject column also owns C++ memory that tracemalloc cannot see, so its
+real footprint is larger).
+
+Usage:
+    python benchmarks/bench_models.py [--count 20000]
+"""
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from PySide6.QtCore import QCoreApplication
+
+from pymetr.core.state import ApplicationState
+from pymetr.models.base import BaseModel
+from pymetr.models.measurement import Measurement
+
+
+class QObjectMeasurement(BaseModel):
+    """The QObject-based Measurement as it was before the lite tier."""
+
+    def __init__(self, name: str, value: float, units: str = "", model_id=None):
+        super().__init__(model_type='Measurement', model_id=model_id)
+        with self.batch_update():
+            self.set_property("name", name)
+            self.set_property("value", value)
+            self.set_property("units", units)
+            self.set_property("timestamp", None)
+            self.set_property("limits", None)
+            self.set_property("status", "Valid")
+
+
+def measure(model_class, count: int, registered: bool):
+    """Return (models per second, traced bytes per model)."""
+    state = ApplicationState() if registered else None
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    models = []
+    for index in range(count):
+        if state is not None:
+            models.append(state.create_model(model_class, name=f"m{index}", value=float(index), units="V"))
+        else:
+            models.append(model_class(f"m{index}", float(index), "V"))
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    if state is not None:
+        state.deleteLater()
+    return count / elapsed, current / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=20000, help="Models created per run")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841 - state needs an app
+    logging.disable(logging.DEBUG)
+
+    print(f"  {'model':<26}{'models/s':>12}{'bytes/model':>14}")
+    for registered in (False, True):
+        suffix = " (registered)" if registered else ""
+        for label, model_class in (("BaseModel", QObjectMeasurement), ("LiteModel", Measurement)):
+            rate, size = measure(model_class, args.count, registered)
+            print(f"  {label + suffix:<26}{rate:>12,.0f}{size:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
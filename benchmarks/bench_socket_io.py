@@ -0,0 +1,114 @@
+# benchmarks/bench_socket_io.py
+"""
+Loopback benchmark for the RawSocketConnection receive path.
+
+Runs a local TCP server that answers every line with a canned response and
+measures small-query rate (queries/sec) and large-response throughput (MB/s).
+The "before" numbers come from LegacyRawSocketConnection, which reproduces
+the previous 4 KiB recv() + bytearray re-slicing read path.
+
+Usage:
+    python benchmarks/bench_socket_io.py [--queries 20000] [--mbytes 64]
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.connections import RawSocketConnection
+
+
+class LegacyRawSocketConnection(RawSocketConnection):
+    """The pre-ring-buffer read path, kept here for comparison only."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, chunk_size=4096, **kwargs)
+        self._legacy_buffer = bytearray()
+
+    def read(self) -> str:
+        while True:
+            if self.read_termination in self._legacy_buffer:
+                term_pos = self._legacy_buffer.find(self.read_termination)
+                message = self._legacy_buffer[:term_pos].decode(self.encoding)
+                self._legacy_buffer = self._legacy_buffer[term_pos + len(self.read_termination):]
+                return message
+            chunk = self.read_available()
+            if chunk:
+                self._legacy_buffer.extend(chunk)
+
+
+def start_server(small_reply: bytes, large_reply: bytes) -> int:
+    """Start a loopback server; 'BIG?' gets large_reply, anything else small_reply."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(8)
+
+    def handle(client):
+        with client:
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            pending = b''
+            while True:
+                try:
+                    data = client.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                pending += data
+                while b'\n' in pending:
+                    line, pending = pending.split(b'\n', 1)
+                    client.sendall(large_reply if line == b'BIG?' else small_reply)
+
+    def accept_loop():
+        while True:
+            try:
+                client, _ = server.accept()
+            except OSError:
+                return
+            threading.Thread(target=handle, args=(client,), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def bench(conn_cls, port: int, queries: int, large_count: int, large_size: int) -> tuple:
+    conn = conn_cls('127.0.0.1', port=port, timeout=5.0)
+    conn.open()
+    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        start = time.perf_counter()
+        for _ in range(queries):
+            conn.query('*IDN?')
+        qps = queries / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(large_count):
+            conn.query('BIG?')
+        mbps = large_count * large_size / (time.perf_counter() - start) / 1e6
+    finally:
+        conn.close()
+    return qps, mbps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--queries', type=int, default=20000, help="Small queries to time")
+    parser.add_argument('--mbytes', type=int, default=64, help="Total large-response MB to time")
+    parser.add_argument('--size', type=int, default=4_000_000, help="Bytes per large response")
+    args = parser.parse_args()
+
+    small = b'KEYSIGHT TECHNOLOGIES,DSO-X 1204G,CN00000000,02.12\n'
+    large = b'1.0,' * (args.size // 4 - 1) + b'1.0\n'
+    large_count = max(1, args.mbytes * 1_000_000 // len(large))
+    port = start_server(small, large)
+
+    print(f"{'path':<10}{'queries/s':>14}{'MB/s':>12}")
+    for label, cls in (("before", LegacyRawSocketConnection), ("after", RawSocketConnection)):
+        qps, mbps = bench(cls, port, args.queries, large_count, len(large))
+        print(f"{label:<10}{qps:>14,.0f}{mbps:>12,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+# benchmarks/bench_state_index.py
+"""
+Per-signal dispatch cost of ApplicationState.model_changed versus model count.
+
+Builds a plot -> trace -> marker hierarchy of the requested sizes, connects
+several plot-view style handlers that ignore changes outside their subtree
+(the PlotView._is_descendant check) and times model_changed emissions for
+random traces. The indexed column uses ApplicationState.is_descendant; the
+scan column walks get_parent the way the linear relationship scan used to,
+and is skipped above --scan-limit models. The subscribed column registers
+the same views as subtree subscriptions and delivers through the state's
+dispatcher, reporting how many callbacks ran per change.
+
+Usage:
+    python benchmarks/bench_state_index.py [--sizes 100 1000 10000 100000]
+                                           [--views 4] [--signals 2000]
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from PySide6.QtCore import QCoreApplication
+
+from pymetr.core.state import ApplicationState
+
+
+def build_hierarchy(state: ApplicationState, size: int, traces_per_plot: int = 20):
+    """Link about `size` models as plots of traces with one marker each; return (plots, traces)."""
+    plots, traces = [], []
+    count = 0
+    while count < size:
+        plot_id = f"plot{len(plots)}"
+        plots.append(plot_id)
+        count += 1
+        for _ in range(traces_per_plot):
+            trace_id = f"trace{len(traces)}"
+            state.link_models(plot_id, trace_id)
+            state.link_models(trace_id, f"marker{len(traces)}")
+            traces.append(trace_id)
+            count += 2
+    return plots, traces
+
+
+def scan_is_descendant(state: ApplicationState, model_id: str, ancestor_id: str) -> bool:
+    """The pre-index check: every get_parent scans all relationships."""
+    def scan_parent(child_id):
+        for parent_id, children in state._relationships.items():
+            if child_id in children:
+                return parent_id
+        return None
+
+    current = scan_parent(model_id)
+    while current is not None:
+        if current == ancestor_id:
+            return True
+        current = scan_parent(current)
+    return False
+
+
+def time_dispatch(state: ApplicationState, plots, traces, views: int, signals: int, is_descendant) -> float:
+    """Seconds per model_changed signal with `views` subtree-filtering handlers connected."""
+    hits = [0]
+
+    def make_handler(plot_id):
+        def handler(model_id, model_type, prop, value):
+            if model_id != plot_id and not is_descendant(state, model_id, plot_id):
+                return
+            hits[0] += 1
+        return handler
+
+    handlers = [make_handler(plot_id) for plot_id in plots[:views]]
+    for handler in handlers:
+        state.model_changed.connect(handler)
+
+    rng = random.Random(0)
+    targets = [rng.choice(traces) for _ in range(signals)]
+    start = time.perf_counter()
+    for trace_id in targets:
+        state.model_changed.emit(trace_id, "Trace", "data", None)
+    elapsed = time.perf_counter() - start
+
+    for handler in handlers:
+        state.model_changed.disconnect(handler)
+    return elapsed / signals
+
+
+def time_subscribed(state: ApplicationState, plots, traces, views: int, signals: int):
+    """Seconds per change and callbacks per change with `views` subtree subscriptions."""
+    hits = [0]
+
+    def handler(model_id, model_type, prop, value):
+        hits[0] += 1
+
+    subscriptions = [state.subscribe(handler, subtree=plot_id) for plot_id in plots[:views]]
+    rng = random.Random(0)
+    targets = [rng.choice(traces) for _ in range(signals)]
+    calls = 0
+    start = time.perf_counter()
+    for trace_id in targets:
+        calls += state.dispatcher.dispatch(trace_id, "Trace", "data", None)
+    elapsed = time.perf_counter() - start
+
+    for subscription in subscriptions:
+        state.unsubscribe(subscription)
+    return elapsed / signals, calls / signals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--views', type=int, default=4, help="Open plot views filtering each signal")
+    parser.add_argument('--signals', type=int, default=2000, help="Signals timed per size")
+    parser.add_argument('--scan-limit', type=int, default=10000, help="Largest size timed with the scan")
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841 - state needs an app
+    logging.disable(logging.DEBUG)
+
+    print(f"  {'models':>8}{'indexed us/signal':>20}{'scan us/signal':>18}"
+          f"{'subscribed us':>16}{'calls/change':>14}")
+    for size in args.sizes:
+        state = ApplicationState()
+        plots, traces = build_hierarchy(state, size)
+        indexed = time_dispatch(state, plots, traces, args.views, args.signals,
+                                lambda s, model_id, ancestor_id: s.is_descendant(model_id, ancestor_id))
+        if size <= args.scan_limit:
+            scan = time_dispatch(state, plots, traces, args.views, max(1, args.signals // 20),
+                                 scan_is_descendant)
+            scan_text = f"{scan * 1e6:>18,.1f}"
+        else:
+            scan_text = f"{'-':>18}"
+        subscribed, calls = time_subscribed(state, plots, traces, args.views, args.signals)
+        print(f"  {size:>8}{indexed * 1e6:>20,.2f}{scan_text}{subscribed * 1e6:>16,.2f}{calls:>14.3f}")
+
+
+if __name__ == '__main__':
+    main()
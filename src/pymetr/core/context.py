@@ -9,6 +9,7 @@ from pymetr.models.trace import Trace
 from pymetr.models.marker import Marker
 from pymetr.models.cursor import Cursor
 from pymetr.models.table import DataTable
+from pymetr.models.measurement import Measurement
 from pymetr.models.device import Device
 from pymetr.drivers.base.connections import PyVisaConnection, RawSocketConnection
 from pymetr.ui.dialogs.discovery_dialog import DiscoveryDialog
@@ -104,6 +105,32 @@ class TestContext:
         self._state.link_models(self.script.id, trace.id)
         return trace
     
+    def acquire_segments(self, device, segments: int, source: str = "CHAN1"):
+        """
+        Capture a segmented-memory burst and return it as plain arrays.
+
+        No Trace models are created, so scripts can analyze thousands of
+        segments and plot only what they need, e.g.
+            burst = context.acquire_segments(scope, 1000)
+            peaks = burst.data.max(axis=1)
+            context.create_trace("Peak per segment", burst.timestamps, peaks)
+
+        Args:
+            device: Device model or instrument driver that supports
+                acquire_segments() (e.g. Dsox1204g)
+            segments: Number of trigger events to capture
+            source: Channel to digitize
+
+        Returns:
+            SegmentedWaveform with data shaped (segments, points)
+        """
+        driver = getattr(device, 'instrument', device)
+        if driver is None:
+            raise ValueError("Device not connected")
+        if not hasattr(driver, 'acquire_segments'):
+            raise ValueError(f"{type(driver).__name__} does not support segmented acquisition")
+        return driver.acquire_segments(segments, source=source)
+
     def create_table(self, title: str) -> DataTable:
         """Create a table linked to this test."""
         table = self._state.create_model(DataTable, title=title)
@@ -122,6 +149,17 @@ class TestContext:
         self._state.link_models(self.script.id, cursor.id)
         return cursor
 
+    def create_measurement(self, name: str, value: float, units: str = "",
+                           parent: Optional[Any] = None) -> Measurement:
+        """
+        Record a measurement under a result or group, or under this test.
+
+        Measurements are lite models, so recording thousands is cheap.
+        """
+        measurement = self._state.create_model(Measurement, name=name, value=value, units=units)
+        self._state.link_models((parent or self.script).id, measurement.id)
+        return measurement
+
     def get_result(self, name: str) -> Optional[TestResult]:
         """Find a result by name."""
         for model in self._state.get_children(self.script.id):
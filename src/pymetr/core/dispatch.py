@@ -0,0 +1,240 @@
+"""
+Subscription-based delivery of model property changes.
+
+Views subscribe to the changes they display instead of filtering every
+change of every model. A subscription can name a model ID, a subtree root
+(the root and all of its descendants), model types and property names;
+the dispatcher indexes each subscription under its most selective filter,
+so a change only reaches the subscriptions that can match it.
+
+Batched changes of one model are dispatched as a unit. Subscribers that
+redraw per model can subscribe with grouped=True to get each batch in one
+callback instead of one callback per property.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from pymetr.core.logging import logger
+
+ChangeCallback = Callable[[str, str, str, Any], None]  # model_id, model_type, prop, value
+GroupedChangeCallback = Callable[[str, str, Dict[str, Any]], None]  # model_id, model_type, changes
+AncestorLookup = Callable[[str], Tuple[Tuple[str, ...], FrozenSet[str]]]
+
+
+def _as_set(value: Union[None, str, Iterable[str]]) -> Optional[FrozenSet[str]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return frozenset((value,))
+    return frozenset(value)
+
+
+class Subscription:
+    """
+    A registered change callback and its filters.
+
+    Created by ModelChangeDispatcher.subscribe(); pass it to unsubscribe()
+    or call cancel() to stop deliveries.
+    """
+
+    __slots__ = ('callback', 'model_id', 'subtree', 'model_types', 'props', 'grouped', 'active',
+                 '_dispatcher')
+
+    def __init__(self, dispatcher: 'ModelChangeDispatcher',
+                 callback: Union[ChangeCallback, GroupedChangeCallback],
+                 model_id: Optional[str], subtree: Optional[str],
+                 model_types: Optional[FrozenSet[str]], props: Optional[FrozenSet[str]],
+                 grouped: bool = False):
+        self._dispatcher = dispatcher
+        self.callback = callback
+        self.model_id = model_id
+        self.subtree = subtree
+        self.model_types = model_types
+        self.props = props
+        self.grouped = grouped
+        self.active = True
+
+    def cancel(self):
+        """Stop delivering changes to this subscription."""
+        self._dispatcher.unsubscribe(self)
+
+    def accepts(self, model_id: str, model_type: str, prop: str, ancestors: FrozenSet[str]) -> bool:
+        """Check every filter against a change."""
+        return (
+            (self.model_id is None or self.model_id == model_id)
+            and (self.subtree is None or self.subtree == model_id or self.subtree in ancestors)
+            and (self.model_types is None or model_type in self.model_types)
+            and (self.props is None or prop in self.props)
+        )
+
+
+class ModelChangeDispatcher:
+    """
+    Routes model changes to matching subscriptions.
+
+    Each subscription sits in one index: by model ID, else by subtree
+    root, else by model type(s), else by property name(s), else in the
+    unfiltered list. A change looks up its model ID, its ancestors (only
+    when subtree subscriptions exist), its type and its property, then
+    checks the remaining filters of the candidates found. Buckets are
+    tuples replaced on (un)subscribe, so callbacks may subscribe or
+    unsubscribe while a change is being delivered.
+
+    Args:
+        ancestors: Returns (ancestor IDs, ancestor ID set) for a model ID
+    """
+
+    def __init__(self, ancestors: AncestorLookup):
+        self._ancestors = ancestors
+        self._by_model: Dict[str, Tuple[Subscription, ...]] = {}
+        self._by_subtree: Dict[str, Tuple[Subscription, ...]] = {}
+        self._by_type: Dict[str, Tuple[Subscription, ...]] = {}
+        self._by_prop: Dict[str, Tuple[Subscription, ...]] = {}
+        self._unfiltered: Tuple[Subscription, ...] = ()
+
+    def subscribe(self, callback: Union[ChangeCallback, GroupedChangeCallback],
+                  model_id: Optional[str] = None,
+                  subtree: Optional[str] = None,
+                  model_type: Union[None, str, Iterable[str]] = None,
+                  prop: Union[None, str, Iterable[str]] = None,
+                  owner=None, grouped: bool = False) -> Subscription:
+        """
+        Deliver matching changes to callback(model_id, model_type, prop, value).
+
+        Args:
+            callback: Called once per matching change
+            model_id: Only changes of this model
+            subtree: Only changes of this model and its descendants
+            model_type: Only changes of these model types
+            prop: Only changes of these property names
+            owner: Optional QObject; the subscription ends when it is destroyed
+            grouped: Call callback(model_id, model_type, {prop: value}) once
+                per dispatch, with all matching changes of a batch
+
+        Returns:
+            Subscription: Handle for unsubscribe()
+        """
+        subscription = Subscription(self, callback, model_id, subtree,
+                                    _as_set(model_type), _as_set(prop), grouped)
+        index, keys = self._index_for(subscription)
+        if index is None:
+            self._unfiltered = self._unfiltered + (subscription,)
+        else:
+            for key in keys:
+                index[key] = index.get(key, ()) + (subscription,)
+
+        if owner is not None:
+            owner.destroyed.connect(lambda *_: self.unsubscribe(subscription))
+        return subscription
+
+    def unsubscribe(self, subscription: Optional[Subscription]) -> None:
+        """Remove a subscription; unknown or cancelled subscriptions are ignored."""
+        if subscription is None or not subscription.active:
+            return
+        subscription.active = False
+        index, keys = self._index_for(subscription)
+        if index is None:
+            self._unfiltered = tuple(s for s in self._unfiltered if s is not subscription)
+            return
+        for key in keys:
+            remaining = tuple(s for s in index.get(key, ()) if s is not subscription)
+            if remaining:
+                index[key] = remaining
+            else:
+                index.pop(key, None)
+
+    def dispatch(self, model_id: str, model_type: str, prop: str, value: Any) -> int:
+        """
+        Deliver a change to the matching subscriptions.
+
+        Returns:
+            int: Number of callbacks invoked
+        """
+        return self.dispatch_many(model_id, model_type, {prop: value})
+
+    def dispatch_many(self, model_id: str, model_type: str, changes: Dict[str, Any]) -> int:
+        """
+        Deliver a batch of changes of one model as a unit.
+
+        Candidates are looked up once for the whole batch. Grouped
+        subscriptions get one callback with the changes they accept; the
+        others get one callback per accepted change.
+
+        Returns:
+            int: Number of callbacks invoked
+        """
+        candidates: List[Tuple[Subscription, ...]] = []
+        by_model = self._by_model.get(model_id)
+        if by_model:
+            candidates.append(by_model)
+
+        ancestor_set: FrozenSet[str] = frozenset()
+        if self._by_subtree:
+            ancestor_ids, ancestor_set = self._ancestors(model_id)
+            for root in (model_id,) + ancestor_ids:
+                by_root = self._by_subtree.get(root)
+                if by_root:
+                    candidates.append(by_root)
+        elif by_model and any(s.subtree is not None for s in by_model):
+            ancestor_set = self._ancestors(model_id)[1]
+
+        by_type = self._by_type.get(model_type)
+        if by_type:
+            candidates.append(by_type)
+        if self._by_prop:
+            for prop in changes:
+                by_prop = self._by_prop.get(prop)
+                if by_prop:
+                    candidates.append(by_prop)
+        if self._unfiltered:
+            candidates.append(self._unfiltered)
+
+        invoked = 0
+        seen = set()
+        for bucket in candidates:
+            for subscription in bucket:
+                if not subscription.active or id(subscription) in seen:
+                    continue
+                seen.add(id(subscription))
+                accepted = {prop: value for prop, value in changes.items()
+                            if subscription.accepts(model_id, model_type, prop, ancestor_set)}
+                if not accepted:
+                    continue
+                if subscription.grouped:
+                    invoked += 1
+                    self._invoke(subscription, model_id, model_type, accepted)
+                    continue
+                for prop, value in accepted.items():
+                    if not subscription.active:
+                        break
+                    invoked += 1
+                    self._invoke(subscription, model_id, model_type, prop, value)
+        return invoked
+
+    def _invoke(self, subscription: Subscription, model_id: str, model_type: str, *change) -> None:
+        try:
+            subscription.callback(model_id, model_type, *change)
+        except Exception as e:
+            props = ", ".join(change[0]) if subscription.grouped else change[0]
+            logger.error(f"Error delivering {model_type} change ({props}) of {model_id}: {e}",
+                         exc_info=True)
+
+    def subscription_count(self) -> int:
+        """Number of active subscriptions."""
+        unique = {id(s) for s in self._unfiltered}
+        for index in (self._by_model, self._by_subtree, self._by_type, self._by_prop):
+            for bucket in index.values():
+                unique.update(id(s) for s in bucket)
+        return len(unique)
+
+    def _index_for(self, subscription: Subscription):
+        """The index and keys a subscription is filed under (None for unfiltered)."""
+        if subscription.model_id is not None:
+            return self._by_model, (subscription.model_id,)
+        if subscription.subtree is not None:
+            return self._by_subtree, (subscription.subtree,)
+        if subscription.model_types is not None:
+            return self._by_type, tuple(subscription.model_types)
+        if subscription.props is not None:
+            return self._by_prop, tuple(subscription.props)
+        return None, ()
@@ -236,7 +236,7 @@ class Engine(QObject):
             'ResultStatus': ResultStatus
         }
 
-        self.state.model_changed.connect(self._handle_model_changed)
+        self.state.subscribe(self._handle_model_changed, model_type="TestResult", prop="progress")
         logger.info("Engine initialized.")
 
     def run_suite(self, suite_id: str):
@@ -268,13 +268,7 @@ class Engine(QObject):
         """
         Climb up the parent chain until we find a TestScript or no parent.
         """
-        while True:
-            parent = self.state.get_parent(model_id)
-            if not parent:
-                return None
-            if isinstance(parent, TestScript):
-                return parent
-            model_id = parent.id
+        return self.state.find_ancestor(model_id, TestScript)
 
     def _update_script_progress(self, script: TestScript):
         """
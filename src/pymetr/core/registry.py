@@ -9,36 +9,20 @@ This module provides a thread-safe singleton registry that maintains:
 """
 
 from typing import Dict, Optional, Type, List, Any
-import importlib
-from enum import Enum, auto
-from dataclasses import dataclass
 from PySide6.QtCore import QObject, Signal, QThread, Slot, Qt, QMetaObject, Q_ARG
 
 from pymetr.core.logging import logger
 from pymetr.drivers.base.connections import ConnectionInterface
+from pymetr.drivers.instruments.registry import DRIVER_REGISTRY, ConnectionType, DriverInfo
 from pymetr.models.device import Device
 
-class ConnectionType(Enum):
-    """Known connection interface types"""
-    VISA = auto()
-    SOCKET = auto()
-    SERIAL = auto()
-
-@dataclass
-class DriverInfo:
-    """Driver configuration information"""
-    module: str                                      # Driver module path
-    class_name: str                                 # Driver class name
-    interfaces: List[ConnectionType]                # Supported connection types
-    socket_port: Optional[int] = None              # Default socket port if applicable
-    discovery_config: Optional[Dict[str, Any]] = None  # Discovery protocol config
-
 class InstrumentRegistry(QObject):
     """
     Thread-safe singleton registry for instrument drivers and instances.
     
     Manages:
-    - Driver registration and loading
+    - Driver registration and loading (through the shared DRIVER_REGISTRY,
+      which holds driver metadata and imports drivers on first use)
     - Device model creation
     - Instance tracking
     - Connection configuration
@@ -61,56 +45,13 @@ class InstrumentRegistry(QObject):
             return
             
         super().__init__()
-        self._drivers: Dict[str, DriverInfo] = {}         # Model -> Driver info
-        self._driver_cache: Dict[str, Type] = {}         # Model -> Driver class
         self._devices: Dict[str, Device] = {}            # ID -> Device model
         self._driver_instances: Dict[str, object] = {}   # ID -> Driver instance
-        self._register_builtin_drivers()
         self._initialized = True
 
-    def _register_builtin_drivers(self):
-        """Register built-in instrument drivers."""
-        self.register_driver(
-            "DSOX1204G",
-            DriverInfo(
-                module="pymetr.drivers.instruments.dsox1204g",
-                class_name="DSOX1204G",
-                interfaces=[ConnectionType.VISA]
-            )
-        )
-        
-        self.register_driver(
-            "HS9001B",
-            DriverInfo(
-                module="pymetr.drivers.instruments.hs9000",
-                class_name="HS9000",
-                interfaces=[ConnectionType.VISA, ConnectionType.SOCKET],
-                socket_port=9760,
-                discovery_config={
-                    "udp_port": 30303,
-                    "protocol": "MICROCHIP"
-                }
-            )
-        )
-        
     def register_driver(self, model: str, info: DriverInfo) -> None:
-        """Register a new instrument driver."""
-        if QThread.currentThread() != self.thread():
-            QMetaObject.invokeMethod(
-                self,
-                "_register_driver_internal",
-                Qt.QueuedConnection,
-                Q_ARG(str, model),
-                Q_ARG(object, info)
-            )
-        else:
-            self._register_driver_internal(model, info)
-
-    @Slot(str, object)
-    def _register_driver_internal(self, model: str, info: DriverInfo) -> None:
-        """Internal registration that always runs in main thread."""
-        self._drivers[model.upper()] = info
-        logger.debug(f"Registered driver for {model}")
+        """Register a new instrument driver for a model number or wildcard pattern."""
+        DRIVER_REGISTRY.register(model, info)
 
     def create_device(self, info: Dict[str, Any]) -> Optional[Device]:
         """
@@ -151,29 +92,16 @@ class InstrumentRegistry(QObject):
         Returns:
             Driver class or None if not found
         """
-        model = model.upper()
-        
-        # Return cached driver if available
-        if model in self._driver_cache:
-            return self._driver_cache[model]
-            
-        # Get driver info
-        info = self._drivers.get(model)
+        info = DRIVER_REGISTRY.resolve(model)
         if not info:
             logger.error(f"No driver registered for {model}")
             return None
             
         try:
-            # Import driver module
-            module = importlib.import_module(info.module)
-            
-            # Get driver class
-            driver_class = getattr(module, info.class_name)
-            
-            # Cache for future use
-            self._driver_cache[model] = driver_class
-            self.driver_loaded.emit(info.module)
-            
+            already_loaded = DRIVER_REGISTRY.is_loaded(model)
+            driver_class = DRIVER_REGISTRY.load_driver_class(model)
+            if not already_loaded:
+                self.driver_loaded.emit(info.module)
             return driver_class
             
         except Exception as e:
@@ -253,12 +181,12 @@ class InstrumentRegistry(QObject):
 
     def get_supported_interfaces(self, model: str) -> List[ConnectionType]:
         """Get supported connection types for a model."""
-        info = self._drivers.get(model.upper())
+        info = DRIVER_REGISTRY.resolve(model)
         return info.interfaces if info else []
         
     def get_discovery_config(self, model: str) -> Optional[Dict[str, Any]]:
         """Get discovery configuration for a model."""
-        info = self._drivers.get(model.upper())
+        info = DRIVER_REGISTRY.resolve(model)
         return info.discovery_config if info else None
 
     def cleanup_device(self, device_id: str) -> None:
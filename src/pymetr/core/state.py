@@ -1,10 +1,14 @@
 
 
-from typing import Dict, Optional, Type, TypeVar, List, Any
+from typing import Dict, FrozenSet, Optional, Tuple, Type, TypeVar, List, Any, Union
 import datetime
+import threading
+import time
 from PySide6.QtCore import QObject, Signal, Slot, QThread, Qt, QMetaObject, Q_ARG, QTimer
 from pymetr.models.base import BaseModel
+from pymetr.models.lite import LiteModel
 from pymetr.models import Device
+from pymetr.core.dispatch import ChangeCallback, ModelChangeDispatcher, Subscription
 from pymetr.core.engine import Engine
 from pymetr.core.logging import logger
 from pymetr.drivers import Instrument
@@ -23,42 +27,39 @@ class DiscoveryWorker(QObject):
     def __init__(self, model_filter: Optional[List[str]] = None):
         super().__init__()
         self.model_filter = model_filter
-        self._running = False
+        self._stop_event = threading.Event()
         
     def discover(self):
-        """Run discovery process."""
+        """Run discovery process, emitting each instrument as soon as it answers."""
         try:
             logger.debug("Starting discovery in worker thread")
-            self._running = True
+            instruments = {}
             
-            # Perform discovery
-            instruments = Instrument.list_instruments(self.model_filter)
-            
-            # Emit each instrument as we find it
-            for uid, info in instruments.items():
-                if not self._running:
-                    # Check if we should stop
-                    break
+            # Cached instruments arrive before any network probing
+            for unique_id, info in Instrument.iter_instruments(self.model_filter,
+                                                               stop_event=self._stop_event):
+                instruments[unique_id] = info
                 self.instrument_found.emit(info)
             
-            if self._running:
+            if not self._stop_event.is_set():
                 # Only emit finished if we weren't stopped
                 self.finished.emit(instruments)
                 
         except Exception as e:
             logger.error(f"Error in discovery worker: {e}")
             self.error.emit(str(e))
-        finally:
-            self._running = False
-            
+
     def stop(self):
-        """Stop the discovery process."""
-        self._running = False
+        """Stop the discovery process; safe to call from any thread."""
+        self._stop_event.set()
 
 class ApplicationState(QObject):
     # Signals
     model_registered = Signal(str)           # model_id
+    # Every change of every model; views should subscribe() to what they show.
+    # A batch of changes of one model is emitted once, as model_properties_changed.
     model_changed = Signal(str, str, str, object)          # model_id, model_type, prop_name, value
+    model_properties_changed = Signal(str, str, object)    # model_id, model_type, {prop_name: value}
     models_linked = Signal(str, str)         # parent_id, child_id
     active_model_changed = Signal(str)       # model_id
     active_test_changed = Signal(str)        # model_id
@@ -71,6 +72,7 @@ class ApplicationState(QObject):
     status_info = Signal(str)  # Info messages
 
     model_removed = Signal(str)   # model_id
+    updates_flushed = Signal(int, int)  # updates delivered, updates dropped (superseded) this frame
     model_viewed = Signal(str)  # Emits model_id
 
     discovery_started = Signal()  # When instrument discovery begins
@@ -83,12 +85,24 @@ class ApplicationState(QObject):
         self._models: Dict[str, BaseModel] = {}
         self._pending_models: Dict[str, BaseModel] = {}
         self._relationships: Dict[str, set[str]] = {}
+        # Reverse index (child -> parent) and ancestor chains cached per
+        # hierarchy version, so parent and subtree checks stay O(1)
+        self._parents: Dict[str, str] = {}
+        self._hierarchy_version = 0
+        self._ancestor_cache: Dict[str, Tuple[int, Tuple[str, ...], FrozenSet[str]]] = {}
+        self.dispatcher = ModelChangeDispatcher(self._ancestors)
         self._active_model_id: Optional[str] = None
         self._active_test_id: Optional[str] = None
         self._parent: Optional[QObject] = None
         
-        # Update throttling
-        self._pending_updates = []
+        # Cross-thread update coalescing: latest value per (model, property),
+        # delivered to the main thread at most once per display frame
+        self._pending_updates: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._frame_dropped = 0
+        self._update_stats = {'queued': 0, 'delivered': 0, 'dropped': 0, 'frames': 0}
+        self._last_flush = 0.0
         self._update_timer = QTimer(self)  # Timer created in main thread
         self._update_timer.setSingleShot(True)
         self._update_timer.timeout.connect(self._process_pending_updates)
@@ -106,19 +120,23 @@ class ApplicationState(QObject):
         """Optionally store a reference to a parent widget for dialogs."""
         self._parent = parent
 
-    def register_model(self, model: BaseModel) -> None:
+    def register_model(self, model: Union[BaseModel, LiteModel]) -> None:
         """Register a model - keep it simple and in the main thread."""
         if model.id not in self._models:
             # Let the model know its state manager
             model.state = self
             self._models[model.id] = model
 
-            # Connect signals
-            model.property_changed.connect(self._handle_model_change)
-            model.child_added.connect(self._handle_child_added)
+            # Connect signals. Changes are handled in the emitting thread so
+            # that worker-thread changes can be coalesced instead of queued.
+            # Lite models have no signals and call notify_model_change().
+            if isinstance(model, BaseModel):
+                model.property_changed.connect(self._handle_model_change, Qt.DirectConnection)
+                model.properties_changed.connect(self._handle_model_changes, Qt.DirectConnection)
+                model.child_added.connect(self._handle_child_added)
+                logger.debug(f"Registered model {model.id}")
 
             self.model_registered.emit(model.id)
-            logger.debug(f"Registered model {model.id}")
 
     @Slot(str, str)
     def _handle_registration_request(self, model_id: str, model_type: str) -> None:
@@ -140,11 +158,9 @@ class ApplicationState(QObject):
             model.state = self
             self._models[model.id] = model
 
-            # Connect to type-specific signals
-            model.property_changed_str.connect(self._handle_model_change)
-            model.property_changed_float.connect(self._handle_model_change)
-            model.property_changed_int.connect(self._handle_model_change)
-            model.property_changed_bool.connect(self._handle_model_change)
+            # Connect signals (see register_model)
+            model.property_changed.connect(self._handle_model_change, Qt.DirectConnection)
+            model.properties_changed.connect(self._handle_model_changes, Qt.DirectConnection)
             model.child_added.connect(self._handle_child_added)
 
             self.model_registered.emit(model.id)
@@ -176,6 +192,8 @@ class ApplicationState(QObject):
         if parent_id not in self._relationships:
             self._relationships[parent_id] = set()
         self._relationships[parent_id].add(child_id)
+        self._parents[child_id] = parent_id
+        self._hierarchy_version += 1
         self.models_linked.emit(parent_id, child_id)
         logger.debug(f"Linked model {child_id} to parent {parent_id}")
 
@@ -183,6 +201,15 @@ class ApplicationState(QObject):
         """Remove a relationship between models."""
         if parent_id in self._relationships:
             self._relationships[parent_id].discard(child_id)
+            if self._parents.get(child_id) == parent_id:
+                # A child linked to several parents falls back to a remaining one
+                remaining = next((other_id for other_id, children in self._relationships.items()
+                                  if child_id in children), None)
+                if remaining is None:
+                    del self._parents[child_id]
+                else:
+                    self._parents[child_id] = remaining
+            self._hierarchy_version += 1
             logger.debug(f"Unlinked model {child_id} from parent {parent_id}")
 
     def get_model(self, model_id: str) -> Optional[BaseModel]:
@@ -207,16 +234,110 @@ class ApplicationState(QObject):
 
     def get_parent(self, child_id: str) -> Optional[BaseModel]:
         """Get parent model of a child."""
-        for parent_id, children in self._relationships.items():
-            if child_id in children:
-                return self._models.get(parent_id)
+        parent_id = self._parents.get(child_id)
+        return self._models.get(parent_id) if parent_id is not None else None
+
+    def get_parent_id(self, child_id: str) -> Optional[str]:
+        """Get the parent ID of a child, whether or not the parent is registered."""
+        return self._parents.get(child_id)
+
+    def _ancestors(self, model_id: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """Ancestor IDs (nearest first) and their set, cached until the hierarchy changes."""
+        cached = self._ancestor_cache.get(model_id)
+        if cached is not None and cached[0] == self._hierarchy_version:
+            return cached[1], cached[2]
+
+        chain = []
+        seen = {model_id}
+        parent_id = self._parents.get(model_id)
+        while parent_id is not None and parent_id not in seen:  # stop on cycles
+            chain.append(parent_id)
+            seen.add(parent_id)
+            parent_id = self._parents.get(parent_id)
+        ancestors = tuple(chain)
+        members = frozenset(chain)
+        self._ancestor_cache[model_id] = (self._hierarchy_version, ancestors, members)
+        return ancestors, members
+
+    def get_ancestor_ids(self, model_id: str) -> Tuple[str, ...]:
+        """Get the IDs of all ancestors of a model, nearest first."""
+        return self._ancestors(model_id)[0]
+
+    def is_descendant(self, model_id: str, ancestor_id: str) -> bool:
+        """Return True if model_id lies in the subtree below ancestor_id."""
+        return ancestor_id in self._ancestors(model_id)[1]
+
+    def find_ancestor(self, model_id: str, model_type: Type[T]) -> Optional[T]:
+        """Get the nearest ancestor of a model that is an instance of model_type."""
+        for ancestor_id in self._ancestors(model_id)[0]:
+            model = self._models.get(ancestor_id)
+            if isinstance(model, model_type):
+                return model
         return None
 
+    def subscribe(self, callback: ChangeCallback, model_id: Optional[str] = None,
+                  subtree: Optional[str] = None, model_type=None, prop=None,
+                  owner: Optional[QObject] = None, grouped: bool = False) -> Subscription:
+        """
+        Receive property changes matching all of the given filters.
+
+        Args:
+            callback: Called as callback(model_id, model_type, prop, value)
+            model_id: Only changes of this model
+            subtree: Only changes of this model and its descendants
+            model_type: Model type name or names
+            prop: Property name or names
+            owner: QObject whose destruction ends the subscription
+            grouped: Call callback(model_id, model_type, {prop: value}) once
+                per batch of changes instead of once per property
+
+        Returns:
+            Subscription: Handle for unsubscribe()
+        """
+        return self.dispatcher.subscribe(callback, model_id=model_id, subtree=subtree,
+                                         model_type=model_type, prop=prop, owner=owner,
+                                         grouped=grouped)
+
+    def unsubscribe(self, subscription: Optional[Subscription]) -> None:
+        """End a subscription made with subscribe(); None is ignored."""
+        self.dispatcher.unsubscribe(subscription)
+
     @Slot(str, str, str, object)
     def _handle_model_change(self, model_id: str, model_type: str, prop: str, value: Any) -> None:
-        """Handle property changes."""
+        """Handle property changes; changes made off the main thread are coalesced."""
+        if QThread.currentThread() != self.thread():
+            self.queue_model_update(model_id, prop, value, model_type)
+            return
+        self.dispatcher.dispatch(model_id, model_type, prop, value)
         self.model_changed.emit(model_id, model_type, prop, value)
 
+    def notify_model_change(self, model_id: str, model_type: str, prop: str, value: Any) -> None:
+        """Report a property change of a model without signals (LiteModel). Thread-safe."""
+        self._handle_model_change(model_id, model_type, prop, value)
+
+    def notify_model_changes(self, model_id: str, model_type: str, changes: Dict[str, Any]) -> None:
+        """Report a batch of property changes of a model without signals. Thread-safe."""
+        self._handle_model_changes(model_id, model_type, changes)
+
+    @Slot(str, str, object)
+    def _handle_model_changes(self, model_id: str, model_type: str, changes: Dict[str, Any]) -> None:
+        """Handle a batch of property changes from one model, delivered as one unit."""
+        if QThread.currentThread() != self.thread():
+            for prop, value in changes.items():
+                self.queue_model_update(model_id, prop, value, model_type)
+            return
+        self._deliver_changes(model_id, model_type, changes)
+
+    def _deliver_changes(self, model_id: str, model_type: str, changes: Dict[str, Any]) -> None:
+        """Dispatch changes of one model and emit one signal for them."""
+        if len(changes) == 1:
+            (prop, value), = changes.items()
+            self.dispatcher.dispatch(model_id, model_type, prop, value)
+            self.model_changed.emit(model_id, model_type, prop, value)
+            return
+        self.dispatcher.dispatch_many(model_id, model_type, changes)
+        self.model_properties_changed.emit(model_id, model_type, changes)
+
     @Slot(str, str)
     def _handle_child_added(self, parent_id: str, child_id: str) -> None:
         """A model had a child added -> link them."""
@@ -265,10 +386,11 @@ class ApplicationState(QObject):
     
     def remove_model(self, model_id: str) -> None:
         if model_id in self._models:
-            # Remove as child from any parent
-            parent = self.get_parent(model_id)
-            if parent:
-                self.unlink_models(parent.id, model_id)
+            # Remove as child from every parent
+            parent_id = self._parents.get(model_id)
+            while parent_id is not None:
+                self.unlink_models(parent_id, model_id)
+                parent_id = self._parents.get(model_id)
                     
             # Remove any children it might have
             if model_id in self._relationships:
@@ -276,10 +398,16 @@ class ApplicationState(QObject):
                 for child_id in child_ids:
                     self.remove_model(child_id)
                 del self._relationships[model_id]
+            self._parents.pop(model_id, None)
+            self._ancestor_cache.pop(model_id, None)
+            self._hierarchy_version += 1
                     
             # Remove the model itself
             model = self._models[model_id]
-            model.deleteLater()
+            if isinstance(model, BaseModel):
+                model.deleteLater()
+            else:
+                model.cleanup()
             del self._models[model_id]
             logger.debug(f"Removed model {model_id}")
             
@@ -317,32 +445,72 @@ class ApplicationState(QObject):
         self.status_info.emit(message)
         logger.info(f"Info: {message}")
 
-    def queue_model_update(self, model_id: str, prop: str, value: Any):
-        """Queue a model update to be processed in the main thread."""
-        self._pending_updates.append((model_id, prop, value))
-        if not self._update_timer.isActive():
-            self._update_timer.start(self._throttle_interval)
+    def queue_model_update(self, model_id: str, prop: str, value: Any,
+                           model_type: Optional[str] = None) -> None:
+        """
+        Queue a model update for delivery in the main thread. Thread-safe.
+
+        Only the latest value per (model, property) is kept until the next
+        frame; superseded values are counted as dropped. The first update
+        after an idle period is delivered right away, later ones at most
+        once per frame interval.
+
+        Args:
+            model_id: Changed model
+            prop: Property name
+            value: New value
+            model_type: Model type name; looked up from the model if omitted
+        """
+        if model_type is None:
+            model = self._models.get(model_id)
+            model_type = model.model_type if model else ""
+        with self._pending_lock:
+            key = (model_id, prop)
+            if key in self._pending_updates:
+                self._frame_dropped += 1
+            self._pending_updates[key] = (model_type, value)
+            self._update_stats['queued'] += 1
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        # One queued call per frame, however many updates arrive
+        QMetaObject.invokeMethod(self, "_schedule_update_flush", Qt.QueuedConnection)
+
+    @Slot()
+    def _schedule_update_flush(self) -> None:
+        """Start the frame timer so flushes are at least one frame apart."""
+        elapsed_ms = (time.monotonic() - self._last_flush) * 1000.0
+        self._update_timer.start(max(0, int(self._throttle_interval - elapsed_ms)))
 
     def _process_pending_updates(self):
-        """Process all pending model updates."""
-        if not self._pending_updates:
+        """Deliver the coalesced updates of one frame, grouped by model."""
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+            dropped, self._frame_dropped = self._frame_dropped, 0
+            self._flush_scheduled = False
+        self._last_flush = time.monotonic()
+        if not pending:
             return
-            
-        # Group updates by model
-        updates_by_model = {}
-        for model_id, model_type, prop, value in self._pending_updates:
-            if model_id not in updates_by_model:
-                updates_by_model[model_id] = []
-            updates_by_model[model_id].append((model_type, prop, value))
-            
-        # Process updates
-        for model_id, updates in updates_by_model.items():
-            model = self._models.get(model_id)
-            if model:
-                for model_type, prop, value in updates:
-                    self.model_changed.emit(model_id, model_type, prop, value)
-                    
-        self._pending_updates.clear()
+
+        updates_by_model: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for (model_id, prop), (model_type, value) in pending.items():
+            updates_by_model.setdefault(model_id, (model_type, {}))[1][prop] = value
+
+        for model_id, (model_type, changes) in updates_by_model.items():
+            if model_id in self._models:
+                self._deliver_changes(model_id, model_type, changes)
+
+        self._update_stats['delivered'] += len(pending)
+        self._update_stats['dropped'] += dropped
+        self._update_stats['frames'] += 1
+        if dropped:
+            logger.debug(f"Coalesced {len(pending) + dropped} updates into {len(pending)} this frame")
+        self.updates_flushed.emit(len(pending), dropped)
+
+    def get_update_stats(self) -> Dict[str, int]:
+        """Totals of the update coalescer: queued, delivered, dropped and frames."""
+        with self._pending_lock:
+            return dict(self._update_stats)
 
     def update_active_view(self, model_id: str):
         """Called when a dock is done activating."""
@@ -351,6 +519,9 @@ class ApplicationState(QObject):
     def discover_instruments(self, model_filter: Optional[List[str]] = None):
         """Start instrument discovery process in background thread."""
         logger.debug("Starting instrument discovery")
+        if self._discovery_thread:
+            # Restarting (e.g. refresh) cancels the discovery in progress
+            self.stop_discovery()
         self.discovery_started.emit()
         
         # Create worker and thread
@@ -374,6 +545,8 @@ class ApplicationState(QObject):
     def stop_discovery(self):
         """Stop any ongoing discovery process."""
         if self._discovery_worker:
+            # Discovery checks the stop event between results, so this
+            # returns promptly without waiting for probes in flight
             self._discovery_worker.stop()
         if self._discovery_thread:
             self._discovery_thread.quit()
@@ -3,10 +3,12 @@ Base classes for instrument drivers
 """
 
 from .connections import ConnectionInterface, PyVisaConnection, RawSocketConnection
+from .async_connections import AsyncRawSocketConnection, EventLoopThread
+from .discovery import DiscoveryCache, probe_instruments, stream_probes
 from .instrument import Instrument, SCPIInstrument, Subsystem, ConnectionWorker
 from .properties import (
     Property, ValueProperty, SwitchProperty, SelectProperty, 
-    DataProperty, DataBlockProperty, PropertyResponse
+    DataProperty, DataBlockProperty, PropertyResponse, CachePolicy, PropertyCache
 )
 from .sources import Sources
 from .visitor import InstrumentVisitor
@@ -14,11 +16,14 @@ from .visitor import InstrumentVisitor
 __all__ = [
     # Connections
     "ConnectionInterface", "PyVisaConnection", "RawSocketConnection",
+    "AsyncRawSocketConnection", "EventLoopThread",
+    # Discovery
+    "DiscoveryCache", "probe_instruments", "stream_probes",
     # Instruments
     "Instrument", "SCPIInstrument", "Subsystem", "ConnectionWorker",
     # Properties
     "Property", "ValueProperty", "SwitchProperty", "SelectProperty", 
-    "DataProperty", "DataBlockProperty", "PropertyResponse",
+    "DataProperty", "DataBlockProperty", "PropertyResponse", "CachePolicy", "PropertyCache",
     # Sources
     "Sources",
     # Visitor
@@ -0,0 +1,451 @@
+# async_connections.py
+
+"""
+asyncio-based transports that share a single I/O event loop.
+
+Every AsyncRawSocketConnection runs its socket on one process-wide event loop
+thread, so a rack of socket instruments needs one I/O thread instead of one
+worker thread per instrument. Each connection exposes coroutine methods
+(aquery, awrite, ...) for concurrent use and the usual blocking
+ConnectionInterface methods for scripts.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional
+
+import numpy as np
+
+from pymetr.drivers.base.connections import ConnectionInterface, RawSocketConnection
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """
+    Process-wide asyncio event loop running on a daemon thread.
+
+    Use EventLoopThread.instance() to get the shared loop. Coroutines are
+    scheduled with submit(), which returns a concurrent.futures.Future that
+    can be waited on from any other thread.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, name: str = "pymetr-io"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def instance(cls) -> 'EventLoopThread':
+        """Get (and lazily start) the shared event loop thread."""
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.is_running():
+                cls._instance = cls()
+                logger.debug("EventLoopThread: Started shared I/O loop")
+            return cls._instance
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def is_running(self) -> bool:
+        """Check whether the loop thread is alive."""
+        return self._thread.is_alive()
+
+    def in_loop_thread(self) -> bool:
+        """Check whether the caller is running on the loop thread."""
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the shared loop.
+
+        Returns:
+            Future: Resolved with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the shared loop and block until it finishes.
+
+        Raises:
+            RuntimeError: If called from the loop thread itself
+            TimeoutError: If the coroutine does not finish in time
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("Blocking call on the I/O loop thread; use the awaitable API instead")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError("Timed out waiting for I/O loop")
+
+    def stop(self):
+        """Stop the loop and wait for the thread to exit."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(1.0)
+
+
+class AsyncRawSocketConnection(ConnectionInterface):
+    """
+    Raw TCP socket connection built on asyncio streams.
+
+    All sockets are multiplexed on the shared EventLoopThread. Coroutine
+    methods (aopen, awrite, aread, aquery, aread_block, aquery_block, aclose)
+    may run concurrently across connections; commands on one connection are
+    serialized so every query reads its own response. The blocking methods
+    inherited from ConnectionInterface run the coroutines on the shared loop.
+    """
+
+    # Marks the connection as thread-safe so Instrument skips its worker thread
+    is_async = True
+
+    # Seconds without data that end clear_buffer()
+    drain_quiet = 0.1
+
+    def __init__(self, host: str, port: int = 5025, timeout: float = 2.5,
+                 encoding: str = 'ascii', read_termination: str = '\n',
+                 write_termination: str = '\n', chunk_size: int = 65536,
+                 buffer_limit: int = 64 * 1024 * 1024):
+        """
+        Initialize socket connection parameters.
+
+        Args:
+            host: IP address, hostname, or resource string
+            port: TCP port number (default: 5025 for SCPI)
+            timeout: I/O timeout in seconds
+            encoding: Character encoding for string conversion
+            read_termination: Character(s) marking end of received messages
+            write_termination: Character(s) to append to sent messages
+            chunk_size: Maximum bytes requested per stream read
+            buffer_limit: Largest terminated message the stream will buffer
+        """
+        super().__init__(read_termination=read_termination,
+                         write_termination=write_termination,
+                         encoding=encoding)
+
+        if isinstance(host, str) and ("::" in host or ":" in host):
+            self.host, parsed_port = RawSocketConnection.parse_resource_string(host)
+            self.port = port if port != 5025 else parsed_port
+        else:
+            self.host = host
+            self.port = port
+
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.buffer_limit = buffer_limit
+        self._io = EventLoopThread.instance()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+        # Bytes peeked after a binary block and handed back to the next read
+        self._pushback = b''
+
+    # ------------------------------------------------
+    # Coroutine API (runs on the shared loop)
+    # ------------------------------------------------
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule one of this connection's coroutines on the shared loop."""
+        return self._io.submit(coro)
+
+    async def aopen(self):
+        """Open the stream connection to the instrument."""
+        logger.debug(f"Opening async socket connection to {self.host}:{self.port}")
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, limit=self.buffer_limit),
+                self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to connect to {self.host}:{self.port} - {e}")
+            raise ConnectionError(f"Failed to connect to {self.host}:{self.port}: {e}")
+        self._lock = asyncio.Lock()
+        self._pushback = b''
+        logger.info(f"Async socket connection established to {self.host}:{self.port}")
+
+    async def aclose(self):
+        """Close the stream connection."""
+        if self._writer is not None:
+            logger.debug(f"Closing async socket connection to {self.host}:{self.port}")
+            writer, self._writer, self._reader = self._writer, None, None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            logger.info(f"Async socket connection closed for {self.host}:{self.port}")
+
+    async def awrite(self, command: str):
+        """Send a command string to the instrument."""
+        self._check_open()
+        async with self._lock:
+            await self._send(command)
+
+    async def aread(self) -> str:
+        """Read one terminated response from the instrument."""
+        self._check_open()
+        async with self._lock:
+            return await self._receive()
+
+    async def aquery(self, command: str) -> str:
+        """Send a query and read its response as one uninterrupted exchange."""
+        self._check_open()
+        async with self._lock:
+            await self._send(command)
+            return await self._receive()
+
+    async def aquery_many(self, commands, pipeline_depth: int = 1) -> list:
+        """
+        Send several queries, writing up to pipeline_depth ahead of the reads.
+
+        Returns:
+            list: One response per command, in order
+        """
+        self._check_open()
+        commands = list(commands)
+        depth = max(1, pipeline_depth)
+        responses = []
+        async with self._lock:
+            for start in range(0, len(commands), depth):
+                chunk = commands[start:start + depth]
+                for command in chunk:
+                    await self._send(command)
+                for _ in chunk:
+                    responses.append(await self._receive())
+        return responses
+
+    async def aread_block(self, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """Read an IEEE 488.2 definite-length binary block."""
+        self._check_open()
+        async with self._lock:
+            return await self._receive_block(dtype, expect_terminator)
+
+    async def aquery_block(self, command: str, dtype=np.uint8,
+                           expect_terminator: bool = True) -> np.ndarray:
+        """Send a query and read its binary block response."""
+        self._check_open()
+        async with self._lock:
+            await self._send(command)
+            return await self._receive_block(dtype, expect_terminator)
+
+    def _check_open(self):
+        if self._writer is None:
+            raise ConnectionError("Async socket not open. Call open() first.")
+
+    async def _send(self, command: str):
+        if not command.endswith(self.write_termination):
+            command += self.write_termination
+        logger.debug(f"Async socket write: {command.strip()}")
+        self._writer.write(command.encode(self.encoding))
+        await self._writer.drain()
+
+    async def _receive(self) -> str:
+        data, self._pushback = self._pushback, b''
+        try:
+            data += await asyncio.wait_for(
+                self._reader.readuntil(self.read_termination), self.timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out reading from {self.host}:{self.port}")
+        except asyncio.IncompleteReadError:
+            raise ConnectionError(f"Connection closed by {self.host}:{self.port}")
+        return data[:-len(self.read_termination)].decode(self.encoding)
+
+    async def _read_exactly(self, count: int) -> bytes:
+        data = self._pushback[:count]
+        self._pushback = self._pushback[count:]
+        if len(data) == count:
+            return data
+        try:
+            return data + await asyncio.wait_for(self._reader.readexactly(count - len(data)), self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out reading from {self.host}:{self.port}")
+        except asyncio.IncompleteReadError:
+            raise ConnectionError(f"Connection closed by {self.host}:{self.port}")
+
+    async def _receive_block(self, dtype, expect_terminator: bool) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        marker = await self._read_exactly(2)
+        if marker == b'#A':
+            num_digits = None
+        elif marker[:1] != b'#' or not marker[1:2].isdigit():
+            raise ValueError(f"Invalid binary block header: {marker!r}")
+        else:
+            num_digits = int(marker[1:2])
+        if num_digits == 0:
+            payload = await self._receive_indefinite_block(dtype.itemsize)
+            usable = len(payload) - (len(payload) % dtype.itemsize)
+            return payload[:usable].view(dtype)
+        if num_digits is None:
+            num_bytes = int.from_bytes(await self._read_exactly(2), 'big')  # HP '#A' block
+        else:
+            num_bytes = int(await self._read_exactly(num_digits))
+
+        # Streams have no read-into API; copy each chunk once into the final buffer
+        buffer = np.empty(num_bytes, dtype=np.uint8)
+        view = memoryview(buffer)
+        filled = 0
+        while filled < num_bytes:
+            try:
+                chunk = await asyncio.wait_for(
+                    self._reader.read(min(self.chunk_size, num_bytes - filled)), self.timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Timed out reading binary block ({filled}/{num_bytes} bytes)")
+            if not chunk:
+                raise ConnectionError(f"Connection closed by {self.host}:{self.port}")
+            view[filled:filled + len(chunk)] = chunk
+            filled += len(chunk)
+
+        if expect_terminator and self.read_termination:
+            await self._discard_terminator()
+
+        usable = num_bytes - (num_bytes % dtype.itemsize)
+        return buffer[:usable].view(dtype)
+
+    async def _discard_terminator(self):
+        """
+        Consume the terminator that follows a binary block.
+
+        The first byte is peeked: a ';' means the block is one unit of a
+        compound reply and is handed back to the next read, as is anything
+        else that does not start the terminator. Like the blocking transports,
+        a block whose terminator never arrives is still returned.
+        """
+        terminator = self.read_termination
+        try:
+            peeked = await self._read_exactly(1)
+        except TimeoutError:
+            logger.warning("Timed out waiting for the terminator after a binary block")
+            return
+        if peeked == terminator[:1]:
+            rest = await self._read_exactly(len(terminator) - 1) if len(terminator) > 1 else b''
+            if rest == terminator[1:]:
+                return
+            peeked += rest
+        if peeked != b';':
+            logger.warning(f"Unexpected bytes after binary block: {peeked!r}")
+        self._pushback = peeked + self._pushback
+
+    async def _receive_indefinite_block(self, itemsize: int) -> np.ndarray:
+        """
+        Read a #0 block payload, which runs to the end of the message.
+
+        Streams carry no END signal, so the block ends at a terminator that
+        leaves a whole number of elements and is not followed by more data
+        within block_end_grace seconds.
+        """
+        terminator = self.read_termination
+        data = bytearray()
+        while True:
+            if not (data.endswith(terminator) and (len(data) - len(terminator)) % itemsize == 0):
+                try:
+                    data += await asyncio.wait_for(self._reader.readuntil(terminator), self.timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"Timed out reading indefinite-length block ({len(data)} bytes)")
+                except asyncio.IncompleteReadError:
+                    raise ConnectionError(f"Connection closed by {self.host}:{self.port}")
+                continue
+            try:
+                more = await asyncio.wait_for(self._reader.read(self.chunk_size), self.block_end_grace)
+            except asyncio.TimeoutError:
+                break
+            if not more:
+                break
+            data += more
+        return np.frombuffer(data, dtype=np.uint8)[:len(data) - len(terminator)]
+
+    # ------------------------------------------------
+    # Blocking ConnectionInterface API
+    # ------------------------------------------------
+    def _run(self, coro: Coroutine, bounded: bool = True) -> Any:
+        # The coroutines enforce self.timeout per read; the outer wait only
+        # guards against a wedged loop, so it gets some headroom. Block reads
+        # are unbounded because their duration scales with the payload.
+        return self._io.run(coro, self.timeout * 4 if bounded else None)
+
+    def open(self):
+        """Open the socket connection to the instrument."""
+        self._run(self.aopen())
+
+    def close(self):
+        """Close the socket connection."""
+        if self._writer is not None:
+            self._run(self.aclose())
+
+    def write(self, command: str):
+        """Send a command string to the instrument."""
+        self._run(self.awrite(command))
+
+    def read(self) -> str:
+        """Read one terminated response from the instrument."""
+        return self._run(self.aread())
+
+    def query(self, command: str) -> str:
+        """Send a query and read its response."""
+        return self._run(self.aquery(command))
+
+    def read_block(self, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """Read an IEEE 488.2 definite-length binary block."""
+        return self._run(self.aread_block(dtype, expect_terminator), bounded=False)
+
+    def query_block(self, command: str, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """Send a query and read its binary block response."""
+        return self._run(self.aquery_block(command, dtype, expect_terminator), bounded=False)
+
+    def has_data(self) -> bool:
+        """Check if received data is waiting in the stream buffer."""
+        self._check_open()
+        # StreamReader exposes no public buffered-size query
+        return bool(self._pushback or getattr(self._reader, '_buffer', b''))
+
+    def clear_buffer(self):
+        """
+        Discard unread data, e.g. the rest of a reply whose request was cancelled.
+
+        Reads until the stream has been quiet for drain_quiet seconds.
+        """
+        self._check_open()
+
+        async def _drain():
+            async with self._lock:
+                self._pushback = b''
+                discarded = 0
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(self._reader.read(self.chunk_size),
+                                                       self.drain_quiet)
+                    except asyncio.TimeoutError:
+                        break
+                    if not chunk:
+                        break
+                    discarded += len(chunk)
+                if discarded:
+                    logger.debug(f"Discarded {discarded} unread bytes from {self.host}:{self.port}")
+
+        self._run(_drain(), bounded=False)
+
+    def read_available(self) -> bytes:
+        """Read whatever data is currently available, waiting up to the timeout."""
+        self._check_open()
+
+        async def _read_some():
+            async with self._lock:
+                if self._pushback:
+                    data, self._pushback = self._pushback, b''
+                    return data
+                try:
+                    return await asyncio.wait_for(self._reader.read(self.chunk_size), self.timeout)
+                except asyncio.TimeoutError:
+                    return b''
+
+        return self._run(_read_some())
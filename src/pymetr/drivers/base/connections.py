@@ -10,21 +10,142 @@ import logging
 import socket
 import select
 import time
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Union
 import ipaddress
+import numpy as np
 from zeroconf import ServiceBrowser, Zeroconf
-import concurrent.futures
 import pyvisa
 from PySide6.QtWidgets import QApplication
 
 logger = logging.getLogger(__name__)
 
+class ReceiveBuffer:
+    """
+    Reusable receive buffer with a read offset.
+
+    Incoming bytes are written into free space at the tail (directly via
+    recv_into() where the transport supports it) and messages are consumed by
+    advancing a read offset instead of reallocating the buffer. Unread data is
+    compacted to the front only when the tail runs out of room, so messages
+    always stay contiguous. Terminator scans resume from where the previous
+    scan stopped, so partial messages are never rescanned.
+
+    Args:
+        capacity: Initial size of the backing storage in bytes
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self._data = bytearray(capacity)
+        self._view = memoryview(self._data)
+        self._start = 0     # Read offset
+        self._end = 0       # Write offset
+        self._scanned = 0   # Scan resume position for find_terminator()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __bool__(self) -> bool:
+        return self._end > self._start
+
+    def clear(self):
+        """Discard all buffered data."""
+        self._start = self._end = self._scanned = 0
+
+    def reserve(self, size: int) -> memoryview:
+        """
+        Get a writable view of at least size free bytes at the tail.
+
+        Call commit() with the number of bytes actually written.
+        """
+        if len(self._data) - self._end < size:
+            self._make_room(size)
+        return self._view[self._end:self._end + size]
+
+    def commit(self, count: int):
+        """Mark count bytes written into the last reserve() view as valid."""
+        self._end += count
+
+    def extend(self, data: bytes):
+        """Append bytes received from a transport without read-into support."""
+        count = len(data)
+        self.reserve(count)[:] = data
+        self._end += count
+
+    def _make_room(self, size: int):
+        """Compact unread data to the front, growing the storage if needed."""
+        pending = self._end - self._start
+        if pending + size > len(self._data):
+            capacity = len(self._data)
+            while pending + size > capacity:
+                capacity *= 2
+            storage = bytearray(capacity)
+            storage[:pending] = self._data[self._start:self._end]
+            self._data = storage
+            self._view = memoryview(self._data)
+        elif pending:
+            self._view[:pending] = self._view[self._start:self._end]
+        self._scanned -= self._start
+        self._start, self._end = 0, pending
+
+    def find_terminator(self, terminator: bytes) -> int:
+        """
+        Find a terminator in the unread data.
+
+        Returns:
+            int: Offset of the terminator relative to the read offset, or -1
+        """
+        begin = max(self._start, self._scanned - len(terminator) + 1)
+        pos = self._data.find(terminator, begin, self._end)
+        if pos < 0:
+            self._scanned = self._end
+            return -1
+        return pos - self._start
+
+    def consume(self, count: int) -> bytes:
+        """Remove and return count bytes from the read offset."""
+        count = min(count, len(self))
+        data = bytes(self._view[self._start:self._start + count])
+        self.skip(count)
+        return data
+
+    def skip(self, count: int):
+        """Advance the read offset by count bytes without copying them."""
+        self._start += min(count, len(self))
+        if self._start == self._end:
+            # Fully drained: rewind so the next receive starts at the front
+            self._start = self._end = self._scanned = 0
+        self._scanned = max(self._scanned, self._start)
+
+    def read_into(self, view: memoryview) -> int:
+        """Move up to len(view) buffered bytes into view, returning the count."""
+        count = min(len(view), len(self))
+        view[:count] = self._view[self._start:self._start + count]
+        self.skip(count)
+        return count
+
+    def startswith(self, prefix: bytes) -> bool:
+        """Check whether the unread data begins with prefix."""
+        return self._view[self._start:self._start + len(prefix)] == prefix
+
+    def endswith(self, suffix: bytes) -> bool:
+        """Check whether the unread data ends with suffix."""
+        if len(suffix) > len(self):
+            return False
+        return self._view[self._end - len(suffix):self._end] == suffix
+
+
 class ConnectionInterface(ABC):
     """
     An abstract base class representing the low-level connection or transport layer.
     Every specific transport (PyVISA, raw socket, serial, etc.) must implement these methods.
     """
 
+    # Free space kept at the end of an indefinite-length block buffer per receive
+    _INDEFINITE_BLOCK_CHUNK = 65536
+
+    # Seconds to wait for more data after a terminator that may end a #0 block
+    block_end_grace = 0.01
+
     def __init__(self, read_termination: str = '\n', write_termination: str = '\n', encoding: str = 'ascii'):
         """
         Initialize common connection parameters.
@@ -37,7 +158,7 @@ class ConnectionInterface(ABC):
         self.read_termination = read_termination.encode(encoding) if isinstance(read_termination, str) else read_termination
         self.write_termination = write_termination
         self.encoding = encoding
-        self._read_buffer = bytearray()
+        self._read_buffer = ReceiveBuffer()
         self._has_gui = QApplication.instance() is not None
 
     def _process_events(self):
@@ -85,6 +206,32 @@ class ConnectionInterface(ABC):
         """
         pass
 
+    def wait_for_data(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for data to become available.
+
+        The default implementation polls has_data(). Transports with a
+        selectable handle should override this to block in the OS instead.
+
+        Returns:
+            bool: True if data is available to read without blocking
+        """
+        deadline = time.monotonic() + timeout
+        while not self.has_data():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def fileno(self) -> Optional[int]:
+        """
+        Selectable OS handle for readiness notification.
+
+        Returns:
+            Optional[int]: The file descriptor, or None if the transport has none
+        """
+        return None
+
     def read(self) -> str:
         """
         Default implementation of blocking read that uses has_data() and read_available().
@@ -94,27 +241,26 @@ class ConnectionInterface(ABC):
             str: The complete response string
         """
         while True:
-            # Check for complete message in buffer
-            if self.read_termination in self._read_buffer:
-                # Find the terminator
-                term_pos = self._read_buffer.find(self.read_termination)
-                # Extract the message
-                message = self._read_buffer[:term_pos].decode(self.encoding)
-                # Remove processed data from buffer
-                self._read_buffer = self._read_buffer[term_pos + len(self.read_termination):]
+            # Check for complete message in buffer (scan resumes where it left off)
+            term_pos = self._read_buffer.find_terminator(self.read_termination)
+            if term_pos >= 0:
+                message = self._read_buffer.consume(term_pos).decode(self.encoding)
+                self._read_buffer.skip(len(self.read_termination))
                 return message
 
-            # Read any available data
-            if self.has_data():
-                chunk = self.read_available()
-                if chunk:
-                    self._read_buffer.extend(chunk)
-                continue
+            # No complete message - block until more data arrives
+            self._fill_read_buffer()
 
-            # No data available and no complete message - block until data arrives
-            chunk = self.read_available()  # This should block
-            if chunk:
-                self._read_buffer.extend(chunk)
+    def _fill_read_buffer(self):
+        """
+        Append newly received data to the read buffer.
+
+        Blocks for up to the transport timeout. Transports that can receive
+        directly into the buffer should override this.
+        """
+        chunk = self.read_available()
+        if chunk:
+            self._read_buffer.extend(chunk)
 
     def query(self, command: str) -> str:
         """
@@ -130,6 +276,207 @@ class ConnectionInterface(ABC):
         self.write(command)
         return self.read()
 
+    def read_block(self, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """
+        Read an IEEE 488.2 binary block (#<n><len><data> or #0<data>).
+
+        For definite-length blocks the header is parsed first so the payload
+        can be received straight into a single preallocated buffer of exactly
+        the right size, and embedded terminator bytes are never interpreted.
+        Indefinite-length (#0) blocks run to the end of the message; see
+        _read_indefinite_block().
+
+        Args:
+            dtype: NumPy dtype of the block elements (byte order included)
+            expect_terminator: Consume the trailing read terminator if present
+
+        Returns:
+            np.ndarray: A view of the received payload with the requested dtype
+
+        Raises:
+            ValueError: If the block header is malformed
+            TimeoutError: If the payload does not arrive in time
+        """
+        dtype = np.dtype(dtype)
+        num_bytes = self._read_block_header()
+
+        if num_bytes is None:
+            buffer = self._read_indefinite_block(dtype.itemsize)
+            num_bytes = len(buffer)
+        else:
+            buffer = np.empty(num_bytes, dtype=np.uint8)
+            self._read_into(memoryview(buffer))
+
+            if expect_terminator and self.read_termination:
+                self._discard_terminator()
+
+        usable = num_bytes - (num_bytes % dtype.itemsize)
+        if usable != num_bytes:
+            logger.warning(f"Block length {num_bytes} is not a multiple of {dtype.itemsize} bytes")
+        return buffer[:usable].view(dtype)
+
+    def _read_block_header(self) -> Optional[int]:
+        """
+        Parse the '#<n><len>' header of a binary block.
+
+        HP-IB analyzers also send '#A' blocks, whose length is a two-byte
+        big-endian binary count.
+
+        Returns:
+            Optional[int]: The number of payload bytes that follow the header,
+            or None for an indefinite-length (#0) block
+        """
+        marker = self._read_exact(2)
+        if marker == b'#A':
+            return int.from_bytes(self._read_exact(2), 'big')
+        if marker[:1] != b'#' or not marker[1:2].isdigit():
+            raise ValueError(f"Invalid binary block header: {bytes(marker)!r}")
+
+        num_digits = int(marker[1:2])
+        if num_digits == 0:
+            return None
+
+        length_field = self._read_exact(num_digits)
+        try:
+            return int(length_field)
+        except ValueError:
+            raise ValueError(f"Invalid binary block length field: {bytes(length_field)!r}")
+
+    def _read_indefinite_block(self, itemsize: int = 1) -> np.ndarray:
+        """
+        Receive an indefinite-length (#0) block payload.
+
+        The block runs to the end of the message. Byte streams carry no END
+        signal, so the end is the first read terminator that leaves a whole
+        number of elements and is not followed by more data within
+        block_end_grace seconds. The
+        payload is received straight into a NumPy buffer that doubles when
+        full; only bytes already in the read buffer, and the filled part on
+        each growth, are copied.
+
+        Args:
+            itemsize: Element size in bytes of the block data
+
+        Returns:
+            np.ndarray: A view of the payload bytes (uint8), without the terminator
+        """
+        terminator = np.frombuffer(self.read_termination, dtype=np.uint8)
+        term_len = len(terminator)
+        buffer = np.empty(max(2 * len(self._read_buffer), self._INDEFINITE_BLOCK_CHUNK), dtype=np.uint8)
+        filled = 0
+        while True:
+            if self._read_buffer:
+                buffer = self._grow(buffer, filled, len(self._read_buffer))
+                filled += self._read_buffer.read_into(memoryview(buffer)[filled:])
+            if (term_len and filled >= term_len
+                    and np.array_equal(buffer[filled - term_len:filled], terminator)
+                    and (filled - term_len) % itemsize == 0
+                    and not self.wait_for_data(self.block_end_grace)):
+                break
+            buffer = self._grow(buffer, filled, self._INDEFINITE_BLOCK_CHUNK)
+            received = self._recv_into(memoryview(buffer)[filled:])
+            if not received and not self._read_buffer:
+                if not term_len and filled:
+                    break  # Without a terminator the block ends when data stops
+                raise TimeoutError(f"Timed out reading indefinite-length block ({filled} bytes)")
+            filled += received
+
+        return buffer[:filled - term_len]
+
+    @staticmethod
+    def _grow(buffer: np.ndarray, filled: int, free: int) -> np.ndarray:
+        """Return buffer, or a copy of its filled part in one at least twice as large."""
+        if len(buffer) - filled >= free:
+            return buffer
+        grown = np.empty(max(2 * len(buffer), filled + free), dtype=np.uint8)
+        grown[:filled] = buffer[:filled]
+        return grown
+
+    def _read_exact(self, count: int) -> bytes:
+        """Read exactly count bytes (used for small header fields)."""
+        buffer = bytearray(count)
+        self._read_into(memoryview(buffer))
+        return bytes(buffer)
+
+    def _read_into(self, view: memoryview):
+        """
+        Fill a writable buffer completely, draining buffered data first.
+
+        Args:
+            view: Destination buffer; every byte is written before returning
+        """
+        view = view.cast('B')
+        total = len(view)
+
+        # Anything already sitting in the text read buffer comes first
+        filled = self._read_buffer.read_into(view)
+
+        while filled < total:
+            received = self._recv_into(view[filled:])
+            if not received:
+                raise TimeoutError(f"Timed out reading binary block ({filled}/{total} bytes)")
+            filled += received
+
+    def _recv_into(self, view: memoryview) -> int:
+        """
+        Receive up to len(view) bytes directly into view.
+
+        The default implementation goes through read_available() and keeps any
+        surplus in the read buffer. Transports that can write into a caller's
+        buffer should override this to avoid the intermediate copy.
+
+        Returns:
+            int: Number of bytes written (0 on timeout)
+        """
+        chunk = self.read_available()
+        if not chunk:
+            return 0
+        count = min(len(view), len(chunk))
+        view[:count] = chunk[:count]
+        if count < len(chunk):
+            self._read_buffer.extend(chunk[count:])
+        return count
+
+    def _discard_terminator(self):
+        """
+        Consume the terminator that follows a binary block.
+
+        The terminator may arrive in a later segment than the payload, so this
+        waits for it like read() does, for up to one transport timeout. A ';'
+        instead means the block is one unit of a compound reply: it is left in
+        the buffer for the next read. Anything else is logged and left alone.
+        """
+        terminator = self.read_termination
+        while len(self._read_buffer) < len(terminator):
+            if self._read_buffer.startswith(b';'):
+                return
+            pending = len(self._read_buffer)
+            self._fill_read_buffer()
+            if len(self._read_buffer) == pending:
+                logger.warning("Timed out waiting for the terminator after a binary block")
+                return
+
+        if self._read_buffer.startswith(terminator):
+            self._read_buffer.skip(len(terminator))
+        elif not self._read_buffer.startswith(b';'):
+            logger.warning("Unexpected bytes after binary block; left in the read buffer")
+
+    def query_block(self, command: str, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """
+        Write a command and read its binary block response.
+
+        Args:
+            command: The command string to send
+            dtype: NumPy dtype of the block elements
+            expect_terminator: Consume the read terminator after the block.
+                Pass False when more of a compound reply follows the block.
+
+        Returns:
+            np.ndarray: The block payload
+        """
+        self.write(command)
+        return self.read_block(dtype, expect_terminator)
+
     def clear_buffer(self):
         """Clear any partially read data from the buffer."""
         self._read_buffer.clear()
@@ -143,7 +490,7 @@ class PyVisaConnection(ConnectionInterface):
 
     def __init__(self, resource_string: str, timeout: int = 5000,
                  read_termination: str = '\n', write_termination: str = '\n',
-                 encoding: str = 'ascii'):
+                 encoding: str = 'ascii', resource_manager: Optional[pyvisa.ResourceManager] = None):
         """
         Initialize PyVISA connection parameters.
 
@@ -153,13 +500,16 @@ class PyVisaConnection(ConnectionInterface):
             read_termination: Character(s) marking end of received messages
             write_termination: Character(s) to append to sent messages
             encoding: Character encoding for string conversion
+            resource_manager: Shared ResourceManager to open the session with;
+                creating one per connection is slow, so pass one when opening
+                many resources
         """
         super().__init__(read_termination=read_termination,
                         write_termination=write_termination,
                         encoding=encoding)
         self.resource_string = resource_string
         self.timeout = timeout
-        self.rm = pyvisa.ResourceManager()
+        self.rm = resource_manager or pyvisa.ResourceManager()
         self.inst = None
         self._last_status = 0
 
@@ -337,6 +687,62 @@ class PyVisaConnection(ConnectionInterface):
             logger.exception(f"Error reading available data: {e}")
             raise
 
+    def _recv_into(self, view: memoryview) -> int:
+        """
+        Read raw bytes for a binary block, ignoring the termination character.
+
+        PyVISA has no read-into API, so each chunk is copied once from the
+        VISA buffer into the destination.
+
+        Returns:
+            int: Number of bytes written (0 on timeout)
+        """
+        if not self.inst:
+            raise ConnectionError("PyVISA instrument not open. Call open() first.")
+
+        count = min(len(view), self.inst.chunk_size)
+        try:
+            chunk = self.inst.read_bytes(count, break_on_termchar=False)
+        except pyvisa.VisaIOError as e:
+            if e.error_code == pyvisa.constants.StatusCode.error_timeout:
+                return 0
+            raise
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
+    def _read_indefinite_block(self, itemsize: int = 1) -> np.ndarray:
+        """
+        Receive an indefinite-length (#0) block payload up to END.
+
+        VISA reports the end of a message, so the block is read with the
+        termination character disabled until the read completes on END.
+        has_data() is never called here: without SRQ it probes by reading,
+        which would consume a payload byte.
+
+        Args:
+            itemsize: Element size in bytes of the block data
+
+        Returns:
+            np.ndarray: A view of the payload bytes (uint8), without the terminator
+        """
+        if not self.inst:
+            raise ConnectionError("PyVISA instrument not open. Call open() first.")
+
+        data = bytearray(self._read_buffer.consume(len(self._read_buffer)))
+        try:
+            with self.inst.read_termination_context(None):
+                data += self.inst.read_raw()
+        except pyvisa.VisaIOError as e:
+            if e.error_code == pyvisa.constants.StatusCode.error_timeout:
+                raise TimeoutError(f"Timed out reading indefinite-length block ({len(data)} bytes)")
+            raise
+
+        # The instrument may send the terminator along with END
+        terminator = self.read_termination
+        if terminator and data.endswith(terminator) and (len(data) - len(terminator)) % itemsize == 0:
+            del data[-len(terminator):]
+        return np.frombuffer(data, dtype=np.uint8)
+
 
 class RawSocketConnection(ConnectionInterface):
     """
@@ -366,7 +772,7 @@ class RawSocketConnection(ConnectionInterface):
     
     def __init__(self, host: str, port: int = 5025, timeout: float = 2.5,
                  encoding: str = 'ascii', read_termination: str = '\n',
-                 write_termination: str = '\n'):
+                 write_termination: str = '\n', chunk_size: int = 65536):
         """
         Initialize socket connection parameters.
         
@@ -377,6 +783,7 @@ class RawSocketConnection(ConnectionInterface):
             encoding: Character encoding for string conversion
             read_termination: Character(s) marking end of received messages
             write_termination: Character(s) to append to sent messages
+            chunk_size: Maximum bytes requested per recv() call
         """
         super().__init__(read_termination=read_termination,
                         write_termination=write_termination,
@@ -391,6 +798,8 @@ class RawSocketConnection(ConnectionInterface):
             self.port = port
             
         self.timeout = timeout
+        self.chunk_size = chunk_size
+        self._read_buffer = ReceiveBuffer(max(chunk_size * 2, 65536))
         self.sock = None
 
     def open(self):
@@ -400,6 +809,9 @@ class RawSocketConnection(ConnectionInterface):
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(self.timeout)
             self.sock.connect((self.host, self.port))
+            # Commands are tiny; without NODELAY a write followed by a query
+            # stalls on Nagle + delayed ACK (~40 ms per exchange)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             # Set non-blocking mode after connection
             self.sock.setblocking(False)
             logger.info(f"Raw socket connection established to {self.host}:{self.port}")
@@ -417,6 +829,10 @@ class RawSocketConnection(ConnectionInterface):
                 self.sock = None
                 logger.info(f"Raw socket connection closed for {self.host}:{self.port}")
 
+    def fileno(self) -> Optional[int]:
+        """Socket file descriptor for readiness notification."""
+        return self.sock.fileno() if self.sock else None
+
     def write(self, command: str):
         """
         Send a command string to the instrument.
@@ -444,6 +860,15 @@ class RawSocketConnection(ConnectionInterface):
         """
         Check if data is available to read without blocking.
 
+        Returns:
+            bool: True if data is available
+        """
+        return self.wait_for_data(0)
+
+    def wait_for_data(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for the socket to become readable.
+
         Returns:
             bool: True if data is available
         """
@@ -451,7 +876,7 @@ class RawSocketConnection(ConnectionInterface):
             raise ConnectionError("Raw socket not open. Call open() first.")
 
         try:
-            readable, _, _ = select.select([self.sock], [], [], 0)
+            readable, _, _ = select.select([self.sock], [], [], timeout)
             return bool(readable)
         except select.error as e:
             logger.exception(f"Select error checking for data: {e}")
@@ -471,17 +896,67 @@ class RawSocketConnection(ConnectionInterface):
         try:
             # If data is immediately available, read it
             if self.has_data():
-                return self.sock.recv(4096)
+                return self.sock.recv(self.chunk_size)
 
             # No data available - wait for timeout period
             readable, _, _ = select.select([self.sock], [], [], self.timeout)
             if readable:
-                return self.sock.recv(4096)
+                return self.sock.recv(self.chunk_size)
             return b''
         except socket.error as e:
             logger.exception(f"Failed to read data from {self.host}:{self.port} - {e}")
             raise
 
+    def _fill_read_buffer(self):
+        """
+        Receive straight into the free tail of the read buffer.
+
+        One recv_into() of up to chunk_size bytes per wakeup, with no
+        intermediate bytes objects.
+        """
+        if not self.sock:
+            raise ConnectionError("Raw socket not open. Call open() first.")
+
+        try:
+            try:
+                # The socket is non-blocking, so try first and only select when empty
+                count = self.sock.recv_into(self._read_buffer.reserve(self.chunk_size))
+            except BlockingIOError:
+                readable, _, _ = select.select([self.sock], [], [], self.timeout)
+                if not readable:
+                    return
+                count = self.sock.recv_into(self._read_buffer.reserve(self.chunk_size))
+        except socket.error as e:
+            logger.exception(f"Failed to read data from {self.host}:{self.port} - {e}")
+            raise
+
+        if count == 0:
+            raise ConnectionError(f"Connection closed by {self.host}:{self.port}")
+        self._read_buffer.commit(count)
+
+    def _recv_into(self, view: memoryview) -> int:
+        """
+        Receive directly into the destination buffer with socket.recv_into().
+
+        Returns:
+            int: Number of bytes written (0 on timeout)
+        """
+        if not self.sock:
+            raise ConnectionError("Raw socket not open. Call open() first.")
+
+        try:
+            readable, _, _ = select.select([self.sock], [], [], self.timeout)
+            if not readable:
+                return 0
+            count = self.sock.recv_into(view)
+        except socket.error as e:
+            logger.exception(f"Failed to read data from {self.host}:{self.port} - {e}")
+            raise
+
+        if count == 0:
+            raise ConnectionError(f"Connection closed by {self.host}:{self.port}")
+        return count
+
     @staticmethod
     def list_instruments(methods: List[str] = ['udp', 'mdns', 'scan'], timeout: float = 5.0) -> Dict[str, str]:
         """
@@ -500,19 +975,19 @@ class RawSocketConnection(ConnectionInterface):
         local_ip_ranges = RawSocketConnection.get_all_local_ip_ranges()
         logger.debug(f"Detected local IP ranges: {local_ip_ranges}")
 
-        for ip_range in local_ip_ranges:
-            if 'udp' in methods:
-                devices = RawSocketConnection._discover_udp(timeout, ip_range)
-                discovered_devices.update(devices)
+        if 'udp' in methods:
+            devices = RawSocketConnection._discover_udp(timeout, local_ip_ranges)
+            discovered_devices.update(devices)
 
-            # Implement these in a full scan.
-            # if 'mdns' in methods and not discovered_devices:
-            #     devices = RawSocketConnection._discover_mdns(timeout)
-            #     discovered_devices.update(devices)
+        # Implement these in a full scan.
+        # if 'mdns' in methods and not discovered_devices:
+        #     devices = RawSocketConnection._discover_mdns(timeout)
+        #     discovered_devices.update(devices)
 
-            # if 'scan' in methods and not discovered_devices:
-            #     devices = RawSocketConnection._discover_scan(ip_range=ip_range, timeout=timeout)
-            #     discovered_devices.update(devices)
+        # for ip_range in local_ip_ranges:
+        #     if 'scan' in methods and not discovered_devices:
+        #         devices = RawSocketConnection._discover_scan(ip_range=ip_range, timeout=timeout)
+        #         discovered_devices.update(devices)
 
         logger.debug(f"RawSocket discovered devices before filtering: {discovered_devices}")
 
@@ -521,20 +996,24 @@ class RawSocketConnection(ConnectionInterface):
         return discovered_devices
 
     @staticmethod
-    def _discover_udp(timeout: float, ip_range: str) -> Dict[str, str]:
-        """Discover instruments via UDP broadcast within a specific IP range."""
+    def _discover_udp(timeout: float, ip_range: Union[str, List[str]]) -> Dict[str, str]:
+        """
+        Discover instruments via UDP broadcast within one or more IP ranges.
+
+        All broadcasts share a single listening socket and timeout window, so
+        several ranges cost no more time than one.
+        """
         discovered_devices = {}
         discovered_ips = set()  
         port = 30303  # PIC32 discovery port
 
-        # Check for GUI context once
-        has_gui = QApplication.instance() is not None
-
-        # Derive broadcast address from IP range
-        network = ipaddress.ip_network(ip_range, strict=False)
-        broadcast_address = str(network.broadcast_address)
+        # Derive broadcast addresses from the IP ranges
+        ip_ranges = [ip_range] if isinstance(ip_range, str) else ip_range
+        broadcast_addresses = [
+            str(ipaddress.ip_network(r, strict=False).broadcast_address) for r in ip_ranges
+        ]
 
-        logger.debug(f"Starting UDP discovery on {broadcast_address}:{port}")
+        logger.debug(f"Starting UDP discovery on {broadcast_addresses} port {port}")
 
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
@@ -544,8 +1023,9 @@ class RawSocketConnection(ConnectionInterface):
 
                 # Send discovery message
                 discovery_message = b"Discovery: Who is out there!"
-                sock.sendto(discovery_message, (broadcast_address, port))
-                logger.debug(f"Sent UDP discovery message to {broadcast_address}:{port}")
+                for broadcast_address in broadcast_addresses:
+                    sock.sendto(discovery_message, (broadcast_address, port))
+                    logger.debug(f"Sent UDP discovery message to {broadcast_address}:{port}")
 
                 # Collect responses
                 start_time = time.time()
@@ -556,44 +1036,15 @@ class RawSocketConnection(ConnectionInterface):
                         discovered_ips.add(addr[0])
                     except socket.timeout:
                         pass
-                    
-                    if has_gui:
-                        QApplication.processEvents()
 
         except Exception as e:
             logger.exception(f"Failed to perform UDP discovery: {e}")
 
-        # Now try to identify devices on standard ports using parallel scanning
-        instrument_ports = [9760]
-        discovered_resources = {}
+        # Now try to identify devices on standard ports with non-blocking connects
+        from pymetr.drivers.base.discovery import SubnetScanner
 
-        def scan_port(ip, port):
-            if has_gui:
-                QApplication.processEvents()
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.settimeout(0.5)  # Reduced timeout for faster scanning
-                    sock.connect((ip, port))
-                    resource = f"TCPIP::{ip}::{port}::SOCKET"
-                    logger.info(f"Found device at {ip}:{port}")
-                    return resource, resource  # Don't query IDN
-            except (socket.timeout, ConnectionRefusedError):
-                return None
-            except Exception as e:
-                logger.debug(f"Error checking {ip}:{port} - {e}")
-                return None
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=100) as executor:
-            futures = [
-                executor.submit(scan_port, ip, port) 
-                for ip in discovered_ips 
-                for port in instrument_ports
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                if result:
-                    unique_id, resource = result
-                    discovered_resources[unique_id] = resource
+        scanner = SubnetScanner(ports=[9760], max_timeout=0.5)
+        discovered_resources = scanner.scan_hosts(sorted(discovered_ips))
 
         logger.debug(f"RawSocket discovered devices before filtering: {discovered_resources}")
 
@@ -736,61 +1187,34 @@ class RawSocketConnection(ConnectionInterface):
 
     @staticmethod
     def _discover_scan(ip_range: Optional[str] = None, ports: list = [5025, 9760, 1234], 
-                      timeout: float = 3.0) -> Dict[str, str]:
+                      timeout: float = 3.0,
+                      on_found: Optional[Callable[[str], None]] = None) -> Dict[str, str]:
         """
         Discover instruments by scanning a range of IP addresses and specific ports.
 
         Args:
             ip_range (str, optional): IP range in CIDR notation. If None, detect automatically.
             ports (list): List of port numbers to scan.
-            timeout (float): Timeout for each connection attempt in seconds.
+            timeout (float): Upper bound for each connection attempt in seconds.
+            on_found (Callable, optional): Called with each resource string as it is
+                found (on the I/O loop thread).
 
         Returns:
             dict[str, str]: A dictionary mapping unique IDs to resource strings.
         """
+        from pymetr.drivers.base.discovery import SubnetScanner
+
         if ip_range is None:
             ip_ranges = RawSocketConnection.get_all_local_ip_ranges()
         else:
             ip_ranges = [ip_range]
 
-        discovered_devices = {}
         logger.debug(f"Starting network scan on IP range(s): {ip_ranges}, Ports: {ports}")
 
-        for current_ip_range in ip_ranges:
-            try:
-                network = ipaddress.ip_network(current_ip_range, strict=False)
-            except ValueError as e:
-                logger.error(f"Invalid IP range '{current_ip_range}': {e}")
-                continue
-
-            def scan_ip(ip, port):
-                if QApplication.instance() is not None:
-                    QApplication.processEvents()
-                    
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.settimeout(timeout)
-                    try:
-                        sock.connect((str(ip), port))
-                        resource = f"TCPIP::{ip}::{port}::SOCKET"
-                        logger.info(f"Found device at {ip}:{port}")
-                        return resource, resource  # Don't query IDN
-                    except (socket.timeout, ConnectionRefusedError):
-                        pass
-                    except Exception as e:
-                        logger.debug(f"Error scanning {ip}:{port} - {e}")
-                return None
-
-            # Utilize ThreadPoolExecutor for efficient scanning
-            with concurrent.futures.ThreadPoolExecutor(max_workers=100) as executor:
-                futures = [executor.submit(scan_ip, ip, port) 
-                          for ip in network.hosts() 
-                          for port in ports]
-                
-                for future in concurrent.futures.as_completed(futures):
-                    result = future.result()
-                    if result:
-                        unique_id, resource = result
-                        discovered_devices[unique_id] = resource
+        # Non-blocking connects on the shared I/O loop; `timeout` caps the
+        # adaptive per-connect timeout
+        scanner = SubnetScanner(ports=ports, max_timeout=timeout)
+        discovered_devices = scanner.scan_ranges(ip_ranges, on_found)
 
         logger.debug(f"Network scan completed. Devices found: {discovered_devices}")
 
@@ -0,0 +1,496 @@
+# discovery.py
+
+"""
+Instrument discovery helpers: a persistent IDN cache and parallel probing.
+
+DiscoveryCache remembers the *IDN? answer of every instrument seen, keyed by
+resource string, so the discovery dialog can list known instruments at once
+while the network is re-probed in the background. probe_instruments()
+queries many socket and VISA resources concurrently with a shared VISA
+ResourceManager, stream_probes() probes resources from several sources as
+they are found and yields each answer as soon as it arrives, and
+SubnetScanner finds open instrument ports across whole
+subnets with non-blocking connects on the shared asyncio I/O loop.
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from pymetr.drivers.base.async_connections import EventLoopThread
+from pymetr.drivers.base.connections import PyVisaConnection, RawSocketConnection
+
+logger = logging.getLogger(__name__)
+
+IdnTuple = Tuple[str, str, str, str]  # manufacturer, model, serial, firmware
+
+DEFAULT_CACHE_PATH = Path.home() / ".pymetr" / "discovery_cache.json"
+DEFAULT_CACHE_TTL = 24 * 3600.0
+
+
+def parse_idn(idn: str) -> IdnTuple:
+    """Split an *IDN? response into (manufacturer, model, serial, firmware)."""
+    parts = [part.strip() for part in idn.strip().split(",")]
+    parts = (parts + [""] * 4)[:4]
+    return tuple(parts)
+
+
+def instrument_info(resource: str, idn: IdnTuple) -> Dict[str, str]:
+    """Build the discovery info dictionary used by the UI and Device models."""
+    manufacturer, model, serial, firmware = idn
+    return {
+        'manufacturer': manufacturer,
+        'model': model,
+        'serial': serial,
+        'firmware': firmware,
+        'resource': resource
+    }
+
+
+@dataclass
+class CachedInstrument:
+    """
+    A cached discovery result.
+
+    Attributes:
+        idn: The parsed *IDN? tuple
+        last_seen: Unix time the instrument last answered
+    """
+    idn: IdnTuple
+    last_seen: float
+
+
+class DiscoveryCache:
+    """
+    Thread-safe, disk-backed cache of discovered instruments.
+
+    Entries older than the TTL are treated as gone and dropped on load and
+    save. Call save() after updating to persist the cache.
+
+    Args:
+        path: JSON file holding the cache
+        ttl: Seconds an entry stays valid after the instrument was last seen
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = Path(path) if path is not None else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self._entries: Dict[str, CachedInstrument] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the cache from disk, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            entries = {
+                resource: CachedInstrument(tuple(entry['idn']), float(entry['last_seen']))
+                for resource, entry in raw.items()
+            }
+        except FileNotFoundError:
+            entries = {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable discovery cache {self.path}: {e}")
+            entries = {}
+
+        with self._lock:
+            self._entries = entries
+            self._prune()
+
+    def save(self):
+        """Write the cache to disk atomically."""
+        with self._lock:
+            self._prune()
+            raw = {resource: asdict(entry) for resource, entry in self._entries.items()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(raw, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save discovery cache {self.path}: {e}")
+
+    def fresh(self) -> Dict[str, CachedInstrument]:
+        """Get the entries that have not expired, keyed by resource string."""
+        with self._lock:
+            self._prune()
+            return dict(self._entries)
+
+    def get(self, resource: str) -> Optional[CachedInstrument]:
+        """Get an unexpired entry for a resource, if any."""
+        with self._lock:
+            entry = self._entries.get(resource)
+            if entry is not None and self._expired(entry):
+                del self._entries[resource]
+                return None
+            return entry
+
+    def update(self, resource: str, idn: IdnTuple, seen_at: Optional[float] = None):
+        """Record that a resource answered with the given IDN."""
+        with self._lock:
+            self._entries[resource] = CachedInstrument(tuple(idn), seen_at or time.time())
+
+    def discard(self, resource: str):
+        """Forget a resource."""
+        with self._lock:
+            self._entries.pop(resource, None)
+
+    def clear(self):
+        """Forget every resource."""
+        with self._lock:
+            self._entries.clear()
+
+    def _expired(self, entry: CachedInstrument) -> bool:
+        return time.time() - entry.last_seen > self.ttl
+
+    def _prune(self):
+        expired = [r for r, e in self._entries.items() if self._expired(e)]
+        for resource in expired:
+            del self._entries[resource]
+
+
+def _is_socket_resource(resource: str) -> bool:
+    return resource.upper().endswith("::SOCKET")
+
+
+def _visa_resource_manager():
+    try:
+        import pyvisa
+        return pyvisa.ResourceManager()
+    except Exception as e:
+        logger.warning(f"Could not create VISA resource manager: {e}")
+        return None
+
+
+def probe_idn(resource: str, timeout: float = 1.0, resource_manager=None) -> Optional[IdnTuple]:
+    """
+    Query *IDN? from a single socket or VISA resource.
+
+    Args:
+        resource: Resource string (TCPIP::host::port::SOCKET or a VISA resource)
+        timeout: I/O timeout in seconds
+        resource_manager: Shared pyvisa ResourceManager for VISA resources
+
+    Returns:
+        The parsed IDN tuple, or None if the resource did not answer
+    """
+    try:
+        if _is_socket_resource(resource):
+            host, port = RawSocketConnection.parse_resource_string(resource)
+            conn = RawSocketConnection(host=host, port=port, timeout=timeout)
+        else:
+            conn = PyVisaConnection(resource, timeout=int(timeout * 1000),
+                                    resource_manager=resource_manager)
+        conn.open()
+        try:
+            idn = conn.query("*IDN?").strip()
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.debug(f"Could not query device at {resource}: {e}")
+        return None
+    return parse_idn(idn) if idn else None
+
+
+def probe_instruments(resources: Iterable[str], timeout: float = 1.0,
+                      max_workers: int = 16) -> Iterator[Tuple[str, Optional[IdnTuple]]]:
+    """
+    Query *IDN? from many resources concurrently.
+
+    Results are yielded as they complete, so slow or silent resources do not
+    hold up the others. VISA resources share one ResourceManager.
+
+    Args:
+        resources: Resource strings to probe
+        timeout: Per-resource I/O timeout in seconds
+        max_workers: Maximum probes in flight at once
+
+    Yields:
+        (resource, idn) pairs; idn is None for resources that did not answer
+    """
+    resources = list(dict.fromkeys(resources))
+    if not resources:
+        return
+
+    resource_manager = None
+    if any(not _is_socket_resource(r) for r in resources):
+        resource_manager = _visa_resource_manager()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(resources))),
+                            thread_name_prefix="pymetr-probe") as executor:
+        futures = {
+            executor.submit(probe_idn, resource, timeout, resource_manager): resource
+            for resource in resources
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def stream_probes(sources: Dict[str, Callable[[], Iterable[str]]], timeout: float = 1.0,
+                  max_workers: int = 16,
+                  stop_event: Optional[threading.Event] = None) -> Iterator[Tuple[str, IdnTuple]]:
+    """
+    Probe resources from several discovery sources as they turn up.
+
+    Every source runs in its own thread; each resource it produces (sources
+    may be generators) is probed with *IDN? straight away, and answers are
+    yielded in completion order. The first instrument is therefore reported
+    as soon as it answers rather than after the slowest source finishes.
+
+    Setting stop_event, or closing the generator, cancels discovery: queued
+    probes are dropped and the generator returns without waiting for
+    sources or probes still in flight.
+
+    Args:
+        sources: Mapping of source name to a callable returning resource strings
+        timeout: Per-resource I/O timeout in seconds
+        max_workers: Maximum probes in flight at once
+        stop_event: Event that cancels discovery when set
+
+    Yields:
+        (resource, idn) pairs for resources that answered
+    """
+    stop_event = stop_event or threading.Event()
+    halted = threading.Event()
+    results: "queue.Queue[Tuple[Optional[str], Optional[IdnTuple]]]" = queue.Queue()
+    lock = threading.Lock()
+    seen = set()
+    pending = len(sources)  # running sources plus probes not yet reported
+    visa = {}
+
+    def cancelled() -> bool:
+        return halted.is_set() or stop_event.is_set()
+
+    def probe(resource):
+        resource_manager = None
+        if not _is_socket_resource(resource):
+            with lock:
+                if 'rm' not in visa:
+                    visa['rm'] = _visa_resource_manager()
+                resource_manager = visa['rm']
+        return probe_idn(resource, timeout, resource_manager)
+
+    def report(resource, future):
+        idn = None
+        if not future.cancelled() and future.exception() is None:
+            idn = future.result()
+        results.put((resource, idn))
+
+    def submit(resource):
+        nonlocal pending
+        with lock:
+            if resource in seen or cancelled():
+                return
+            seen.add(resource)
+            pending += 1
+        try:
+            future = probes.submit(probe, resource)
+        except RuntimeError:
+            return  # discovery already shut down
+        future.add_done_callback(lambda f: report(resource, f))
+
+    def feed(name, source):
+        try:
+            for resource in source():
+                if cancelled():
+                    break
+                submit(resource)
+        except Exception as e:
+            logger.warning(f"{name} discovery error: {e}")
+        finally:
+            results.put((None, None))
+
+    probes = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="pymetr-probe")
+    feeders = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="pymetr-discover")
+    try:
+        for name, source in sources.items():
+            feeders.submit(feed, name, source)
+
+        while True:
+            with lock:
+                if pending == 0:
+                    return
+            try:
+                resource, idn = results.get(timeout=0.1)
+            except queue.Empty:
+                if stop_event.is_set():
+                    return
+                continue
+            with lock:
+                pending -= 1
+            if stop_event.is_set():
+                return
+            if resource is not None and idn is not None:
+                yield resource, idn
+    finally:
+        halted.set()
+        probes.shutdown(wait=False, cancel_futures=True)
+        feeders.shutdown(wait=False, cancel_futures=True)
+
+
+class SubnetScanner:
+    """
+    Non-blocking TCP connect scanner for finding socket instruments.
+
+    Runs on the shared asyncio I/O loop with up to `concurrency` half-open
+    connects in flight, instead of one thread per (host, port). The connect
+    timeout adapts to the network: it starts at initial_timeout and, once
+    hosts have answered (with an accept or a refusal), shrinks to a multiple
+    of the slowest answer seen, clamped to [min_timeout, max_timeout].
+
+    Args:
+        ports: TCP ports to try on every host
+        concurrency: Maximum simultaneous connect attempts
+        initial_timeout: Connect timeout until round-trip samples exist
+        min_timeout: Lower bound for the adaptive timeout
+        max_timeout: Upper bound for the adaptive timeout
+    """
+
+    RTT_MULTIPLIER = 8
+
+    def __init__(self, ports: Iterable[int] = (5025, 9760, 1234), concurrency: int = 1024,
+                 initial_timeout: float = 0.5, min_timeout: float = 0.25,
+                 max_timeout: float = 3.0):
+        self.ports = list(ports)
+        self.concurrency = self._limit_concurrency(concurrency)
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._slowest_answer: Optional[float] = None
+        self._stopped = False
+
+    @staticmethod
+    def _limit_concurrency(concurrency: int) -> int:
+        # Every attempt holds a socket; stay clear of the descriptor limit
+        try:
+            import resource
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft != resource.RLIM_INFINITY:
+                concurrency = min(concurrency, max(16, soft - 128))
+        except (ImportError, ValueError, OSError):
+            concurrency = min(concurrency, 500)
+        return max(1, concurrency)
+
+    @property
+    def timeout(self) -> float:
+        """Current connect timeout in seconds."""
+        if self._slowest_answer is None:
+            return self.initial_timeout
+        adaptive = self._slowest_answer * self.RTT_MULTIPLIER
+        return min(self.max_timeout, max(self.min_timeout, adaptive))
+
+    def stop(self):
+        """Stop handing out new connect attempts; in-flight ones finish."""
+        self._stopped = True
+
+    async def _connect(self, host: str, port: int) -> bool:
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        # Reset instead of lingering in TIME_WAIT after the probe
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        start = loop.time()
+        answered = False
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), self.timeout)
+            answered = True
+            return True
+        except ConnectionRefusedError:
+            answered = True
+            return False
+        except (OSError, asyncio.TimeoutError):
+            return False
+        finally:
+            sock.close()
+            if answered:
+                elapsed = loop.time() - start
+                if self._slowest_answer is None or elapsed > self._slowest_answer:
+                    self._slowest_answer = elapsed
+
+    async def scan(self, hosts: Iterable[str],
+                   on_found: Optional[Callable[[str], None]] = None) -> Dict[str, str]:
+        """
+        Try every port on every host.
+
+        Args:
+            hosts: Host addresses to scan
+            on_found: Called on the I/O loop with each resource string as
+                soon as its port accepts a connection
+
+        Returns:
+            Dict mapping resource strings to themselves, like the other
+            discovery methods
+        """
+        self._stopped = False
+        targets = iter([(str(host), port) for host in hosts for port in self.ports])
+        found: Dict[str, str] = {}
+
+        async def worker():
+            for host, port in targets:
+                if self._stopped:
+                    return
+                if await self._connect(host, port):
+                    resource = f"TCPIP::{host}::{port}::SOCKET"
+                    logger.info(f"Found device at {host}:{port}")
+                    found[resource] = resource
+                    if on_found is not None:
+                        try:
+                            on_found(resource)
+                        except Exception as e:
+                            logger.error(f"Error in scan callback for {resource}: {e}")
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return found
+
+    def scan_ranges(self, ip_ranges: Iterable[str],
+                    on_found: Optional[Callable[[str], None]] = None) -> Dict[str, str]:
+        """
+        Scan every host of the given CIDR ranges, blocking until done.
+
+        Runs on the shared EventLoopThread, so it must not be called from
+        the loop thread itself.
+
+        Args:
+            ip_ranges: Ranges in CIDR notation, e.g. ["192.168.4.0/22"]
+            on_found: Called on the I/O loop with each resource string found
+
+        Returns:
+            Dict mapping resource strings to themselves
+        """
+        hosts = []
+        for ip_range in ip_ranges:
+            try:
+                hosts.extend(str(ip) for ip in ipaddress.ip_network(ip_range, strict=False).hosts())
+            except ValueError as e:
+                logger.error(f"Invalid IP range '{ip_range}': {e}")
+        return self.scan_hosts(hosts, on_found)
+
+    def scan_hosts(self, hosts: Iterable[str],
+                   on_found: Optional[Callable[[str], None]] = None) -> Dict[str, str]:
+        """
+        Blocking variant of scan() that runs on the shared EventLoopThread.
+
+        Args:
+            hosts: Host addresses to scan
+            on_found: Called on the I/O loop with each resource string found
+
+        Returns:
+            Dict mapping resource strings to themselves
+        """
+        hosts = list(hosts)
+        logger.debug(f"Scanning {len(hosts)} hosts on ports {self.ports} "
+                     f"with {self.concurrency} concurrent connects")
+        return EventLoopThread.instance().run(self.scan(hosts, on_found))
@@ -13,14 +13,21 @@ This module provides the foundation for instrument communication with support fo
 
 import time
 import uuid
-import threading
+import asyncio
+import itertools
 import queue
+import selectors
+import socket
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Any, Dict, List, Union, Tuple
+from typing import Optional, Any, Callable, Dict, Iterator, List, Union, Tuple
 
 # Third-party imports
 import numpy as np
-from PySide6.QtCore import QObject, Signal, QThread, Slot, QEventLoop, QTimer
+from PySide6.QtCore import QObject, Signal, QThread, Slot, QEventLoop, QTimer, QMetaObject, Qt
 from PySide6.QtWidgets import QApplication
 
 # Local imports
@@ -30,6 +37,51 @@ from pymetr.drivers.base.connections import (
     PyVisaConnection,
     RawSocketConnection
 )
+from pymetr.drivers.base.discovery import DiscoveryCache, instrument_info, stream_probes
+from pymetr.drivers.base.properties import Property, PropertyCache, PropertyResponse
+
+_request_ids = itertools.count(1)
+
+
+@dataclass
+class Request:
+    """
+    A single queued instrument operation.
+
+    Each request carries a unique ID and a future that the worker thread
+    resolves directly with the response, so callers never have to match
+    responses by command text.
+
+    Attributes:
+        kind: Operation type ('write', 'read', 'query', 'read_block' or 'query_block')
+        command: The SCPI command string ("" for reads)
+        dtype: NumPy dtype for block operations
+        expect_terminator: Whether a block response ends with the read terminator
+        future: Resolved with the response (str, ndarray or None for writes)
+        request_id: Unique, monotonically increasing request number
+    """
+    kind: str
+    command: str = ""
+    dtype: Any = None
+    expect_terminator: bool = True
+    future: Future = field(default_factory=Future)
+    request_id: int = field(default_factory=lambda: next(_request_ids))
+
+    @property
+    def expects_response(self) -> bool:
+        """Whether a response must be read back for this request."""
+        return self.kind != "write"
+
+
+@dataclass
+class _BatchState:
+    """Per-thread state of Instrument.batch()."""
+    depth: int = 0
+    writes: Dict[Any, List[Any]] = field(default_factory=dict)  # key -> queued commands
+    read_backs: Dict[Any, Tuple[Any, Property]] = field(default_factory=dict)
+    key: Any = None  # (owner, property) of the setter currently writing
+    raw_writes: int = 0
+
 
 class ConnectionWorker(QObject):
     """
@@ -37,6 +89,17 @@ class ConnectionWorker(QObject):
     
     This class manages the command queue, executes commands in sequence,
     and ensures proper command-response pairing to prevent race conditions.
+
+    Every queued Request is resolved through its own future. With a
+    pipeline depth above 1, up to that many consecutive queued requests are
+    written back-to-back before their responses are read in order, which
+    hides round-trip latency on LAN links.
+
+    The worker sleeps in a selector until a command is queued (signalled
+    through a self-pipe) or, when unsolicited data monitoring is enabled,
+    until the connection's socket becomes readable. Transports without a
+    selectable handle (e.g. PyVISA) are polled for unsolicited data at most
+    once per poll interval, and only when monitoring is enabled.
     
     Signals:
         command_finished(str, str): Emitted when a command completes (command, response)
@@ -44,19 +107,54 @@ class ConnectionWorker(QObject):
     """
     command_finished = Signal(str, str)    # Command, Response string
     error_occurred = Signal(str)           # Error message
+
+    _WAKEUP = "wakeup"
+    _CONNECTION = "connection"
     
-    def __init__(self, connection: ConnectionInterface):
+    def __init__(self, connection: ConnectionInterface,
+                 unsolicited_poll_interval: Optional[float] = None,
+                 pipeline_depth: int = 1):
         """
         Initialize the worker with a connection interface.
         
         Args:
             connection: The ConnectionInterface instance to use for communication
+            unsolicited_poll_interval: Seconds between unsolicited data checks,
+                or None to disable unsolicited data monitoring
+            pipeline_depth: Maximum requests written before their responses
+                are read (1 disables pipelining)
         """
         super().__init__()
         self.connection = connection
+        self.pipeline_depth = max(1, pipeline_depth)
         self.command_queue = queue.Queue()
         self.running = True
         self._last_command = None
+
+        # Self-pipe used to wake the selector when commands are queued
+        self._selector = selectors.DefaultSelector()
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._selector.register(self._wake_recv, selectors.EVENT_READ, self._WAKEUP)
+
+        self._unsolicited_poll_interval = None
+        self._watched_fileno = None
+        self._next_poll = 0.0
+        self.set_unsolicited_poll_interval(unsolicited_poll_interval)
+
+    def set_unsolicited_poll_interval(self, interval: Optional[float]):
+        """
+        Enable or disable unsolicited data monitoring.
+
+        Args:
+            interval: Minimum seconds between checks, or None to disable.
+                Selectable transports are watched for readiness instead of
+                being polled.
+        """
+        self._unsolicited_poll_interval = interval
+        self._next_poll = time.monotonic()
+        self._wakeup()
         
     @Slot()
     def process_commands(self):
@@ -64,67 +162,150 @@ class ConnectionWorker(QObject):
         Main worker loop that processes commands from the queue.
         
         This method runs in a separate thread and handles commands
-        sequentially, ensuring proper command-response pairing.
+        sequentially, ensuring proper command-response pairing. It blocks
+        in the selector while idle instead of polling.
         """
         logger.debug("ConnectionWorker: Starting command processing loop")
-        while self.running:
-            try:
-                # Check for incoming commands
+        try:
+            while self.running:
                 try:
-                    cmd_type, command = self.command_queue.get(block=False)
-                    logger.debug(f"ConnectionWorker: Processing {cmd_type} command: {command}")
-                    self._handle_command(cmd_type, command)
-                except queue.Empty:
-                    # No commands to process, check for any incoming data
-                    self._check_for_data()
-                    time.sleep(0.001)  # Short sleep to prevent CPU hogging
-                    
-            except Exception as e:
-                error_msg = f"Worker error: {str(e)}"
-                logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
+                    self._update_watched_connection()
+                    for key, _ in self._selector.select(self._select_timeout()):
+                        if key.data == self._WAKEUP:
+                            self._drain_wakeups()
+                        elif key.data == self._CONNECTION:
+                            self._check_for_data()
+
+                    # Process everything queued before going back to sleep
+                    while self.running:
+                        batch = self._next_batch()
+                        if not batch:
+                            break
+                        self._execute(batch)
+
+                    self._poll_if_due()
+
+                except Exception as e:
+                    error_msg = f"Worker error: {str(e)}"
+                    logger.error(error_msg)
+                    self.error_occurred.emit(error_msg)
+        finally:
+            self._cancel_pending()
+            self._selector.close()
+            self._wake_recv.close()
+            self._wake_send.close()
+
+    def _update_watched_connection(self):
+        """Register the connection's socket with the selector while monitoring is enabled."""
+        fileno = None
+        if self._unsolicited_poll_interval is not None:
+            fileno = self.connection.fileno()
+
+        if fileno == self._watched_fileno:
+            return
+        if self._watched_fileno is not None:
+            self._selector.unregister(self._watched_fileno)
+        if fileno is not None:
+            self._selector.register(fileno, selectors.EVENT_READ, self._CONNECTION)
+        self._watched_fileno = fileno
+
+    def _select_timeout(self) -> Optional[float]:
+        """Time until the next unsolicited data poll, or None to sleep until woken."""
+        if self._unsolicited_poll_interval is None or self._watched_fileno is not None:
+            return None
+        return max(0.0, self._next_poll - time.monotonic())
+
+    def _poll_if_due(self):
+        """Rate-limited unsolicited data check for transports without a socket."""
+        if self._unsolicited_poll_interval is None or self._watched_fileno is not None:
+            return
+        now = time.monotonic()
+        if now >= self._next_poll:
+            self._next_poll = now + self._unsolicited_poll_interval
+            self._check_for_data()
+
+    def _wakeup(self):
+        """Wake the selector so newly queued work is handled immediately."""
+        try:
+            self._wake_send.send(b'\0')
+        except (BlockingIOError, OSError):
+            # Pipe already full (a wakeup is pending) or closed during shutdown
+            pass
+
+    def _drain_wakeups(self):
+        """Empty the self-pipe."""
+        try:
+            while self._wake_recv.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
     
-    def _handle_command(self, cmd_type: str, command: str):
+    def _next_batch(self) -> List[Request]:
+        """Take up to pipeline_depth requests that are already queued."""
+        batch = []
+        while len(batch) < self.pipeline_depth:
+            try:
+                batch.append(self.command_queue.get(block=False))
+            except queue.Empty:
+                break
+        return batch
+
+    def _execute(self, batch: List[Request]):
         """
-        Process a single command with appropriate handling based on type.
-        
+        Execute a batch of requests, pipelining writes ahead of reads.
+
+        All commands in the batch are written first, then responses are read
+        back in order and each request's future is resolved directly.
+
         Args:
-            cmd_type: Type of command ('write', 'read', or 'query')
-            command: The SCPI command string to execute
+            batch: Requests in queue order
         """
+        current = None
         try:
-            if cmd_type == "write":
-                # Execute write command
-                self.connection.write(command)
-                self._last_command = command
-                
-                # If the instrument always sends responses, wait for it
-                if getattr(self.connection, 'read_after_write', False):
-                    logger.debug(f"ConnectionWorker: Read-after-write enabled, reading response")
-                    response = self.connection.read()
-                    self.command_finished.emit(command, response)
-                else:
-                    # No response expected for write
-                    self.command_finished.emit(command, "")
-                    
-            elif cmd_type == "read":
-                # Execute read command (no write needed)
-                response = self.connection.read()
-                self.command_finished.emit("", response)
-                
-            elif cmd_type == "query":
-                # Execute query (write followed by read)
-                self.connection.write(command)
-                self._last_command = command
-                
-                # For queries, we must wait for the response
-                response = self.connection.read()
-                self.command_finished.emit(command, response)
-                
+            for request in batch:
+                current = request
+                if request.command:
+                    logger.debug(f"ConnectionWorker: Sending #{request.request_id} {request.kind}: {request.command}")
+                    self.connection.write(request.command)
+                    self._last_command = request.command
+
+            for request in batch:
+                current = request
+                response = self._read_response(request)
+                request.future.set_result(response)
+                if isinstance(response, str):
+                    self.command_finished.emit(request.command, response)
+
         except Exception as e:
-            error_msg = f"Error executing {cmd_type} command '{command}': {str(e)}"
+            error_msg = f"Error executing {current.kind} command '{current.command}': {str(e)}"
             logger.error(error_msg)
+            # The connection state is unknown, so nothing after the failure can be trusted
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
             self.error_occurred.emit(error_msg)
+
+    def _read_response(self, request: Request) -> Any:
+        """Read the response (if any) for a request whose command was already sent."""
+        if request.kind in ("read", "query"):
+            return self.connection.read()
+        if request.kind in ("read_block", "query_block"):
+            return self.connection.read_block(request.dtype, request.expect_terminator)
+
+        # If the instrument always sends responses, wait for it
+        if getattr(self.connection, 'read_after_write', False):
+            logger.debug("ConnectionWorker: Read-after-write enabled, reading response")
+            return self.connection.read()
+        return ""
+
+    def _cancel_pending(self):
+        """Fail every request still queued when the worker stops."""
+        while True:
+            try:
+                request = self.command_queue.get(block=False)
+            except queue.Empty:
+                return
+            request.future.set_exception(ConnectionError("Connection worker stopped"))
     
     def _check_for_data(self):
         """
@@ -141,40 +322,60 @@ class ConnectionWorker(QObject):
                     response = data.decode(self.connection.encoding)
                     logger.debug(f"ConnectionWorker: Received unsolicited data: {response}")
                     self.command_finished.emit("", response)
+                elif self._watched_fileno is not None:
+                    # Readable with no data means the peer closed; stop watching
+                    self.set_unsolicited_poll_interval(None)
+                    raise ConnectionError("Connection closed by instrument")
             except Exception as e:
                 error_msg = f"Error reading unsolicited data: {str(e)}"
                 logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
     
-    def write(self, command: str):
+    def submit(self, kind: str, command: str = "", dtype=None,
+               expect_terminator: bool = True) -> Future:
         """
-        Queue a write command.
-        
+        Queue an operation for the worker thread.
+
         Args:
+            kind: 'write', 'read', 'query', 'read_block' or 'query_block'
             command: The SCPI command string to send
+            dtype: NumPy dtype for block operations
+            expect_terminator: Whether a block response ends with the read terminator
+
+        Returns:
+            Future: Resolved with the response by the worker thread
         """
-        logger.debug(f"ConnectionWorker: Queueing write command: {command}")
-        self.command_queue.put(("write", command))
+        request = Request(kind, command, dtype, expect_terminator)
+        logger.debug(f"ConnectionWorker: Queueing #{request.request_id} {kind}: {command}")
+        self.command_queue.put(request)
+        self._wakeup()
+        return request.future
+
+    def write(self, command: str) -> Future:
+        """Queue a write command."""
+        return self.submit("write", command)
         
-    def read(self):
+    def read(self) -> Future:
         """Queue a read command."""
-        logger.debug("ConnectionWorker: Queueing read command")
-        self.command_queue.put(("read", ""))
-        
-    def query(self, command: str):
-        """
-        Queue a query command.
+        return self.submit("read")
         
-        Args:
-            command: The SCPI query command string to send
-        """
-        logger.debug(f"ConnectionWorker: Queueing query command: {command}")
-        self.command_queue.put(("query", command))
-    
+    def query(self, command: str) -> Future:
+        """Queue a query command."""
+        return self.submit("query", command)
+
+    def read_block(self, dtype) -> Future:
+        """Queue a binary block read."""
+        return self.submit("read_block", dtype=dtype)
+
+    def query_block(self, command: str, dtype, expect_terminator: bool = True) -> Future:
+        """Queue a query whose response is a binary block."""
+        return self.submit("query_block", command, dtype, expect_terminator)
+
     def stop(self):
         """Stop the worker thread."""
         logger.debug("ConnectionWorker: Stopping worker")
         self.running = False
+        self._wakeup()
 
 
 class ABCQObjectMeta(type(QObject), ABCMeta):
@@ -203,10 +404,25 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
     exceptionOccured = Signal(str)
     traceDataReady = Signal(np.ndarray, np.ndarray)
 
+    # Carries resolved futures back to the instrument's thread
+    _futureResolved = Signal(object, object)  # Future, (callback, errback, command)
+
+    # Longest ';'-joined compound message snapshot() and batch() may send;
+    # 0 sends every query and write on its own (for instruments without
+    # compound messages)
+    compound_max_length = 0
+
+    # Headers of raw writes that change no cached setting (e.g. ":DIGitize"),
+    # so they leave the property cache intact
+    cache_preserving_commands: Tuple[str, ...] = ()
+
     def __init__(self, connection: ConnectionInterface,
                  read_after_write: bool = False, 
                  read_timeout: float = 1.5,
                  threaded_mode: bool = None,  # None = auto-detect based on GUI context
+                 unsolicited_poll_interval: Optional[float] = None,
+                 pipeline_depth: int = 1,
+                 cache_properties: bool = False,
                  parent: Optional[QObject] = None):
         """
         Initialize the instrument with connection and communication parameters.
@@ -216,28 +432,50 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
             read_after_write: Whether the instrument sends data after every write
             read_timeout: Timeout in seconds for read operations
             threaded_mode: Whether to use threaded communication (None = auto-detect)
+            unsolicited_poll_interval: Seconds between checks for unsolicited
+                instrument data in threaded mode (None = disabled)
+            pipeline_depth: Maximum queries written before their responses are
+                read back. Leave at 1 for instruments that report "Query
+                INTERRUPTED" when a new query arrives before the last reply.
+            cache_properties: Serve property reads from the per-instrument
+                property cache where each property's cache policy allows
+                (can be toggled later via property_cache.enabled)
             parent: Parent QObject for the Qt object hierarchy
         """
         super().__init__(parent)
         self.connection = connection
         self.read_after_write = read_after_write
         self.read_timeout = read_timeout
+        self.unsolicited_poll_interval = unsolicited_poll_interval
+        self.pipeline_depth = max(1, pipeline_depth)
+        self.property_cache = PropertyCache(enabled=cache_properties,
+                                            keep_on=self.cache_preserving_commands)
+        self._batch_local = threading.local()
+        # Without a worker or async transport, the caller's thread and the
+        # call_async() executor both talk to the connection directly; each
+        # exchange holds this lock so responses cannot be swapped
+        self._io_lock = threading.RLock()
         
         # State flags
         self.continuous_mode = False
         self._ready_for_data = True
         self.unique_id = None
 
-        # Response tracking
-        self._response_buffer = {}
-        self._response_lock = threading.RLock()
-
-        # Determine communication mode
+        # Determine communication mode. Async transports do their I/O on the
+        # shared event loop thread, so they never need a worker thread.
         self._has_gui = QApplication.instance() is not None
-        self._threaded_mode = threaded_mode if threaded_mode is not None else self._has_gui
+        self._async_transport = getattr(connection, 'is_async', False)
+        if self._async_transport:
+            self._threaded_mode = False
+        else:
+            self._threaded_mode = threaded_mode if threaded_mode is not None else self._has_gui
         self._worker = None
         self._worker_thread = None
 
+        # Runs blocking calls for the *_async API when there is no worker
+        self._async_executor = None
+        self._futureResolved.connect(self._deliver_future)
+
         logger.debug(f"Instrument initialized with threaded_mode={self._threaded_mode}")
         
         if self._threaded_mode:
@@ -253,7 +491,8 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         logger.debug("Instrument: Setting up worker thread")
         
         # Create worker and thread instances
-        self._worker = ConnectionWorker(self.connection)
+        self._worker = ConnectionWorker(self.connection, self.unsolicited_poll_interval,
+                                        self.pipeline_depth)
         self._worker_thread = QThread()
         
         # Move worker to thread
@@ -305,6 +544,9 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         Cleans up resources and closes the physical connection.
         """
         self._cleanup_worker()
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=False)
+            self._async_executor = None
         try:
             self.connection.close()
             logger.info("Instrument connection closed")
@@ -327,14 +569,29 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         """
         desc = f"WRITE: {command}"
         logger.debug(desc)
+        self.property_cache.note_write(command)
+
+        batch = self._batch_state()
+        if batch.depth:
+            self._queue_write(batch, command)
+            return None
 
         try:
             if self._threaded_mode:
                 # Send via worker thread
                 self._worker.write(command)
+            elif self._async_transport:
+                # Send on the shared I/O loop
+                self._wait_for_future(self.connection.submit(self.connection.awrite(command)), command)
             else:
-                # Direct communication
-                self.connection.write(command)
+                # Direct communication; a read-after-write response is read
+                # under the same lock as its command
+                with self._io_lock:
+                    self.connection.write(command)
+                    self.commandSent.emit(command)
+                    if self.read_after_write:
+                        return self.read()
+                return None
                 
             # Emit signal for UI components
             self.commandSent.emit(command)
@@ -359,22 +616,20 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         """
         desc = "READ"
         logger.debug(desc)
+        self._flush_pending_writes()
 
         try:
             if self._threaded_mode:
-                # Send read request to worker thread
-                self._worker.read()
-                
-                # For GUI context, we need to wait for the response
-                if QThread.currentThread() == QApplication.instance().thread():
-                    # Use event loop to wait without blocking UI
-                    return self._wait_for_response(None)
-                else:
-                    # For script context, use simpler blocking wait
-                    return self._blocking_wait_for_response(None)
+                # Send read request to worker thread and wait on its future
+                return self._wait_for_future(self._worker.read(), None)
+            elif self._async_transport:
+                response = self._wait_for_future(self.connection.submit(self.connection.aread()), None)
+                self.responseReceived.emit("READ", response)
+                return response
             else:
                 # Direct communication
-                response = self.connection.read()
+                with self._io_lock:
+                    response = self.connection.read()
                 self.responseReceived.emit("READ", response)
                 return response
 
@@ -401,27 +656,30 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         """
         desc = f"QUERY: {command}"
         logger.debug(desc)
+        self._flush_pending_writes()
 
         try:
-            # Check if we're in the main GUI thread
-            in_main_thread = self._has_gui and QThread.currentThread() == QApplication.instance().thread()
-            
-            # In threaded mode and in the main thread, handle differently
             if self._threaded_mode:
-                # Send command to worker thread
-                self._worker.query(command)
+                # The worker resolves this query's own future, so identical
+                # concurrent queries can never take each other's responses
+                future = self._worker.query(command)
                 self.commandSent.emit(command)
-                
-                if in_main_thread:
-                    # Use event loop for GUI context
-                    return self._wait_for_response(command)
-                else:
-                    # Use blocking wait for script context
-                    return self._blocking_wait_for_response(command)
+                return self._wait_for_future(future, command)
+            elif self._async_transport:
+                # Write and read as one exchange on the shared I/O loop
+                self.commandSent.emit(command)
+                future = self.connection.submit(self.connection.aquery(command))
+                response = self._wait_for_future(future, command)
+                self.responseReceived.emit(command, response)
+                return response
             else:
-                # Direct communication (no worker)
-                self.write(command)
-                response = self.connection.read()
+                # Direct communication (no worker). Not through write(): inside
+                # a batch that would queue the command and the read would hang
+                self.property_cache.note_write(command)
+                with self._io_lock:
+                    self.connection.write(command)
+                    self.commandSent.emit(command)
+                    response = self.connection.read()
                 self.responseReceived.emit(command, response)
                 return response
 
@@ -430,127 +688,678 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
             self.exceptionOccured.emit(f"{desc} -> {e}")
             raise
 
-    def _wait_for_response(self, command: Optional[str]) -> str:
+    def query_pipelined(self, commands: List[str]) -> List[str]:
         """
-        Wait for a response using event loop (for GUI context).
-        
-        Uses Qt's event loop mechanism to wait for the response without
-        blocking the UI thread.
-        
+        Send several queries and collect their responses in order.
+
+        Up to pipeline_depth queries are written before their responses are
+        read back, so N queries cost roughly N / pipeline_depth round-trips.
+
         Args:
-            command: The command that was sent, or None for read operations
-            
+            commands: The SCPI query command strings
+
         Returns:
-            The response string
-            
-        Raises:
-            TimeoutError: If no response is received within the timeout period
+            List[str]: One response per command, in order
         """
-        from concurrent.futures import Future
-        
-        result_future = Future()
-        
-        # One-time handler for this specific command
-        def handle_response(cmd, resp):
-            # Match if it's the exact command or if this is a read operation
-            if (command is None and not cmd) or cmd == command:
-                if not result_future.done():
-                    result_future.set_result(resp)
-        
-        # Connect signal temporarily
-        conn = self.responseReceived.connect(handle_response)
-        
-        # Create event loop and timer
-        loop = QEventLoop()
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(loop.quit)
-        result_future.add_done_callback(lambda f: loop.quit())
-        
-        # Start timeout timer
-        timeout_ms = int(self.read_timeout * 1000)  # Convert to ms
-        timer.start(timeout_ms)
-        
-        # Wait for response or timeout
-        loop.exec_()
-        
-        # Clean up
+        commands = list(commands)
+        desc = f"QUERY PIPELINED: {len(commands)} commands"
+        logger.debug(desc)
+        if not commands:
+            return []
+        self._flush_pending_writes()
+
         try:
-            self.responseReceived.disconnect(conn)
-        except Exception:
-            pass
-        
-        if result_future.done():
-            return result_future.result()
+            if self._threaded_mode:
+                futures = [self._worker.query(command) for command in commands]
+                for command in commands:
+                    self.commandSent.emit(command)
+                return [self._wait_for_future(future, command)
+                        for future, command in zip(futures, commands)]
+
+            for command in commands:
+                self.commandSent.emit(command)
+
+            if self._async_transport:
+                future = self.connection.submit(
+                    self.connection.aquery_many(commands, self.pipeline_depth)
+                )
+                responses = self._wait_for_future(future, commands[-1])
+            else:
+                responses = []
+                with self._io_lock:
+                    for start in range(0, len(commands), self.pipeline_depth):
+                        chunk = commands[start:start + self.pipeline_depth]
+                        for command in chunk:
+                            self.connection.write(command)
+                        responses.extend(self.connection.read() for _ in chunk)
+
+            for command, response in zip(commands, responses):
+                self.responseReceived.emit(command, response)
+            return responses
+
+        except Exception as e:
+            logger.exception(f"Error executing {desc}: {e}")
+            self.exceptionOccured.emit(f"{desc} -> {e}")
+            raise
+
+    def query_properties(self, items: List[Tuple[Any, Property]],
+                         use_cache: bool = True) -> List[Any]:
+        """
+        Read many properties in as few round-trips as possible.
+
+        Property queries are joined with ';' into compound queries of at most
+        compound_max_length characters, the compound queries are pipelined,
+        and each combined reply is split and parsed per property. Values the
+        property cache holds are not queried. A chunk whose reply does not
+        split into one field per query (e.g. the instrument rejected one of
+        the headers) is read again one property at a time.
+
+        Args:
+            items: (owner, property) pairs, where owner is the instrument or
+                subsystem the property is read through
+            use_cache: Serve values the property cache holds. Pass False to
+                query every property, e.g. for an explicit refresh that must
+                pick up front-panel changes.
+
+        Returns:
+            List of values in the order of items; None for properties that
+            could not be read
+        """
+        values = [None] * len(items)
+        cache = self.property_cache
+        pending = []
+        for position, (owner, prop) in enumerate(items):
+            if use_cache and cache.enabled:
+                hit, value = cache.lookup(owner, prop)
+                if hit:
+                    values[position] = value
+                    continue
+            if self.compound_max_length and prop.snapshot_supported:
+                pending.append((position, owner, prop, prop.query_command(owner)))
+            else:
+                values[position] = self._read_property(owner, prop)
+
+        chunks = list(self._compound_chunks(pending))
+        if not chunks:
+            return values
+        logger.debug(f"Reading {len(pending)} properties in {len(chunks)} compound queries")
+
+        try:
+            responses = self.query_pipelined([";".join(item[3] for item in chunk) for chunk in chunks])
+        except Exception as e:
+            logger.warning(f"Compound property query failed: {e}")
+            responses = [None] * len(chunks)
+
+        for chunk, response in zip(chunks, responses):
+            try:
+                fields = _split_compound_response(response)
+                if len(fields) != len(chunk):
+                    raise ValueError(f"expected {len(chunk)} fields, got {len(fields)}")
+                for (position, owner, prop, _), field_value in zip(chunk, fields):
+                    values[position] = prop.parse(field_value)
+                    cache.store(owner, prop, values[position])
+            except Exception as e:
+                logger.warning(f"Could not split compound reply ({e}); "
+                               f"reading {len(chunk)} properties one by one")
+                for position, owner, prop, _ in chunk:
+                    values[position] = self._read_property(owner, prop)
+        return values
+
+    def _compound_chunks(self, pending):
+        """Group (position, owner, prop, command) items into compound queries."""
+        chunk, length = [], 0
+        for item in pending:
+            if chunk and length + 1 + len(item[3]) > self.compound_max_length:
+                yield chunk
+                chunk, length = [], 0
+            length += len(item[3]) + (1 if chunk else 0)
+            chunk.append(item)
+        if chunk:
+            yield chunk
+
+    def _read_property(self, owner, prop: Property) -> Any:
+        """Read one property, returning None if it fails."""
+        try:
+            value = prop.getter(owner)
+        except Exception as e:
+            logger.warning(f"Could not read '{prop.query_command(owner)}': {e}")
+            return None
+        self.property_cache.store(owner, prop, value)
+        return value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Read every readable property of the instrument and its subsystems.
+
+        Uses query_properties(), so a full refresh costs a handful of
+        compound queries instead of one query per property.
+
+        Returns:
+            Dict mapping property paths to values: "name" for instrument
+            properties, "subsystem.name" and "subsystem[index].name" for
+            subsystem properties
+        """
+        return _snapshot(self, self)
+
+    # Write batching
+    #
+    # Inside "with instr.batch():" property setters and write() only queue
+    # their commands. Repeated writes to the same property keep just the last
+    # value, and on exit the queue goes out as a few ';'-joined compound
+    # messages. Setter read-backs (read_after_write) are collected too and
+    # verified with one query_properties() call after the writes.
+
+    def _batch_state(self) -> _BatchState:
+        """Batch state of the calling thread; batches never span threads."""
+        state = getattr(self._batch_local, 'state', None)
+        if state is None:
+            state = self._batch_local.state = _BatchState()
+        return state
+
+    @property
+    def batching(self) -> bool:
+        """Whether the calling thread is inside a batch() block."""
+        return self._batch_state().depth > 0
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce writes made inside the block into compound messages.
+
+        Writes are sent when the outermost batch exits, or earlier when a
+        query inside the block needs the instrument to be up to date. If the
+        block raises, the queued writes are dropped and the property cache is
+        invalidated, since cached values may describe writes never sent.
+
+        Example:
+            with synth.batch():
+                for channel in synth.channel[1:]:
+                    channel.frequency = 2.1e9
+                    channel.power = 0
+        """
+        batch = self._batch_state()
+        batch.depth += 1
+        try:
+            yield self
+        except BaseException:
+            batch.depth -= 1
+            if batch.depth == 0:
+                if batch.writes:
+                    logger.warning(f"Dropping {len(batch.writes)} batched writes after an error")
+                batch.writes.clear()
+                batch.read_backs.clear()
+                self.property_cache.invalidate()
+            raise
+        batch.depth -= 1
+        if batch.depth == 0:
+            self._flush_batch(batch)
+
+    @contextmanager
+    def property_write(self, owner, prop: Property):
+        """
+        Mark writes made by a property setter.
+
+        The property cache ignores them, and inside a batch they replace any
+        earlier queued write of the same property.
+        """
+        batch = self._batch_state()
+        previous = batch.key
+        batch.key = (owner, prop)
+        if batch.depth:
+            batch.writes.pop(batch.key, None)
+        try:
+            with self.property_cache.property_write():
+                yield
+        finally:
+            batch.key = previous
+
+    def defer_read_back(self, owner, prop: Property):
+        """Verify a batched property write once the batch has been sent."""
+        self._batch_state().read_backs[(owner, prop)] = (owner, prop)
+
+    def _queue_write(self, batch: _BatchState, command):
+        key = batch.key
+        if key is None:
+            # Raw writes are never coalesced; order relative to properties
+            # is kept by insertion order
+            batch.raw_writes += 1
+            key = ('raw', batch.raw_writes)
+        batch.writes.setdefault(key, []).append(command)
+
+    def _flush_pending_writes(self):
+        """Send queued batch writes before an operation that reads."""
+        batch = getattr(self._batch_local, 'state', None)
+        if batch is not None and batch.depth and batch.writes:
+            self._send_batched_writes(batch)
+
+    def _flush_batch(self, batch: _BatchState):
+        self._send_batched_writes(batch)
+        if not batch.read_backs:
+            return
+
+        items = list(batch.read_backs.values())
+        batch.read_backs.clear()
+        for owner, prop in items:
+            self.property_cache.discard(owner, prop)
+        for (owner, prop), value in zip(items, self.query_properties(items)):
+            if value is None:
+                prop.record_response(owner, PropertyResponse(
+                    success=False, error=f"Could not verify '{prop.query_command(owner)}'"
+                ))
+            else:
+                prop.record_response(owner, PropertyResponse(value=value, raw_response=str(value)))
+
+    def _send_batched_writes(self, batch: _BatchState):
+        commands = [command for queued in batch.writes.values() for command in queued]
+        batch.writes.clear()
+        if not commands:
+            return
+
+        messages = list(self._compound_messages(commands))
+        logger.debug(f"Sending {len(commands)} batched writes in {len(messages)} messages")
+        depth, batch.depth = batch.depth, 0
+        try:
+            # The values these writes set are already in the property cache
+            with self.property_cache.property_write():
+                for message in messages:
+                    self.write(message)
+        finally:
+            batch.depth = depth
+
+    def _compound_messages(self, commands):
+        """Join string commands with ';' into messages of compound_max_length."""
+        message = ""
+        for command in commands:
+            if not isinstance(command, str) or not self.compound_max_length:
+                if message:
+                    yield message
+                    message = ""
+                yield command
+                continue
+            if message:
+                # A header after ';' is relative to the previous one unless
+                # it starts from the root
+                if not command.startswith((':', '*')):
+                    command = f":{command}"
+                if len(message) + 1 + len(command) > self.compound_max_length:
+                    yield message
+                    message = command
+                else:
+                    message = f"{message};{command}"
+            else:
+                message = command
+        if message:
+            yield message
+
+    def read_block(self, dtype=np.uint8) -> np.ndarray:
+        """
+        Read an IEEE 488.2 binary block from the instrument.
+
+        The payload is received straight into a preallocated array by the
+        connection, so large transfers cost a single allocation.
+
+        Args:
+            dtype: NumPy dtype of the block elements
+
+        Returns:
+            np.ndarray: The block payload
+        """
+        desc = "READ BLOCK"
+        logger.debug(desc)
+        self._flush_pending_writes()
+
+        try:
+            if self._threaded_mode:
+                return self._wait_for_future(self._worker.read_block(dtype), None, bounded=False)
+            if self._async_transport:
+                future = self.connection.submit(self.connection.aread_block(dtype))
+                return self._wait_for_future(future, None, bounded=False)
+            with self._io_lock:
+                return self.connection.read_block(dtype)
+
+        except Exception as e:
+            logger.exception(f"Error executing {desc}: {e}")
+            self.exceptionOccured.emit(f"{desc} -> {e}")
+            raise
+
+    def query_block(self, command: str, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """
+        Send a query and read its IEEE 488.2 binary block response.
+
+        Args:
+            command: The SCPI query command string
+            dtype: NumPy dtype of the block elements
+            expect_terminator: Consume the read terminator after the block.
+                Pass False when more of a compound reply follows the block.
+
+        Returns:
+            np.ndarray: The block payload
+        """
+        desc = f"QUERY BLOCK: {command}"
+        logger.debug(desc)
+        self._flush_pending_writes()
+
+        try:
+            if self._threaded_mode:
+                future = self._worker.query_block(command, dtype, expect_terminator)
+                self.commandSent.emit(command)
+                return self._wait_for_future(future, command, bounded=False)
+
+            if self._async_transport:
+                future = self.connection.submit(
+                    self.connection.aquery_block(command, dtype, expect_terminator)
+                )
+                self.commandSent.emit(command)
+                return self._wait_for_future(future, command, bounded=False)
+
+            with self._io_lock:
+                self.connection.write(command)
+                self.commandSent.emit(command)
+                return self.connection.read_block(dtype, expect_terminator)
+
+        except Exception as e:
+            logger.exception(f"Error executing {desc}: {e}")
+            self.exceptionOccured.emit(f"{desc} -> {e}")
+            raise
+
+    # Awaitable API
+    #
+    # With an async transport these run directly on the shared I/O loop, so
+    # queries to many instruments can be awaited concurrently, e.g.
+    #     await asyncio.gather(scope.aquery("*IDN?"), synth.aquery("*IDN?"))
+    # Other transports fall back to running the blocking call in an executor.
+
+    async def awrite(self, command: str) -> None:
+        """Awaitable variant of write()."""
+        logger.debug(f"AWRITE: {command}")
+        if not self._async_transport:
+            return await asyncio.get_running_loop().run_in_executor(None, self.write, command)
+        self.property_cache.note_write(command)
+        await asyncio.wrap_future(self.connection.submit(self.connection.awrite(command)))
+        self.commandSent.emit(command)
+
+    async def aread(self) -> str:
+        """Awaitable variant of read()."""
+        logger.debug("AREAD")
+        if not self._async_transport:
+            return await asyncio.get_running_loop().run_in_executor(None, self.read)
+        response = await asyncio.wrap_future(self.connection.submit(self.connection.aread()))
+        self.responseReceived.emit("READ", response)
+        return response
+
+    async def aquery(self, command: str) -> str:
+        """Awaitable variant of query()."""
+        logger.debug(f"AQUERY: {command}")
+        if not self._async_transport:
+            return await asyncio.get_running_loop().run_in_executor(None, self.query, command)
+        self.commandSent.emit(command)
+        response = await asyncio.wrap_future(self.connection.submit(self.connection.aquery(command)))
+        self.responseReceived.emit(command, response)
+        return response
+
+    async def aquery_block(self, command: str, dtype=np.uint8,
+                           expect_terminator: bool = True) -> np.ndarray:
+        """Awaitable variant of query_block()."""
+        logger.debug(f"AQUERY BLOCK: {command}")
+        if not self._async_transport:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.query_block, command, dtype, expect_terminator
+            )
+        self.commandSent.emit(command)
+        return await asyncio.wrap_future(
+            self.connection.submit(self.connection.aquery_block(command, dtype, expect_terminator))
+        )
+
+    # ------------------------------------------------
+    # Non-blocking Future API
+    # ------------------------------------------------
+    # These return immediately with a concurrent.futures.Future. Optional
+    # callback(result) / errback(exception) are invoked on the instrument's
+    # thread (the GUI thread for GUI-created instruments), so handlers may
+    # touch widgets directly and the caller never waits on instrument I/O.
+
+    def call_async(self, func: Callable, *args,
+                   callback: Optional[Callable] = None,
+                   errback: Optional[Callable] = None) -> Future:
+        """
+        Run a blocking instrument call on a background thread.
+
+        Calls are executed one at a time in submission order.
+
+        Args:
+            func: The blocking callable, e.g. a property getter
+            *args: Arguments passed to func
+            callback: Called with the result on the instrument's thread
+            errback: Called with the exception on the instrument's thread
+
+        Returns:
+            Future: Resolved with func's return value
+        """
+        if self._async_executor is None:
+            self._async_executor = ThreadPoolExecutor(max_workers=1,
+                                                      thread_name_prefix="pymetr-instrument")
+        future = self._async_executor.submit(func, *args)
+        return self._notify_when_done(future, callback, errback)
+
+    def write_async(self, command: str, callback: Optional[Callable] = None,
+                    errback: Optional[Callable] = None) -> Future:
+        """
+        Write a command without waiting for it to be sent.
+
+        Inside batch() the command is queued like write() and the future is
+        resolved at once.
+
+        Args:
+            command: The SCPI command string to send
+            callback: Called on the instrument's thread once the write completes
+            errback: Called with the exception on the instrument's thread
+
+        Returns:
+            Future: Resolved when the command has been written
+        """
+        logger.debug(f"WRITE ASYNC: {command}")
+        batch = self._batch_state()
+        if batch.depth:
+            # Batches are per thread, so queue here rather than on the executor
+            self.property_cache.note_write(command)
+            self._queue_write(batch, command)
+            future = Future()
+            future.set_result(None)
+            return self._notify_when_done(future, callback, errback)
+
+        if self.read_after_write or not (self._threaded_mode or self._async_transport):
+            return self.call_async(self.write, command, callback=callback, errback=errback)
+
+        self.property_cache.note_write(command)
+        if self._threaded_mode:
+            future, report = self._worker.write(command), None
         else:
-            raise TimeoutError(f"Timeout waiting for response to: {command}")
+            future = self.connection.submit(self.connection.awrite(command))
+            report = command
+        self.commandSent.emit(command)
+        return self._notify_when_done(future, callback, errback, report)
 
-    def _blocking_wait_for_response(self, command: Optional[str]) -> str:
+    def read_async(self, callback: Optional[Callable] = None,
+                   errback: Optional[Callable] = None) -> Future:
         """
-        Wait for a response using a blocking approach (for script context).
-        
-        This method is used when running in a script thread where it's
-        appropriate to block while waiting for the response.
-        
+        Read a response without waiting for it.
+
         Args:
-            command: The command that was sent, or None for read operations
-            
+            callback: Called with the response on the instrument's thread
+            errback: Called with the exception on the instrument's thread
+
         Returns:
-            The response string
-            
-        Raises:
-            TimeoutError: If no response is received within the timeout period
+            Future: Resolved with the response string
         """
-        from concurrent.futures import Future
-        
-        result_future = Future()
-        
-        # One-time handler for this specific command
-        def handle_response(cmd, resp):
-            # Match if it's the exact command or if this is a read operation
-            if (command is None and not cmd) or cmd == command:
-                if not result_future.done():
-                    result_future.set_result(resp)
-        
-        # Connect signal temporarily
-        conn = self.responseReceived.connect(handle_response)
-        
-        # Wait for response with timeout
-        timeout_s = self.read_timeout
-        start_time = time.time()
-        
-        while not result_future.done() and (time.time() - start_time < timeout_s):
-            # Give a chance for signals to be processed
-            if self._has_gui:
-                QApplication.processEvents()
-            time.sleep(0.001)  # Short sleep to prevent CPU hogging
-        
-        # Clean up
+        logger.debug("READ ASYNC")
+        self._flush_pending_writes()
+        if self._threaded_mode:
+            return self._notify_when_done(self._worker.read(), callback, errback)
+        if self._async_transport:
+            future = self.connection.submit(self.connection.aread())
+            return self._notify_when_done(future, callback, errback, "READ")
+        return self.call_async(self.read, callback=callback, errback=errback)
+
+    def query_async(self, command: str, callback: Optional[Callable] = None,
+                    errback: Optional[Callable] = None) -> Future:
+        """
+        Send a query without waiting for its response.
+
+        Args:
+            command: The SCPI query command string
+            callback: Called with the response on the instrument's thread
+            errback: Called with the exception on the instrument's thread
+
+        Returns:
+            Future: Resolved with the response string
+        """
+        logger.debug(f"QUERY ASYNC: {command}")
+        self._flush_pending_writes()
+        if not (self._threaded_mode or self._async_transport):
+            return self.call_async(self.query, command, callback=callback, errback=errback)
+
+        if self._threaded_mode:
+            # The worker reports the response and any error through its signals
+            future, report = self._worker.query(command), None
+        else:
+            future = self.connection.submit(self.connection.aquery(command))
+            report = command
+        self.commandSent.emit(command)
+        return self._notify_when_done(future, callback, errback, report)
+
+    def _notify_when_done(self, future: Future, callback: Optional[Callable],
+                          errback: Optional[Callable], report: Optional[str] = None) -> Future:
+        """
+        Arrange for a future's outcome to be delivered on the instrument's thread.
+
+        Args:
+            future: The future to watch
+            callback: Called with the result
+            errback: Called with the exception
+            report: Command to report through responseReceived/exceptionOccured,
+                or None when the transport already reports it
+        """
+        if callback is None and errback is None and report is None:
+            return future
+
+        handlers = (callback, errback, report)
+        if QApplication.instance() is None:
+            # No Qt event loop to deliver queued signals; call back in place
+            future.add_done_callback(lambda f: self._deliver_future(f, handlers))
+        else:
+            future.add_done_callback(lambda f: self._futureResolved.emit(f, handlers))
+        return future
+
+    @Slot(object, object)
+    def _deliver_future(self, future: Future, handlers: tuple):
+        """Invoke the callbacks registered for a resolved future."""
+        callback, errback, report = handlers
+        if future.cancelled():
+            return
+
+        error = future.exception()
         try:
-            self.responseReceived.disconnect(conn)
-        except Exception:
-            pass
-        
-        if result_future.done():
-            return result_future.result()
+            if error is None:
+                result = future.result()
+                if report is not None and isinstance(result, str):
+                    self.responseReceived.emit(report, result)
+                if callback is not None:
+                    callback(result)
+            else:
+                if report is not None:
+                    self.exceptionOccured.emit(f"{report} -> {error}")
+                if errback is not None:
+                    errback(error)
+                else:
+                    logger.error(f"Unhandled error in async instrument call: {error}")
+        except Exception as e:
+            logger.exception(f"Error in async instrument callback: {e}")
+
+    def _wait_for_future(self, future: Future, command: Optional[str], bounded: bool = True) -> Any:
+        """
+        Wait for a future resolved by the worker thread.
+
+        On the GUI thread a local event loop keeps the UI responsive; other
+        threads simply block on the future. A request on an async transport
+        that times out is cancelled and the stream is drained, so its late
+        reply cannot be taken as the answer to the next query.
+
+        Args:
+            future: The future to wait on
+            command: The command that was sent, for error reporting
+            bounded: Give up after read_timeout. Block transfers pass False:
+                their duration scales with the payload, and the transport
+                already times out when the data stops arriving.
+
+        Returns:
+            The future's result
+
+        Raises:
+            TimeoutError: If the future is not resolved within the timeout period
+        """
+        in_main_thread = self._in_main_thread()
+
+        if in_main_thread and not future.done():
+            loop = QEventLoop()
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(loop.quit)
+            # The callback runs on the worker thread, so quit via a queued call
+            future.add_done_callback(
+                lambda f: QMetaObject.invokeMethod(loop, "quit", Qt.QueuedConnection)
+            )
+            if bounded:
+                timer.start(int(self.read_timeout * 1000))
+            loop.exec()
+            timer.stop()
+
+        if in_main_thread:
+            timeout = 0
         else:
+            timeout = self.read_timeout if bounded else None
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            if self._async_transport and future.cancel():
+                self.connection.clear_buffer()
             raise TimeoutError(f"Timeout waiting for response to: {command}")
 
+    def _in_main_thread(self) -> bool:
+        """Whether the calling thread is the GUI thread."""
+        return self._has_gui and QThread.currentThread() == QApplication.instance().thread()
+
+    def pause(self, seconds: float):
+        """
+        Wait without blocking the GUI.
+
+        On the GUI thread a local event loop runs for the duration, like
+        _wait_for_future(); other threads simply sleep.
+
+        Args:
+            seconds: Time to wait
+        """
+        if seconds <= 0:
+            return
+        if not self._in_main_thread():
+            time.sleep(seconds)
+            return
+        loop = QEventLoop()
+        QTimer.singleShot(max(1, round(seconds * 1000)), loop.quit)
+        loop.exec()
+
     def _handle_worker_response(self, command: str, response: str):
         """
         Handle responses from worker thread.
         
         This method is called when the worker thread completes a command
-        and emits a command_finished signal.
+        and emits a command_finished signal. Callers waiting on a response
+        already received it through their request's future; this only
+        forwards it to UI listeners.
         
         Args:
             command: The command that was sent
             response: The response from the instrument
         """
-        # Store response in buffer for synchronization
-        with self._response_lock:
-            self._response_buffer[command if command else "READ"] = response
-        
         # Emit the signal for any UI listeners
         self.responseReceived.emit(command, response)
         logger.debug(f"Response received for {command if command else 'READ'}: {response}")
@@ -576,6 +1385,18 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         self.continuous_mode = mode
         self._ready_for_data = not mode
 
+    def set_unsolicited_polling(self, interval: Optional[float]):
+        """
+        Enable or disable monitoring for unsolicited instrument data.
+
+        Args:
+            interval: Minimum seconds between checks, or None to disable
+        """
+        logger.debug(f"Set unsolicited poll interval to {interval}")
+        self.unsolicited_poll_interval = interval
+        if self._worker:
+            self._worker.set_unsolicited_poll_interval(interval)
+
     def set_unique_id(self, uid: str):
         """
         Set unique identifier for this instrument.
@@ -612,123 +1433,109 @@ class Instrument(QObject, metaclass=ABCQObjectMeta):
         return wrapper
 
     @classmethod
-    def list_instruments(cls, model_filter: Optional[List[str]] = None) -> Dict[str, Dict[str, str]]:
+    def iter_instruments(cls, model_filter: Optional[List[str]] = None,
+                         cache: Optional[DiscoveryCache] = None,
+                         use_cache: bool = True,
+                         max_workers: int = 16,
+                         stop_event: Optional[threading.Event] = None
+                         ) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """
+        Discover instruments, yielding each one as soon as it is identified.
+
+        Instruments remembered in the discovery cache are yielded first,
+        without touching the network. UDP discovery (all local ranges at
+        once) and VISA resource listing then run side by side, and every
+        resource they turn up, cached ones included, is probed with *IDN?
+        as soon as it appears. An instrument is yielded again only if its
+        details changed, e.g. it moved to a new address.
+
+        Args:
+            model_filter (List[str], optional): List of model substrings to filter instruments.
+            cache (DiscoveryCache, optional): Cache to use instead of the default on-disk cache
+            use_cache (bool): Whether to read and update the discovery cache
+            max_workers (int): Maximum concurrent *IDN? probes
+            stop_event (threading.Event, optional): Cancels discovery when set
+
+        Yields:
+            (unique_id, info) pairs, where info holds the instrument details.
         """
-        List available instruments, starting with fast UDP discovery.
-        Emits instrument_found signals as devices are discovered.
+        logger.debug(f"Starting instrument discovery with model_filter: '{model_filter}'")
+        if use_cache and cache is None:
+            cache = DiscoveryCache()
+        elif not use_cache:
+            cache = None
+        reported = {}
+
+        def accept(resource, idn, source):
+            info = instrument_info(resource, idn)
+            model = info['model']
+            if model_filter and not any(f.lower() in model.lower() for f in model_filter):
+                return None
+            unique_id = f"{model}, {info['serial']}"
+            if reported.get(unique_id) == info:
+                return None
+            reported[unique_id] = info
+            logger.info(f"Found instrument via {source}: {unique_id}")
+            return unique_id, info
+
+        # Known instruments are available immediately
+        cached = cache.fresh() if cache is not None else {}
+        for resource, entry in cached.items():
+            found = accept(resource, entry.idn, "cache")
+            if found:
+                yield found
+
+        def udp_resources():
+            ip_ranges = RawSocketConnection.get_all_local_ip_ranges()
+            return RawSocketConnection._discover_udp(timeout=1.0, ip_range=ip_ranges).values()
+
+        def visa_resources():
+            return PyVisaConnection.list_instruments().values()
+
+        sources = {"cache": lambda: list(cached), "UDP": udp_resources, "VISA": visa_resources}
+        try:
+            for resource, idn in stream_probes(sources, timeout=1.0, max_workers=max_workers,
+                                               stop_event=stop_event):
+                if cache is not None:
+                    cache.update(resource, idn)
+                found = accept(resource, idn, "cache revalidation" if resource in cached else "probe")
+                if found:
+                    yield found
+        finally:
+            if cache is not None:
+                cache.save()
+            logger.info(f"Discovery finished. Found {len(reported)} instruments")
+
+    @classmethod
+    def list_instruments(cls, model_filter: Optional[List[str]] = None,
+                         on_found: Optional[Callable[[Dict[str, str]], None]] = None,
+                         cache: Optional[DiscoveryCache] = None,
+                         use_cache: bool = True,
+                         max_workers: int = 16,
+                         stop_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, str]]:
+        """
+        List available instruments.
+
+        Blocking wrapper around iter_instruments().
         
         Args:
             model_filter (List[str], optional): List of model substrings to filter instruments.
+            on_found (Callable, optional): Called with each instrument's info dict as
+                soon as it is known (cached entries first)
+            cache (DiscoveryCache, optional): Cache to use instead of the default on-disk cache
+            use_cache (bool): Whether to read and update the discovery cache
+            max_workers (int): Maximum concurrent *IDN? probes
+            stop_event (threading.Event, optional): Cancels discovery when set
             
         Returns:
             Dict[str, Dict[str, str]]: Dictionary mapping unique IDs to instrument details.
         """
-        logger.debug(f"Starting instrument discovery with model_filter: '{model_filter}'")
         instruments = {}
-        has_gui = QApplication.instance() is not None
-
-        # Start with UDP discovery (faster)
-        try:
-            logger.debug("Starting UDP discovery")
-            for ip_range in RawSocketConnection.get_all_local_ip_ranges():
-                udp_devices = RawSocketConnection._discover_udp(timeout=1.0, ip_range=ip_range)
-                
-                # Process each UDP-discovered device
-                for resource in udp_devices.values():
-                    try:
-                        # Create socket connection
-                        host, port = RawSocketConnection.parse_resource_string(resource)
-                        conn = RawSocketConnection(host=host, port=port, timeout=1.0)
-                        conn.open()
-                        
-                        # Quick IDN query
-                        idn = conn.query("*IDN?").strip()
-                        conn.close()
-
-                        if idn:
-                            # Parse IDN parts
-                            idn_parts = [part.strip() for part in idn.split(",")]
-                            if len(idn_parts) >= 4:
-                                manufacturer, model, serial, firmware = idn_parts[:4]
-                            else:
-                                manufacturer, model, serial, firmware = idn_parts + [""]*(4-len(idn_parts))
-
-                            # Apply model filter if provided
-                            if not model_filter or any(f.lower() in model.lower() for f in model_filter):
-                                instrument_info = {
-                                    'manufacturer': manufacturer,
-                                    'model': model,
-                                    'serial': serial,
-                                    'firmware': firmware,
-                                    'resource': resource
-                                }
-                                unique_id = f"{model}, {serial}"
-                                instruments[unique_id] = instrument_info
-                                
-                                # Emit signal if we found a device
-                                if hasattr(cls, 'instrument_found'):
-                                    cls.instrument_found.emit(instrument_info)
-                                logger.info(f"Found instrument via UDP: {unique_id}")
-
-                    except Exception as e:
-                        logger.debug(f"Could not query device at {resource}: {e}")
-
-                    if has_gui:
-                        QApplication.processEvents()
-
-        except Exception as e:
-            logger.warning(f"UDP discovery error: {e}")
-
-        # Then do VISA discovery (slower but might find additional devices)
-        try:
-            logger.debug("Starting VISA discovery")
-            visa_resources = PyVisaConnection.list_instruments()
-            
-            def query_visa_device(resource):
-                if has_gui:
-                    QApplication.processEvents()
-                try:
-                    conn = PyVisaConnection(resource, timeout=1000)  # Short timeout
-                    conn.open()
-                    idn = conn.query("*IDN?").strip()
-                    conn.close()
-
-                    if idn:
-                        idn_parts = [part.strip() for part in idn.split(",")]
-                        if len(idn_parts) >= 4:
-                            manufacturer, model, serial, firmware = idn_parts[:4]
-                        else:
-                            manufacturer, model, serial, firmware = idn_parts + [""]*(4-len(idn_parts))
-
-                        if not model_filter or any(f.lower() in model.lower() for f in model_filter):
-                            instrument_info = {
-                                'manufacturer': manufacturer,
-                                'model': model,
-                                'serial': serial,
-                                'firmware': firmware,
-                                'resource': resource
-                            }
-                            unique_id = f"{model}, {serial}"
-                            
-                            # Only add/emit if we haven't already found this device
-                            if unique_id not in instruments:
-                                instruments[unique_id] = instrument_info
-                                if hasattr(cls, 'instrument_found'):
-                                    cls.instrument_found.emit(instrument_info)
-                                logger.info(f"Found instrument via VISA: {unique_id}")
-
-                except Exception as e:
-                    logger.debug(f"Could not query VISA device at {resource}: {e}")
-
-            # Use thread pool for VISA discovery
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                list(executor.map(query_visa_device, visa_resources.values()))
-
-        except Exception as e:
-            logger.warning(f"VISA discovery error: {e}")
-
-        logger.info(f"Discovery complete. Found {len(instruments)} instruments")
+        for unique_id, info in cls.iter_instruments(model_filter, cache=cache, use_cache=use_cache,
+                                                    max_workers=max_workers, stop_event=stop_event):
+            instruments[unique_id] = info
+            if on_found is not None:
+                on_found(info)
         return instruments
 
 
@@ -745,6 +1552,10 @@ class SCPIInstrument(Instrument):
         parent (QObject): Parent QObject (default: None)
     """
 
+    # SCPI instruments accept ';'-joined compound queries; drivers for
+    # instruments with a smaller input buffer can lower this
+    compound_max_length = 240
+
     def __init__(self, connection, read_after_write=False, timeout=5000, parent=None, **kwargs):
         super().__init__(connection, read_after_write=read_after_write, parent=parent, **kwargs)
         self._data_mode = "ASCII"
@@ -908,9 +1719,7 @@ class SCPIInstrument(Instrument):
         Returns:
             numpy.ndarray: Parsed data array
         """
-        response = self.read()
-        data, _ = self._parse_binary_header(response)
-        return np.frombuffer(data, dtype=self._data_type)
+        return self.read_block(dtype=self._data_type)
 
 
 class Subsystem:
@@ -989,6 +1798,58 @@ class Subsystem:
         logger.debug(f"Subsystem forwarding QUERY command: '{command}'")
         return self.instr.query(full_command)
 
+    async def awrite(self, command: str) -> None:
+        """Awaitable write forwarded to the parent instrument with proper prefix."""
+        return await self.instr.awrite(f"{self.cmd_prefix}{command}")
+
+    async def aquery(self, command: str) -> str:
+        """Awaitable query forwarded to the parent instrument with proper prefix."""
+        return await self.instr.aquery(f"{self.cmd_prefix}{command}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Read every readable property of this subsystem and its children.
+
+        Returns:
+            Dict mapping property paths ("name", "child.name") to values
+        """
+        root = self.instr
+        while isinstance(root, Subsystem):
+            root = root.instr
+        return _snapshot(root, self)
+
+    def write_async(self, command: str, callback: Optional[Callable] = None,
+                    errback: Optional[Callable] = None) -> Future:
+        """Non-blocking write forwarded to the parent instrument with proper prefix."""
+        return self.instr.write_async(f"{self.cmd_prefix}{command}", callback, errback)
+
+    def query_async(self, command: str, callback: Optional[Callable] = None,
+                    errback: Optional[Callable] = None) -> Future:
+        """Non-blocking query forwarded to the parent instrument with proper prefix."""
+        return self.instr.query_async(f"{self.cmd_prefix}{command}", callback, errback)
+
+    def call_async(self, func: Callable, *args,
+                   callback: Optional[Callable] = None,
+                   errback: Optional[Callable] = None) -> Future:
+        """Run a blocking call on the parent instrument's background thread."""
+        return self.instr.call_async(func, *args, callback=callback, errback=errback)
+
+    def query_block(self, command: str, dtype=np.uint8, expect_terminator: bool = True) -> np.ndarray:
+        """
+        Forward binary block query to parent instrument with proper prefix.
+
+        Args:
+            command (str): The SCPI query command string
+            dtype: NumPy dtype of the block elements
+            expect_terminator (bool): Consume the read terminator after the block
+
+        Returns:
+            np.ndarray: The block payload
+        """
+        full_command = f"{self.cmd_prefix}{command}"
+        logger.debug(f"Subsystem forwarding QUERY BLOCK command: '{command}'")
+        return self.instr.query_block(full_command, dtype, expect_terminator)
+
     @classmethod
     def build(cls, parent, cmd_prefix, indices=None):
         """
@@ -1028,4 +1889,51 @@ class Subsystem:
         """
         # Default implementation - subclasses should override this
         logger.warning(f"Default fetch_trace implementation called for {self.__class__.__name__}")
-        return np.array([]), np.array([])
\ No newline at end of file
+        return np.array([]), np.array([])
+
+
+def _split_compound_response(response: str) -> List[str]:
+    """Split a compound query reply on ';' outside quoted strings."""
+    if response is None:
+        raise ValueError("no response")
+    fields, start, quote = [], 0, None
+    for i, char in enumerate(response):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == ';':
+            fields.append(response[start:i].strip())
+            start = i + 1
+    fields.append(response[start:].strip())
+    return fields
+
+
+def _iter_snapshot_properties(owner, prefix: str = ""):
+    """Yield (path, owner, property) for every readable property under owner."""
+    seen = set()
+    for klass in type(owner).__mro__:
+        for name, prop in vars(klass).items():
+            if name in seen or not isinstance(prop, Property):
+                continue
+            seen.add(name)
+            # Binary blocks (waveforms) are data, not settings
+            if prop.access in ("read", "read-write") and prop.snapshot_supported:
+                yield f"{prefix}{name}", owner, prop
+
+    for name, value in vars(owner).items():
+        if name.startswith('_') or name == 'instr':
+            continue
+        if isinstance(value, Subsystem):
+            yield from _iter_snapshot_properties(value, f"{prefix}{name}.")
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                if isinstance(item, Subsystem):
+                    yield from _iter_snapshot_properties(item, f"{prefix}{name}[{index}].")
+
+
+def _snapshot(instrument: Instrument, owner) -> Dict[str, Any]:
+    entries = list(_iter_snapshot_properties(owner))
+    values = instrument.query_properties([(item, prop) for _, item, prop in entries])
+    return {path: value for (path, _, _), value in zip(entries, values)}
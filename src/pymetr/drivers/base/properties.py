@@ -6,11 +6,17 @@ Each property class implements specific behavior for different types of instrume
 settings while relying on the base Instrument class for communication handling.
 
 The implementation ensures proper synchronization in both GUI and script contexts.
+Property values can be cached per instrument (see PropertyCache) so repeated
+reads of settings the software already knows skip the instrument round-trip.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import logging
-from typing import Any, Optional, Union, Tuple, List, Type, Callable
+import threading
+import time
+import warnings
+from typing import Any, Optional, Union, Tuple, List, Type, Callable, Dict, Iterable
 from enum import Enum
 from dataclasses import dataclass
 import numpy as np
@@ -33,6 +39,167 @@ class PropertyResponse:
     success: bool = True
     error: Optional[str] = None
 
+class CachePolicy:
+    """
+    Caching policies for property values.
+
+    VOLATILE: Always query the instrument (measurements, status)
+    CACHE_UNTIL_WRITE: Reuse the last value read or written until the
+        property is set again or the cache is invalidated
+    IMMUTABLE: Fixed instrument characteristics (e.g. ":FREQ:MIN"); kept
+        across resets
+    """
+    VOLATILE = "volatile"
+    CACHE_UNTIL_WRITE = "cache_until_write"
+    IMMUTABLE = "immutable"
+
+    ALL = (VOLATILE, CACHE_UNTIL_WRITE, IMMUTABLE)
+
+
+class PropertyCache:
+    """
+    Per-instrument cache of property values keyed by (owner, cmd_str).
+
+    The owner is the instrument or subsystem instance the property was
+    accessed through, so indexed subsystems (channels) have separate
+    entries. Values are stored when a property is read or set, according to
+    the property's cache policy and TTL.
+
+    Writes that do not come from a property setter may change any setting
+    (e.g. ":AUToscale", "*RST", "*RCL"), so they invalidate every entry
+    except immutable ones, unless their header is listed in keep_on.
+
+    Args:
+        enabled: Whether property reads may be served from the cache
+        keep_on: Headers of writes known not to change any setting (e.g.
+            ":DIGitize"); both the short and the long form are accepted
+    """
+
+    def __init__(self, enabled: bool = False, keep_on: Iterable[str] = ()):
+        self.enabled = enabled
+        self._keep_on = frozenset(form for header in keep_on for form in _header_forms(header))
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[Any, str], Tuple[Any, float, str]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def lookup(self, owner, prop: "Property") -> Tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Returns:
+            (hit, value); value is None on a miss
+        """
+        if not self.enabled or prop.cache == CachePolicy.VOLATILE:
+            return False, None
+        with self._lock:
+            entry = self._entries.get((owner, prop.cmd_str))
+            if entry is not None:
+                value, stored_at, _ = entry
+                if prop.cache_ttl is None or time.monotonic() - stored_at <= prop.cache_ttl:
+                    self.hits += 1
+                    return True, value
+                del self._entries[(owner, prop.cmd_str)]
+            self.misses += 1
+        return False, None
+
+    def store(self, owner, prop: "Property", value: Any):
+        """Remember a value read from or written to the instrument."""
+        if not self.enabled or prop.cache == CachePolicy.VOLATILE or value is None:
+            return
+        with self._lock:
+            self._entries[(owner, prop.cmd_str)] = (value, time.monotonic(), prop.cache)
+
+    def discard(self, owner, prop: "Property"):
+        """Forget the value of one property."""
+        with self._lock:
+            self._entries.pop((owner, prop.cmd_str), None)
+
+    def invalidate(self, include_immutable: bool = False):
+        """
+        Forget cached values.
+
+        Args:
+            include_immutable: Also forget immutable values (e.g. after
+                connecting to a different instrument)
+        """
+        with self._lock:
+            if include_immutable:
+                self._entries.clear()
+            else:
+                self._entries = {
+                    key: entry for key, entry in self._entries.items()
+                    if entry[2] == CachePolicy.IMMUTABLE
+                }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @contextmanager
+    def property_write(self):
+        """Mark writes on this thread as coming from a property setter."""
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+
+    def note_write(self, command):
+        """Invalidate the cache for a write not made by a property setter."""
+        if not self._entries or self._keeps_settings(command):
+            return
+        if getattr(self._local, 'depth', 0) and not self._is_reset(command):
+            return
+        logger.debug(f"Invalidating property cache after write: {command!r}")
+        self.invalidate()
+
+    def _keeps_settings(self, command) -> bool:
+        # Queries (the write half of a direct query) and keep_on headers do
+        # not change settings
+        if not isinstance(command, str):
+            return False
+        for part in command.split(';'):
+            if not part.strip():
+                continue
+            header = part.split(None, 1)[0]
+            if not (header.endswith('?') or header.upper() in self._keep_on):
+                return False
+        return True
+
+    @staticmethod
+    def _is_reset(command) -> bool:
+        if isinstance(command, (bytes, bytearray)):
+            command = bytes(command[:256]).decode('ascii', errors='ignore')
+        upper = str(command).upper()
+        return "*RST" in upper or "*RCL" in upper
+
+
+def _header_forms(header: str) -> Tuple[str, str]:
+    """Upper-case short and long forms of a SCPI header such as ':DIGitize'."""
+    nodes = header.split(':')
+    short = ':'.join(''.join(c for c in node if not c.islower()) for node in nodes)
+    return short.upper(), header.upper()
+
+
+def instrument_for(instance):
+    """Find the instrument that owns an instrument or subsystem instance."""
+    owner = instance
+    while owner is not None:
+        if getattr(owner, 'property_cache', None) is not None:
+            return owner
+        owner = getattr(owner, 'instr', None)
+    return None
+
+
+def property_cache_for(instance) -> Optional[PropertyCache]:
+    """Find the PropertyCache of the instrument that owns an instance."""
+    instrument = instrument_for(instance)
+    return instrument.property_cache if instrument is not None else None
+
+
 class Property(ABC):
     """
     Base class for all SCPI property descriptors.
@@ -46,15 +213,44 @@ class Property(ABC):
         doc_str: Documentation string describing the property
         access: Access mode ('read', 'write', or 'read-write')
         join_char: Character used to join command and value
+        cache: Cache policy (see CachePolicy). Defaults to 'cache_until_write'
+            for read-write settings and 'volatile' for read-only values.
+            Only used when the instrument's property cache is enabled.
+        cache_ttl: Seconds a cached value stays valid (None = no expiry)
     """
 
-    def __init__(self, cmd_str: str, doc_str: str = "", access: str = "read-write", join_char: str = " "):
+    default_cache: Optional[str] = None
+    snapshot_supported = True  # Whether the reply can be part of a compound query
+
+    def __init__(self, cmd_str: str, doc_str: str = "", access: str = "read-write", join_char: str = " ",
+                 cache: Optional[str] = None, cache_ttl: Optional[float] = None):
         logger.debug(f"Initializing Property with cmd_str='{cmd_str}', access='{access}'")
         self.cmd_str = cmd_str
         self.doc_str = doc_str
         self.access = access.lower()
         self.join_char = join_char
-        self.last_response = PropertyResponse()
+
+        if cache is None:
+            cache = self.default_cache
+        if cache is None:
+            cache = CachePolicy.CACHE_UNTIL_WRITE if self.access == "read-write" else CachePolicy.VOLATILE
+        if cache not in CachePolicy.ALL:
+            raise ValueError(f"Invalid cache policy '{cache}'. Must be one of: {list(CachePolicy.ALL)}")
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+
+    def last_response(self, instance) -> PropertyResponse:
+        """
+        The most recent response of this property on one instance.
+
+        Responses are kept per instrument or subsystem instance, so channels
+        sharing a descriptor do not overwrite each other's results.
+        """
+        return instance.__dict__.get('_property_responses', {}).get(self, PropertyResponse())
+
+    def record_response(self, instance, response: PropertyResponse):
+        """Store the response of a get or set on one instance."""
+        instance.__dict__.setdefault('_property_responses', {})[self] = response
 
     def __get__(self, instance, owner):
         """Descriptor get implementation."""
@@ -66,8 +262,18 @@ class Property(ABC):
             msg = f"Property '{self.cmd_str}' is write-only"
             logger.error(msg)
             raise AttributeError(msg)
-            
-        return self.getter(instance)
+
+        cache = property_cache_for(instance)
+        if cache is None or not cache.enabled:
+            return self.getter(instance)
+
+        hit, value = cache.lookup(instance, self)
+        if hit:
+            logger.debug(f"Cache hit for '{self.cmd_str}'")
+            return value
+        value = self.getter(instance)
+        cache.store(instance, self, value)
+        return value
 
     def __set__(self, instance, value):
         """Descriptor set implementation."""
@@ -75,8 +281,94 @@ class Property(ABC):
             msg = f"Property '{self.cmd_str}' is read-only"
             logger.error(msg)
             raise AttributeError(msg)
-            
-        self.setter(instance, value)
+
+        instrument = instrument_for(instance)
+        if instrument is None:
+            self.setter(instance, value)
+            return
+
+        cache = instrument.property_cache
+        try:
+            with instrument.property_write(instance, self):
+                result = self.setter(instance, value)
+        except Exception:
+            # The instrument state is unknown after a failed write
+            cache.discard(instance, self)
+            raise
+        cache.store(instance, self, result)
+
+    def get_async(self, instance, callback: Optional[Callable] = None,
+                  errback: Optional[Callable] = None, use_cache: bool = True):
+        """
+        Read the property without blocking the calling thread.
+
+        The query runs on the instrument's background thread; callbacks are
+        delivered on the instrument's (GUI) thread.
+
+        Args:
+            instance: The instrument or subsystem owning the property
+            callback: Called with the converted value
+            errback: Called with the exception if the read fails
+            use_cache: Serve the value from the property cache if it holds
+                one. Pass False to always query the instrument, e.g. to see
+                what it accepted after a write.
+
+        Returns:
+            Future: Resolved with the converted value
+        """
+        read = self.__get__ if use_cache else self._read_uncached
+        return instance.call_async(read, instance, type(instance),
+                                   callback=callback, errback=errback)
+
+    def _read_uncached(self, instance, owner=None):
+        """Query the instrument, bypassing the cache but refreshing it."""
+        if self.access not in ["read", "read-write"]:
+            raise AttributeError(f"Property '{self.cmd_str}' is write-only")
+        value = self.getter(instance)
+        cache = property_cache_for(instance)
+        if cache is not None:
+            cache.store(instance, self, value)
+        return value
+
+    def set_async(self, instance, value, callback: Optional[Callable] = None,
+                  errback: Optional[Callable] = None):
+        """
+        Write the property without blocking the calling thread.
+
+        Args:
+            instance: The instrument or subsystem owning the property
+            value: The value to set
+            callback: Called once the value has been written
+            errback: Called with the exception if the write fails
+
+        Returns:
+            Future: Resolved when the write completes
+        """
+        return instance.call_async(self.__set__, instance, value,
+                                   callback=callback, errback=errback)
+
+    def _read_back(self, instance) -> bool:
+        """
+        Whether a setter should verify its write with a query now.
+
+        Inside an instrument batch() the verification is deferred to the
+        batch flush, where all read-backs share compound queries.
+        """
+        if not getattr(instance, 'read_after_write', False):
+            return False
+        instrument = instrument_for(instance)
+        if instrument is not None and instrument.batching:
+            instrument.defer_read_back(instance, self)
+            return False
+        return True
+
+    def query_command(self, instance) -> str:
+        """Full query command for this property, including the owner's prefix."""
+        return f"{getattr(instance, 'cmd_prefix', '')}{self.cmd_str}?"
+
+    def parse(self, response: str) -> Any:
+        """Convert a query response into the property's value type."""
+        return response
 
     @abstractmethod
     def getter(self, instance) -> Any:
@@ -100,12 +392,13 @@ class ValueProperty(Property):
         doc_str: Documentation string
         access: Access mode ('read', 'write', or 'read-write')
         join_char: Character used to join command and value
+        **kwargs: Cache options passed to Property (cache, cache_ttl)
     """
 
     def __init__(self, cmd_str: str, type: str = None, range: Optional[Tuple] = None,
                  units: str = "", doc_str: str = "", access: str = "read-write",
-                 join_char: str = " "):
-        super().__init__(cmd_str, doc_str, access, join_char)
+                 join_char: str = " ", **kwargs):
+        super().__init__(cmd_str, doc_str, access, join_char, **kwargs)
         self.type = type
         self.range = range
         self.units = units
@@ -151,6 +444,12 @@ class ValueProperty(Property):
             logger.error(msg)
             raise ValueError(msg)
 
+    def parse(self, response: str) -> Optional[Union[float, int]]:
+        """Convert a response to a validated number (None if empty)."""
+        if response is None or response.strip() == "":
+            return None
+        return self._validate_value(response)
+
     def getter(self, instance) -> Union[float, int]:
         """Get the current numeric value from the instrument."""
         logger.debug(f"Getting value for '{self.cmd_str}'")
@@ -159,22 +458,21 @@ class ValueProperty(Property):
             response = instance.query(f"{self.cmd_str}?")
             
             # Proper response handling
-            if response is None or response.strip() == "":
+            value = self.parse(response)
+            if value is None:
                 logger.warning(f"No valid response received for '{self.cmd_str}?'")
                 return None
-                
-            value = self._validate_value(response)
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 value=value,
                 raw_response=response
-            )
+            ))
             return value
         except Exception as e:
             logger.error(f"Error in getter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
     def setter(self, instance, value):
@@ -186,26 +484,26 @@ class ValueProperty(Property):
             instance.write(command)
             
             # If read_after_write is enabled, read back the value to verify
-            if getattr(instance, 'read_after_write', False):
+            if self._read_back(instance):
                 response = instance.query(f"{self.cmd_str}?")
                 read_value = self._validate_value(response)
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=read_value,
                     raw_response=response
-                )
+                ))
                 return read_value
             else:
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=validated_value,
                     raw_response=command
-                )
+                ))
                 return validated_value
         except Exception as e:
             logger.error(f"Error in setter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
 class SwitchProperty(Property):
@@ -218,6 +516,7 @@ class SwitchProperty(Property):
         format: Format for sending values ('ON_OFF', 'TRUE_FALSE', '1_0')
         access: Access mode ('read', 'write', or 'read-write')
         join_char: Character used to join command and value
+        **kwargs: Cache options passed to Property (cache, cache_ttl)
     """
 
     # Define standard format mappings
@@ -228,8 +527,8 @@ class SwitchProperty(Property):
     }
 
     def __init__(self, cmd_str: str, doc_str: str = "", format: str = '1_0', 
-                 access: str = "read-write", join_char: str = " "):
-        super().__init__(cmd_str, doc_str, access, join_char)
+                 access: str = "read-write", join_char: str = " ", **kwargs):
+        super().__init__(cmd_str, doc_str, access, join_char, **kwargs)
         
         # Validate and set format
         format = format.upper()
@@ -259,6 +558,12 @@ class SwitchProperty(Property):
         """Convert boolean to the configured string format."""
         return self.FORMAT_MAPS[self.format]['true' if value else 'false']
 
+    def parse(self, response: str) -> Optional[bool]:
+        """Convert a response to a boolean (None if empty)."""
+        if response is None or response.strip() == "":
+            return None
+        return self._convert_to_bool(response)
+
     def getter(self, instance) -> bool:
         """Get the current boolean state from the instrument."""
         logger.debug(f"Getting boolean value for '{self.cmd_str}'")
@@ -267,22 +572,21 @@ class SwitchProperty(Property):
             response = instance.query(f"{self.cmd_str}?")
             
             # Proper response handling
-            if response is None or response.strip() == "":
+            value = self.parse(response)
+            if value is None:
                 logger.warning(f"No valid response received for '{self.cmd_str}?'")
                 return None
-                
-            value = self._convert_to_bool(response)
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 value=value,
                 raw_response=response
-            )
+            ))
             return value
         except Exception as e:
             logger.error(f"Error in getter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
     def setter(self, instance, value):
@@ -295,26 +599,26 @@ class SwitchProperty(Property):
             instance.write(command)
             
             # If read_after_write is enabled, read back the value to verify
-            if getattr(instance, 'read_after_write', False):
+            if self._read_back(instance):
                 response = instance.query(f"{self.cmd_str}?")
                 read_value = self._convert_to_bool(response)
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=read_value,
                     raw_response=response
-                )
+                ))
                 return read_value
             else:
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=bool_value,
                     raw_response=command
-                )
+                ))
                 return bool_value
         except Exception as e:
             logger.error(f"Error in setter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
 class SelectProperty(Property):
@@ -327,11 +631,12 @@ class SelectProperty(Property):
         doc_str: Documentation string
         access: Access mode ('read', 'write', or 'read-write')
         join_char: Character used to join command and value
+        **kwargs: Cache options passed to Property (cache, cache_ttl)
     """
 
     def __init__(self, cmd_str: str, choices: Union[List[str], Type[Enum]], 
-                 doc_str: str = "", access: str = "read-write", join_char: str = " "):
-        super().__init__(cmd_str, doc_str, access, join_char)
+                 doc_str: str = "", access: str = "read-write", join_char: str = " ", **kwargs):
+        super().__init__(cmd_str, doc_str, access, join_char, **kwargs)
         
         # Handle both enum and list inputs
         self.enum_class = None
@@ -383,6 +688,17 @@ class SelectProperty(Property):
             logger.error(msg)
             raise ValueError(msg)
 
+    def parse(self, response: str) -> Optional[Union[str, Enum]]:
+        """Convert a response to the matching choice (None if empty)."""
+        if response is None or response.strip() == "":
+            return None
+        matched_value = self._find_match(response)
+        
+        # Convert to enum if applicable
+        if self.enum_class:
+            return self.enum_class(matched_value)
+        return matched_value
+
     def getter(self, instance) -> Union[str, Enum]:
         """Get the current selection from the instrument."""
         logger.debug(f"Getting selection for '{self.cmd_str}'")
@@ -391,31 +707,22 @@ class SelectProperty(Property):
             response = instance.query(f"{self.cmd_str}?")
             
             # Proper response handling
-            if response is None or response.strip() == "":
+            result = self.parse(response)
+            if result is None:
                 logger.warning(f"No valid response received for '{self.cmd_str}?'")
                 return None
                 
-            matched_value = self._find_match(response)
-            
-            # Convert to enum if applicable
-            if self.enum_class:
-                result = self.enum_class(matched_value)
-                logger.debug(f"Converted to enum: {result}")
-            else:
-                result = matched_value
-                logger.debug(f"Using string value: {result}")
-                
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 value=result,
                 raw_response=response
-            )
+            ))
             return result
         except Exception as e:
             logger.error(f"Error in getter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
     def setter(self, instance, value):
@@ -427,7 +734,7 @@ class SelectProperty(Property):
             instance.write(command)
             
             # If read_after_write is enabled, read back the value to verify
-            if getattr(instance, 'read_after_write', False):
+            if self._read_back(instance):
                 response = instance.query(f"{self.cmd_str}?")
                 read_value = self._find_match(response)
                 
@@ -435,27 +742,27 @@ class SelectProperty(Property):
                 if self.enum_class:
                     read_value = self.enum_class(read_value)
                     
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=read_value,
                     raw_response=response
-                )
+                ))
                 return read_value
             else:
                 result_value = matched_value
                 if self.enum_class:
                     result_value = self.enum_class(matched_value)
                     
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=result_value,
                     raw_response=command
-                )
+                ))
                 return result_value
         except Exception as e:
             logger.error(f"Error in setter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
 class StringProperty(Property):
@@ -468,11 +775,12 @@ class StringProperty(Property):
         doc_str: Documentation string
         access: Access mode ('read', 'write', or 'read-write')
         join_char: Character used to join command and value
+        **kwargs: Cache options passed to Property (cache, cache_ttl)
     """
 
     def __init__(self, cmd_str: str, max_length: Optional[int] = None,
-                 doc_str: str = "", access: str = "read-write", join_char: str = " "):
-        super().__init__(cmd_str, doc_str, access, join_char)
+                 doc_str: str = "", access: str = "read-write", join_char: str = " ", **kwargs):
+        super().__init__(cmd_str, doc_str, access, join_char, **kwargs)
         self.max_length = max_length
         logger.debug(f"Initialized StringProperty with max_length={max_length}")
 
@@ -501,17 +809,17 @@ class StringProperty(Property):
                 return ""
                 
             # Just return the raw string
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 value=response,
                 raw_response=response
-            )
+            ))
             return response
         except Exception as e:
             logger.error(f"Error in getter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
     def setter(self, instance, value):
@@ -528,27 +836,85 @@ class StringProperty(Property):
             instance.write(command)
             
             # If read_after_write is enabled, read back the value to verify
-            if getattr(instance, 'read_after_write', False):
+            if self._read_back(instance):
                 response = instance.query(f"{self.cmd_str}?")
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=response,
                     raw_response=response
-                )
+                ))
                 return response
             else:
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=validated_value,
                     raw_response=command
-                )
+                ))
                 return validated_value
         except Exception as e:
             logger.error(f"Error in setter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
+# Converters whose values NumPy can parse itself, without a Python call per element
+_NUMERIC_CONVERTERS = {float: np.float64, int: np.int64}
+
+
+def _numeric_dtype(converter) -> Optional[np.dtype]:
+    """NumPy dtype equivalent to a per-element converter, or None."""
+    if converter in _NUMERIC_CONVERTERS:
+        return np.dtype(_NUMERIC_CONVERTERS[converter])
+    if isinstance(converter, type) and issubclass(converter, np.number):
+        return np.dtype(converter)
+    return None
+
+
+def parse_numbers(text: str, dtype, separator: str = ",") -> Optional[np.ndarray]:
+    """
+    Parse separated ASCII numbers straight into an array in C.
+
+    Whitespace around values and a trailing separator are accepted. Returns
+    None when the text is not a clean list of numbers (empty fields, units,
+    non-numeric values), so the caller can fall back to per-element parsing.
+    A partial parse is detected by comparing the element count with the
+    number of fields in the text.
+    """
+    dtype = np.dtype(dtype)
+    with warnings.catch_warnings():
+        # NumPy warns (in future: raises) when it stops before the end of the text
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            # Text parsing ignores the byte order, so parse natively and swap
+            array = np.fromstring(text, dtype=dtype.newbyteorder('='), sep=separator or " ")
+        except ValueError:
+            return None
+
+    if separator:
+        fields = text.strip()
+        if fields.endswith(separator):
+            fields = fields[:-len(separator)]
+        expected = fields.count(separator) + 1 if fields.strip() else 0
+    else:
+        expected = len(text.split())
+    if len(array) != expected:
+        return None
+    return array if array.dtype == dtype else array.astype(dtype)
+
+
+def scale_codes(codes: np.ndarray, increment: float, origin: float, reference: float) -> np.ndarray:
+    """
+    Convert raw ADC codes to (code - reference) * increment + origin.
+
+    Works in place on a single float64 result, so scaling a waveform never
+    allocates more than the output array.
+    """
+    values = np.subtract(codes, reference, dtype=np.float64)
+    values *= increment
+    values += origin
+    return values
+
+
 class DataProperty(Property):
     """
     Property for handling basic ASCII data arrays.
@@ -561,20 +927,26 @@ class DataProperty(Property):
         access: Access mode ('read', 'write', or 'read-write')
         doc_str: Documentation string
         container: Container type for the data (default: numpy.array)
-        converter: Function to convert individual values (default: float)
+        converter: Function to convert individual values (default: float).
+            float, int and NumPy scalar types are parsed by NumPy in one pass;
+            other callables are applied per element.
         separator: String separator between values
         join_char: Character used to join command and value
         terminator: Read termination character(s)
+        **kwargs: Cache options passed to Property (cache, cache_ttl)
     """
 
+    default_cache = CachePolicy.VOLATILE
+
     def __init__(self, cmd_str: str, access: str = "read-write", doc_str: str = "",
                  container=np.array, converter: Callable = float, separator: str = ",", 
-                 join_char: str = " ", terminator: str = '\n'):
-        super().__init__(cmd_str, doc_str, access, join_char)
+                 join_char: str = " ", terminator: str = '\n', **kwargs):
+        super().__init__(cmd_str, doc_str, access, join_char, **kwargs)
         self.container = container
         self.converter = converter
         self.separator = separator
         self.terminator = terminator
+        self._dtype = _numeric_dtype(converter)
         logger.debug(
             f"Initialized DataProperty with separator='{separator}', "
             f"terminator='{terminator}'"
@@ -587,7 +959,14 @@ class DataProperty(Property):
             # Handle empty response
             if not response or response.strip() == "":
                 return self.container([])
-                
+
+            if self._dtype is not None:
+                array = parse_numbers(response, self._dtype, self.separator)
+                if array is not None:
+                    if self.container in (np.array, np.asarray):
+                        return array
+                    return self.container(array.tolist())
+
             # Split response and filter out empty strings
             values = [v.strip() for v in response.strip().split(self.separator)]
             values = [v for v in values if v]
@@ -617,6 +996,12 @@ class DataProperty(Property):
             logger.error(msg)
             raise ValueError(msg)
 
+    def parse(self, response: str) -> Any:
+        """Convert a response to an array (empty if there was no response)."""
+        if response is None:
+            return self.container([])
+        return self._convert_to_array(response)
+
     def getter(self, instance) -> Any:
         """Get array data from the instrument."""
         logger.debug(f"Getting array data for '{self.cmd_str}'")
@@ -627,20 +1012,19 @@ class DataProperty(Property):
             # Proper response handling
             if response is None:
                 logger.warning(f"No response received for '{self.cmd_str}?'")
-                return self.container([])
                 
-            array_data = self._convert_to_array(response)
-            self.last_response = PropertyResponse(
+            array_data = self.parse(response)
+            self.record_response(instance, PropertyResponse(
                 value=array_data,
                 raw_response=response
-            )
+            ))
             return array_data
         except Exception as e:
             logger.error(f"Error in getter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
     def setter(self, instance, value):
@@ -655,26 +1039,26 @@ class DataProperty(Property):
             instance.write(command)
             
             # If read_after_write is enabled, read back the value to verify
-            if getattr(instance, 'read_after_write', False):
+            if self._read_back(instance):
                 response = instance.query(f"{self.cmd_str}?")
                 read_value = self._convert_to_array(response)
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=read_value,
                     raw_response=response
-                )
+                ))
                 return read_value
             else:
-                self.last_response = PropertyResponse(
+                self.record_response(instance, PropertyResponse(
                     value=value,
                     raw_response=command
-                )
+                ))
                 return value
         except Exception as e:
             logger.error(f"Error in setter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
 class DataBlockProperty(Property):
@@ -682,23 +1066,39 @@ class DataBlockProperty(Property):
     Property for handling binary data blocks with IEEE headers.
 
     This property type handles binary data transfers with IEEE 488.2 binary block 
-    format, often used for waveform data and other large datasets.
+    format, often used for waveform data and other large datasets. Blocks are
+    received straight into one preallocated array by the connection, and
+    indefinite-length (#0) blocks are supported.
 
     Args:
         cmd_str: SCPI command string
         access: Access mode ('read', 'write', or 'read-write')
         doc_str: Documentation string
         container: Container type for the data (default: numpy.array)
-        dtype: NumPy dtype for binary data (default: np.float32)
+        dtype: NumPy dtype for binary data, byte order included (default:
+            np.float32), or a callable taking the owning instrument/subsystem
+            that returns the dtype for the next read, so drivers can follow
+            the instrument's data format. A callable returning None marks the
+            block as ASCII numbers.
         ieee_header: Whether to expect/generate IEEE headers (default: True)
+        scale: Optional callable taking the owning instrument/subsystem and
+            returning (increment, origin, reference); raw codes are then
+            converted to (code - reference) * increment + origin in a single
+            float64 array, without intermediate copies
+        **kwargs: Cache options passed to Property (cache, cache_ttl)
     """
 
+    default_cache = CachePolicy.VOLATILE
+    snapshot_supported = False  # Binary blocks cannot share a compound reply
+
     def __init__(self, cmd_str: str, access: str = "read-write", doc_str: str = "",
-                 container=np.array, dtype=np.float32, ieee_header: bool = True):
-        super().__init__(cmd_str, doc_str, access)
+                 container=np.array, dtype=np.float32, ieee_header: bool = True,
+                 scale: Optional[Callable] = None, **kwargs):
+        super().__init__(cmd_str, doc_str, access, **kwargs)
         self.container = container
         self.dtype = dtype
         self.ieee_header = ieee_header
+        self.scale = scale
         logger.debug(
             f"Initialized DataBlockProperty with dtype={dtype}, "
             f"ieee_header={ieee_header}"
@@ -709,13 +1109,21 @@ class DataBlockProperty(Property):
         Parse IEEE 488.2 binary block header.
         Format: '#' + number_of_digits + data_length + data
         Example: #42000 means 4 digits follow, data length is 2000 bytes
+        HP '#A' blocks carry a two-byte big-endian length instead.
         """
         logger.debug("Parsing IEEE header")
         if not data.startswith(b'#'):
             raise ValueError("Invalid IEEE block header: missing '#' marker")
 
         try:
+            if data[1:2] == b'A':
+                # HP '#A' block: two-byte big-endian binary length
+                data_len = int.from_bytes(data[2:4], 'big')
+                return data[4:4 + data_len], 4
             num_digits = int(data[1:2])
+            if num_digits == 0:
+                # Indefinite length: the block runs to the end of the message
+                return (data[2:-1] if data.endswith(b'\n') else data[2:]), 2
             header_len = 2 + num_digits
             data_len = int(data[2:header_len])
             logger.debug(f"Found IEEE header: {num_digits} digits, {data_len} bytes")
@@ -725,12 +1133,12 @@ class DataBlockProperty(Property):
             logger.error(msg)
             raise ValueError(msg)
 
-    def _format_ieee_block(self, data: np.ndarray) -> bytes:
+    def _format_ieee_block(self, data: np.ndarray, dtype=None) -> bytes:
         """Format data as IEEE 488.2 binary block."""
         logger.debug("Formatting IEEE block")
         try:
             # Convert data to bytes
-            raw_data = data.astype(self.dtype).tobytes()
+            raw_data = data.astype(dtype or self.dtype).tobytes()
             
             # Create IEEE header
             length_str = str(len(raw_data)).encode()
@@ -742,10 +1150,61 @@ class DataBlockProperty(Property):
             logger.error(msg)
             raise ValueError(msg)
 
+    def block_dtype(self, instance) -> Optional[np.dtype]:
+        """The dtype of the next block read through instance (None for ASCII)."""
+        dtype = self.dtype
+        if callable(dtype) and not isinstance(dtype, type):
+            dtype = dtype(instance)
+        return None if dtype is None else np.dtype(dtype)
+
+    def _apply_scale(self, instance, codes: np.ndarray) -> np.ndarray:
+        """Convert raw codes to scaled values with in-place arithmetic."""
+        if self.scale is None:
+            return codes
+        return scale_codes(codes, *self.scale(instance))
+
+    def _decode(self, response, dtype: Optional[np.dtype]) -> Optional[np.ndarray]:
+        """Convert a bytes or ASCII query response into an array."""
+        if isinstance(response, (bytes, bytearray)):
+            if self.ieee_header:
+                data_bytes, _ = self._parse_ieee_header(response)
+            else:
+                data_bytes = response
+            if dtype is not None:
+                return np.frombuffer(data_bytes, dtype=dtype)
+            response = bytes(data_bytes).decode('ascii')
+
+        if not response.strip():
+            return None
+        dtype = dtype if dtype is not None else np.dtype(np.float64)
+        array_data = parse_numbers(response, dtype)
+        if array_data is None:
+            values = [float(v) for v in response.strip().split(',')]
+            array_data = np.array(values, dtype=dtype)
+        return array_data
+
     def getter(self, instance) -> np.ndarray:
         """Get binary block data from the instrument."""
         logger.debug(f"Getting binary data for '{self.cmd_str}'")
         try:
+            dtype = self.block_dtype(instance)
+
+            # Blocks go through the zero-copy block reader
+            if self.ieee_header and hasattr(instance, 'query_block'):
+                block = instance.query_block(f"{self.cmd_str}?", dtype=np.uint8 if dtype is None else dtype)
+                raw_response = f"<{block.nbytes} byte block>"
+                if dtype is None:
+                    array_data = self._decode(block.tobytes().decode('ascii'), None)  # ASCII values in a block
+                else:
+                    array_data = self._apply_scale(instance, block)
+                if self.container is not np.array:
+                    array_data = self.container(array_data)
+                self.record_response(instance, PropertyResponse(
+                    value=array_data,
+                    raw_response=raw_response
+                ))
+                return array_data
+
             # Use query which now handles both GUI and script contexts correctly
             response = instance.query(f"{self.cmd_str}?")
             
@@ -753,52 +1212,42 @@ class DataBlockProperty(Property):
             if response is None:
                 logger.warning(f"No response received for '{self.cmd_str}?'")
                 return None
-                
-            # Handle binary response
-            if isinstance(response, bytes):
-                if self.ieee_header:
-                    data_bytes, _ = self._parse_ieee_header(response)
-                else:
-                    data_bytes = response
-                    
-                # Convert to numpy array
-                array_data = np.frombuffer(data_bytes, dtype=self.dtype)
-                
-            # Handle ASCII response
-            else:
-                if not response.strip():
-                    logger.warning(f"Empty response for '{self.cmd_str}?'")
-                    return None
-                    
-                values = [float(v) for v in response.strip().split(',')]
-                array_data = np.array(values, dtype=self.dtype)
-            
+
+            array_data = self._decode(response, dtype)
+            if array_data is None:
+                logger.warning(f"Empty response for '{self.cmd_str}?'")
+                return None
+            if dtype is not None and not isinstance(response, str):
+                array_data = self._apply_scale(instance, array_data)
+
             array_data = self.container(array_data)
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 value=array_data,
                 raw_response=response
-            )
+            ))
             return array_data
             
         except Exception as e:
             logger.error(f"Error in getter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
 
     def setter(self, instance, value):
         """Set binary block data on the instrument."""
         logger.debug(f"Setting binary data for '{self.cmd_str}'")
         try:
+            dtype = self.block_dtype(instance)
+
             # Convert input to numpy array if needed
             if not isinstance(value, np.ndarray):
-                value = np.array(value, dtype=self.dtype)
+                value = np.array(value, dtype=dtype)
                 
             # Format data
-            if self.ieee_header:
-                data = self._format_ieee_block(value)
+            if self.ieee_header and dtype is not None:
+                data = self._format_ieee_block(value, dtype)
                 command = f"{self.cmd_str}{self.join_char}".encode() + data
             else:
                 # Fall back to ASCII if no IEEE header
@@ -808,39 +1257,28 @@ class DataBlockProperty(Property):
             instance.write(command)
             
             # If read_after_write is enabled, read back to verify (not always practical for large data)
-            if getattr(instance, 'read_after_write', False) and len(value) < 1000:
+            if len(value) < 1000 and self._read_back(instance):
                 try:
                     response = instance.query(f"{self.cmd_str}?")
                     
-                    # Process response
-                    if isinstance(response, bytes):
-                        if self.ieee_header:
-                            data_bytes, _ = self._parse_ieee_header(response)
-                        else:
-                            data_bytes = response
-                            
-                        read_value = np.frombuffer(data_bytes, dtype=self.dtype)
-                    else:
-                        values = [float(v) for v in response.strip().split(',')]
-                        read_value = np.array(values, dtype=self.dtype)
-                        
-                    self.last_response = PropertyResponse(
+                    read_value = self._decode(response, dtype)
+                    self.record_response(instance, PropertyResponse(
                         value=read_value,
                         raw_response=response
-                    )
+                    ))
                     return read_value
                 except Exception as read_error:
                     logger.warning(f"Error reading back binary data: {read_error}")
             
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 value=value,
                 raw_response=str(command)
-            )
+            ))
             return value
         except Exception as e:
             logger.error(f"Error in setter for '{self.cmd_str}': {e}")
-            self.last_response = PropertyResponse(
+            self.record_response(instance, PropertyResponse(
                 success=False,
                 error=str(e)
-            )
+            ))
             raise
\ No newline at end of file
@@ -0,0 +1,655 @@
+# drivers/emulator.py
+"""
+Loopback SCPI instrument emulator.
+
+Serves the command sets used by the bundled Dsox1204g, HP8563A and HS9000
+drivers over a local TCP socket, so connections and drivers can be tested
+and profiled without hardware. Per-command latency, jitter and waveform
+sizes are configurable to mimic slow or busy instruments.
+
+Examples:
+    # In-process, e.g. from a pytest fixture
+    with EmulatorServer(ScopeEmulator(points=62500, latency=0.001)) as server:
+        scope = Dsox1204g(RawSocketConnection(server.resource))
+
+    # Standalone, for profiling from another process
+    python -m pymetr.drivers.emulator dsox1204g --port 5025 --latency 0.002
+"""
+
+import argparse
+import logging
+import random
+import re
+import socket
+import socketserver
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Response = Union[str, bytes, None]
+
+
+def scpi_pattern(header: str) -> str:
+    """
+    Build a regex for a mixed-case SCPI header.
+
+    Each mnemonic matches its short form (the upper-case part) or its long
+    form, e.g. ":WAVeform:PREamble?" accepts ":WAV:PRE?" and
+    ":WAVEFORM:PREAMBLE?". "<n>" matches a numeric suffix as a group.
+
+    Args:
+        header: Header in SCPI documentation notation
+
+    Returns:
+        str: Regex (compile case-insensitively)
+    """
+    parts = []
+    for token in re.split(r'(:|\?|<n>)', header):
+        if token == '<n>':
+            parts.append(r'(\d+)')
+        elif token in (':', '?', ''):
+            parts.append(re.escape(token))
+        else:
+            split = len(token.rstrip('abcdefghijklmnopqrstuvwxyz'))
+            short, rest = token[:split], token[split:]
+            parts.append(re.escape(short) + (f"(?:{rest})?" if rest else ""))
+    return ''.join(parts)
+
+
+def parse_number(text: str) -> float:
+    """Parse a numeric argument that may carry an engineering unit suffix."""
+    match = re.match(r'\s*([-+]?[\d.]+(?:[eE][-+]?\d+)?)\s*([a-zA-Z]*)', text)
+    if not match:
+        raise ValueError(f"Not a number: {text!r}")
+    value, unit = float(match.group(1)), match.group(2).upper()
+    for prefix, scale in (('GHZ', 1e9), ('MHZ', 1e6), ('KHZ', 1e3), ('MS', 1e-3),
+                          ('US', 1e-6), ('NS', 1e-9), ('MV', 1e-3)):
+        if unit == prefix:
+            return value * scale
+    return value
+
+
+def normalize_value(text: str) -> str:
+    """Strip a unit suffix from a numeric value ("0.001s" -> "0.001"); keep other text."""
+    text = text.strip()
+    if re.fullmatch(r'[-+]?[\d.]+(?:[eE][-+]?\d+)?\s*[a-zA-Z]+', text):
+        return repr(parse_number(text))
+    return text
+
+
+def ieee_block(payload: bytes) -> bytes:
+    """Wrap a payload in an IEEE 488.2 definite-length block header."""
+    length = str(len(payload)).encode()
+    return b'#' + str(len(length)).encode() + length + payload
+
+
+def hp_a_block(payload: bytes) -> bytes:
+    """Wrap a payload in an HP '#A' block header (two-byte big-endian length)."""
+    return b'#A' + len(payload).to_bytes(2, 'big') + payload
+
+
+class EmulatedInstrument:
+    """
+    Base class for an emulated instrument personality.
+
+    Subclasses list their commands in handlers() as (regex, callable) pairs.
+    The regex is matched case-insensitively against the whole message; the
+    callable receives the match and returns a response (str or bytes) for
+    queries or None for commands. Messages no handler claims fall back to a
+    generic settings store: "HEADER value" stores a value and "HEADER?"
+    returns it.
+
+    Args:
+        latency: Seconds added before every message is processed
+        jitter: Upper bound of a random extra delay in seconds
+        latencies: Per-command latency overrides, {regex: seconds}; the first
+            regex found in the message wins
+        seed: Seed for the waveform noise and jitter generators
+    """
+
+    idn = "PYMETR,EMULATOR,0,1.0"
+    terminator = "\n"
+    # Replies to a compound query share one line, joined like SCPI does;
+    # None sends every reply on its own line
+    compound_separator: Optional[str] = ";"
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0,
+                 latencies: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.latencies = [(re.compile(p, re.IGNORECASE), d) for p, d in (latencies or {}).items()]
+        self.settings: Dict[str, str] = {}
+        self.commands_received = 0
+        self.messages_received = 0
+        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._handlers = [
+            (re.compile(pattern, re.IGNORECASE), handler)
+            for pattern, handler in self._common_handlers() + self.handlers()
+        ]
+
+    def _common_handlers(self) -> List[Tuple[str, Callable]]:
+        return [
+            (r'\*IDN\?', lambda m: self.idn),
+            (r'\*OPC\?', lambda m: "1"),
+            (r'\*ESR\?', lambda m: "0"),
+            (r'\*(?:RST|CLS|OPC|WAI)', lambda m: None),
+            (scpi_pattern(":SYSTem:ERRor?"), lambda m: '+0,"No error"'),
+        ]
+
+    def handlers(self) -> List[Tuple[str, Callable]]:
+        """Instrument-specific (regex, handler) pairs."""
+        return []
+
+    def delay_for(self, message: str) -> float:
+        """Seconds to wait before answering a message."""
+        delay = self.latency
+        for pattern, override in self.latencies:
+            if pattern.search(message):
+                delay = override
+                break
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        return delay
+
+    def handle(self, message: str) -> List[Response]:
+        """
+        Process one received line, which may hold ';'-separated commands.
+
+        Returns:
+            List of responses, one per query in the line
+        """
+        responses = []
+        with self._lock:
+            self.messages_received += 1
+        for command in (c.strip() for c in message.split(';')):
+            if not command:
+                continue
+            delay = self.delay_for(command)
+            if delay > 0:
+                time.sleep(delay)
+            with self._lock:
+                self.commands_received += 1
+                response = self._dispatch(command)
+            if response is not None:
+                responses.append(response)
+        return responses
+
+    def _dispatch(self, command: str) -> Response:
+        for pattern, handler in self._handlers:
+            match = pattern.fullmatch(command)
+            if match:
+                return handler(match)
+
+        # Generic settings store for everything else
+        if command.endswith('?'):
+            return self.settings.get(command[:-1].upper(), "0")
+        header, _, value = command.partition(' ')
+        self.settings[header.upper()] = normalize_value(value)
+        return None
+
+    def setting(self, header: str, name: str, default: str,
+                join: str = r'\s+') -> List[Tuple[str, Callable]]:
+        """
+        Handlers for a simple stored setting.
+
+        Args:
+            header: SCPI header in documentation notation
+            name: Key in self.settings
+            default: Initial value
+            join: Regex separating the header from the value
+        """
+        self.settings.setdefault(name, default)
+
+        def store(match):
+            self.settings[name] = normalize_value(match.group('value'))
+
+        pattern = scpi_pattern(header)
+        return [
+            (pattern + r'\?', lambda m: self.settings[name]),
+            (pattern + join + r'(?P<value>.+)', store),
+        ]
+
+
+class ScopeEmulator(EmulatedInstrument):
+    """
+    Keysight DSOX1204G oscilloscope personality.
+
+    Serves the waveform preamble, WORD/BYTE/ASCII waveform data as IEEE
+    blocks and the run-control commands used by the Dsox1204g driver.
+
+    Args:
+        points: Samples returned by :WAVeform:DATa?
+        **kwargs: Latency options passed to EmulatedInstrument
+    """
+
+    idn = "KEYSIGHT TECHNOLOGIES,DSO-X 1204G,EMU00000001,02.12.2021071625"
+    _format_codes = {"BYTE": 0, "WORD": 1, "ASCII": 4}
+
+    # Seconds between the triggers of consecutive emulated segments
+    segment_period = 1e-3
+
+    def __init__(self, points: int = 1000, **kwargs):
+        self._waveforms: Dict[Tuple[int, str], np.ndarray] = {}
+        super().__init__(**kwargs)
+        self.settings['points'] = str(points)
+
+        # Front-panel defaults served by the generic settings store, keyed
+        # by the headers the Dsox1204g driver sends
+        for channel in range(1, 5):
+            self.settings.update({
+                f":CHANNEL{channel}:COUPLING": "DC",
+                f":CHANNEL{channel}:DISPLAY": "1" if channel == 1 else "0",
+                f":CHANNEL{channel}:SCALE": "+1.00000E+00",
+                f":CHANNEL{channel}:OFFSET": "+0.00000E+00",
+                f":CHANNEL{channel}:PROBE": "+10.0000E+00",
+            })
+        self.settings.update({
+            ":TIMEBASE:MODE": "MAIN",
+            ":TIMEBASE:REFERENCE": "CENT",
+            ":TIMEBASE:POSITION": "+0.00000E+00",
+            ":TIMEBASE:RANGE": "+10.0000E-03",
+            ":TRIGGER:MODE": "EDGE",
+            ":TRIGGER:SOURCE": "CHAN1",
+            ":TRIGGER:SLOPE": "POS",
+            ":TRIGGER:SWEEP": "AUTO",
+            ":TRIGGER:LEVEL": "+0.00000E+00",
+            ":WGEN:FUNC": "SIN",
+            ":WGEN:OUTP": "0",
+            ":WGEN:FREQ": "+1.00000E+03",
+            ":WGEN:VOLT": "+500.000E-03",
+            ":WGEN:VOLT:OFFS": "+0.00000E+00",
+            ":ACQUIRE:MODE": "RTIM",
+            ":ACQUIRE:TYPE": "NORM",
+            ":ACQUIRE:SRATE": "+1.00000E+09",
+            ":ACQUIRE:COUNT": "8",
+        })
+
+    def handlers(self) -> List[Tuple[str, Callable]]:
+        return [
+            (scpi_pattern(":WAVeform:PREamble?"), lambda m: self._preamble()),
+            (scpi_pattern(":WAVeform:DATa?"), lambda m: self._data()),
+            *self.setting(":WAVeform:POINts", "points", "1000"),
+            *self.setting(":WAVeform:FORMat", "format", "BYTE"),
+            *self.setting(":WAVeform:SOURce", "source", "CHAN1"),
+            *self.setting(":WAVeform:UNSigned", "unsigned", "1"),
+            *self.setting(":WAVeform:BYTeorder", "byteorder", "MSBFirst"),
+            *self.setting(":WAVeform:POINts:MODE", "points_mode", "NORMal"),
+            *self.setting(":TIMebase:SCALe", "timebase_scale", "0.001"),
+            *self.setting(":ACQuire:SEGMented:COUNt", "segment_count", "2"),
+            *self.setting(":ACQuire:SEGMented:INDex", "segment_index", "1"),
+            (scpi_pattern(":WAVeform:SEGMented:COUNt?"), lambda m: self._segments_acquired()),
+            (scpi_pattern(":WAVeform:SEGMented:TTAG?"),
+             lambda m: f"{(self._segment() - 1) * self.segment_period:+.9E}"),
+            (scpi_pattern(":AER?"), lambda m: "1"),
+            (scpi_pattern(":OPERegister:CONDition?"), lambda m: "0"),
+            (scpi_pattern(":DIGitize") + r'(?:\s+.*)?', lambda m: None),
+            (scpi_pattern(":AUTOScale") + r'(?:\s+.*)?', lambda m: None),
+            (r'(?:' + '|'.join(scpi_pattern(c) for c in (":SINGle", ":RUN", ":STOP")) + ')',
+             lambda m: None),
+        ]
+
+    @property
+    def points(self) -> int:
+        return int(float(self.settings['points']))
+
+    @property
+    def data_format(self) -> str:
+        fmt = self.settings['format'].upper()
+        return "WORD" if fmt.startswith("WORD") else "ASCII" if fmt.startswith("ASC") else "BYTE"
+
+    @property
+    def unsigned(self) -> bool:
+        return self.settings['unsigned'].upper() in ("1", "ON")
+
+    def _scaling(self) -> Tuple[float, float, float, float, float, float]:
+        x_increment = float(self.settings['timebase_scale']) * 10 / self.points
+        x_origin = -float(self.settings['timebase_scale']) * 5
+        if self.data_format == "WORD":
+            return x_increment, x_origin, 0.0, 0.04 / 256, 0.0, 32768.0 if self.unsigned else 0.0
+        return x_increment, x_origin, 0.0, 0.04, 0.0, 128.0 if self.unsigned else 0.0
+
+    def _preamble(self) -> str:
+        x_inc, x_org, x_ref, y_inc, y_org, y_ref = self._scaling()
+        fields = [self._format_codes[self.data_format], 0, self.points, 1,
+                  x_inc, x_org, x_ref, y_inc, y_org, y_ref]
+        return ','.join(f"{v:+.6E}" if isinstance(v, float) else str(v) for v in fields)
+
+    def _codes(self) -> np.ndarray:
+        """Digitized 1 kHz-ish sine with noise, cached per size and format."""
+        key = (self.points, self.data_format, self.unsigned)
+        if key not in self._waveforms:
+            t = np.linspace(0, 4 * np.pi, self.points)
+            volts = 2.0 * np.sin(t) + self._rng.normal(0, 0.05, self.points)
+            _, _, _, y_inc, y_org, y_ref = self._scaling()
+            kind = 'u' if self.unsigned else 'i'
+            info = np.iinfo(f"{kind}2" if self.data_format == "WORD" else f"{kind}1")
+            codes = np.clip(np.round(volts / y_inc + y_ref), info.min, info.max).astype(info.dtype)
+            self._waveforms[key] = codes
+        return self._waveforms[key]
+
+    def _segments_acquired(self) -> str:
+        if not self.settings.get(":ACQUIRE:MODE", "").upper().startswith("SEGM"):
+            return "0"
+        return str(int(float(self.settings['segment_count'])))
+
+    def _segment(self) -> int:
+        return int(float(self.settings['segment_index']))
+
+    def _data(self) -> Response:
+        codes = self._codes()
+        if self._segments_acquired() != "0":
+            # Each segment is the same burst, delayed by a few samples
+            codes = np.roll(codes, self._segment() - 1)
+        if self.data_format == "ASCII":
+            # ASCII data still arrives inside a block header, like the real scope
+            _, _, _, y_inc, y_org, y_ref = self._scaling()
+            volts = (codes.astype(float) - y_ref) * y_inc + y_org
+            return ieee_block(','.join(f"{v:+.6E}" for v in volts).encode('ascii'))
+        if self.data_format == "WORD":
+            order = '<' if self.settings['byteorder'].upper().startswith('LSB') else '>'
+            return ieee_block(codes.astype(codes.dtype.newbyteorder(order)).tobytes())
+        return ieee_block(codes.tobytes())
+
+
+class SpectrumAnalyzerEmulator(EmulatedInstrument):
+    """
+    HP 8563A spectrum analyzer personality.
+
+    Uses the HP-IB style mnemonics of the HP8563A driver. A sweep started
+    with SNGLS takes the configured sweep time; DONE? reports "0" until it
+    has elapsed and TRA? returns the 601-point trace in the format selected
+    with TDF: dBm (P), ASCII measurement units (M), raw big-endian words (B)
+    or an '#A' block of words (A).
+
+    Args:
+        points: Trace points returned by TRA?
+        **kwargs: Latency options passed to EmulatedInstrument
+    """
+
+    idn = "HP8563A"
+    terminator = "\r\n"
+    compound_separator = None
+
+    def __init__(self, points: int = 601, **kwargs):
+        self.points = points
+        self.center = 1e9
+        self.span = 100e6
+        self.sweep_time = 0.05
+        self.continuous = True
+        self._sweep_started = 0.0
+        super().__init__(**kwargs)
+        self.settings.update({"DET": "NRM", "SCAL": "LOG", "RB": "1000000.0",
+                              "VB": "1000000.0", "RL": "0.0", "AT": "10.0",
+                              "LG": "10.0", "TDF": "P"})
+
+    def handlers(self) -> List[Tuple[str, Callable]]:
+        number = r'\s+(?P<value>.+)'
+        return [
+            (r'ID\?', lambda m: self.idn),
+            (r'ERR\?', lambda m: "0"),
+            (r'CF\?', lambda m: f"{self.center:.6E}"),
+            (r'SP\?', lambda m: f"{self.span:.6E}"),
+            (r'FA\?', lambda m: f"{self.center - self.span / 2:.6E}"),
+            (r'FB\?', lambda m: f"{self.center + self.span / 2:.6E}"),
+            (r'ST\?', lambda m: f"{self.sweep_time:.6E}"),
+            (r'CF' + number, lambda m: setattr(self, 'center', parse_number(m.group('value')))),
+            (r'SP' + number, lambda m: setattr(self, 'span', parse_number(m.group('value')))),
+            (r'FA' + number, lambda m: self._set_start(parse_number(m.group('value')))),
+            (r'FB' + number, lambda m: self._set_stop(parse_number(m.group('value')))),
+            (r'ST\s+AUTO.*', lambda m: setattr(self, 'sweep_time', 0.05)),
+            (r'ST' + number, lambda m: setattr(self, 'sweep_time', parse_number(m.group('value')))),
+            (r'TM\?', lambda m: "FREE" if self.continuous else "SNGLS"),
+            (r'SNGLS|TM\s+SNGLS', lambda m: self._start_sweep()),
+            (r'CONTS?|TM\s+FREE', lambda m: self._set_continuous()),
+            (r'DONE\?', lambda m: "1" if self._sweep_done() else "0"),
+            (r'TRA\?', lambda m: self._trace()),
+            (r'IP|ABORT', lambda m: None),
+        ]
+
+    def _set_start(self, start: float):
+        stop = self.center + self.span / 2
+        self.center, self.span = (start + stop) / 2, stop - start
+
+    def _set_stop(self, stop: float):
+        start = self.center - self.span / 2
+        self.center, self.span = (start + stop) / 2, stop - start
+
+    def _start_sweep(self):
+        self.continuous = False
+        self._sweep_started = time.monotonic()
+
+    def _set_continuous(self):
+        self.continuous = True
+
+    def _sweep_done(self) -> bool:
+        return self.continuous or time.monotonic() - self._sweep_started >= self.sweep_time
+
+    def _trace(self) -> Response:
+        # Noise floor with a single carrier in the middle of the span
+        trace = -90.0 + self._rng.normal(0, 1.5, self.points)
+        trace[self.points // 2] = -20.0
+        fmt = self.settings["TDF"].upper()
+        if fmt == "P":
+            return ','.join(f"{v:.2f}" for v in trace)
+
+        # Measurement units: 600 at the reference level, 60 per division
+        reference, log_scale = float(self.settings["RL"]), float(self.settings["LG"])
+        units = np.clip(np.rint(600 + (trace - reference) * 60 / log_scale), 0, 610).astype('>u2')
+        if fmt == "M":
+            return ','.join(str(u) for u in units.tolist())
+        if fmt == "A":
+            return hp_a_block(units.tobytes())
+        return units.tobytes()
+
+
+class SynthesizerEmulator(EmulatedInstrument):
+    """
+    Holzworth HS9000 synthesizer personality.
+
+    Implements the :CHn:FREQ / :CHn:PWR / :CHn:PHASE families, which join
+    values with ':' instead of a space (":CH1:FREQ:2.1GHz").
+
+    Args:
+        channels: Number of synthesizer channels
+        **kwargs: Latency options passed to EmulatedInstrument
+    """
+
+    idn = "Holzworth Instrumentation,HS9004A,EMU0001,1.0"
+    _limits = {
+        "FREQ": (10e6, 6e9),
+        "PWR": (-20.0, 20.0),
+        "PHASE": (0.0, 360.0),
+    }
+
+    def __init__(self, channels: int = 4, **kwargs):
+        self.channels = {
+            n: {"FREQ": 1e9, "PWR": 0.0, "PHASE": 0.0, "PWR:RF": "0",
+                "PWR:MODE": "AUTO", "TEMP": 35.0}
+            for n in range(1, channels + 1)
+        }
+        super().__init__(**kwargs)
+
+    def handlers(self) -> List[Tuple[str, Callable]]:
+        return [
+            (r':CH(\d+):(FREQ|PWR|PHASE):(MIN|MAX)\?', self._limit),
+            (r':CH(\d+):(FREQ|PWR|PHASE|PWR:RF|PWR:MODE|TEMP)\?', self._get),
+            (r':CH(\d+):(FREQ|PWR|PHASE):(?P<value>[-+\d.].*)', self._set_number),
+            (r':CH(\d+):(PWR:RF|PWR:MODE):(?P<value>.+)', self._set_text),
+            *self.setting(":REF", "reference", "INT:100MHz", join=':'),
+            (r':HSX:DIAG:(DONE|ERROR|INFO:BOARDS)', lambda m: "0"),
+            (r':HSX:DIAG:MIN:START', lambda m: None),
+        ]
+
+    def _channel(self, match) -> dict:
+        index = int(match.group(1))
+        if index not in self.channels:
+            return {}
+        return self.channels[index]
+
+    def _limit(self, match) -> str:
+        low, high = self._limits[match.group(2).upper()]
+        return f"{low if match.group(3).upper() == 'MIN' else high:.6E}"
+
+    def _get(self, match) -> str:
+        value = self._channel(match).get(match.group(2).upper(), "Invalid Channel")
+        return f"{value:.6E}" if isinstance(value, float) else str(value)
+
+    def _set_number(self, match):
+        channel = self._channel(match)
+        if channel:
+            key = match.group(2).upper()
+            low, high = self._limits[key]
+            channel[key] = min(max(parse_number(match.group('value')), low), high)
+
+    def _set_text(self, match):
+        channel = self._channel(match)
+        if channel:
+            channel[match.group(2).upper()] = match.group('value').strip()
+
+
+EMULATORS = {
+    "dsox1204g": ScopeEmulator,
+    "hp8563a": SpectrumAnalyzerEmulator,
+    "hs9000": SynthesizerEmulator,
+}
+
+
+class _EmulatorHandler(socketserver.BaseRequestHandler):
+    """Reads newline-terminated messages and writes the instrument's replies."""
+
+    def handle(self):
+        instrument = self.server.instrument
+        terminator = instrument.terminator.encode()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        pending = bytearray()
+        while True:
+            try:
+                data = self.request.recv(65536)
+            except OSError:
+                return
+            if not data:
+                return
+            pending += data
+            while True:
+                end = pending.find(b'\n')
+                if end < 0:
+                    break
+                line = pending[:end].decode('ascii', errors='replace').strip()
+                del pending[:end + 1]
+                try:
+                    responses = instrument.handle(line)
+                    separator = instrument.compound_separator
+                    if separator and len(responses) > 1:
+                        # One reply line per message, binary blocks included
+                        if all(isinstance(r, str) for r in responses):
+                            responses = [separator.join(responses)]
+                        else:
+                            responses = [separator.encode('ascii').join(
+                                r.encode('ascii') if isinstance(r, str) else r for r in responses
+                            )]
+                    for response in responses:
+                        if isinstance(response, str):
+                            response = response.encode('ascii')
+                        self.request.sendall(response + terminator)
+                except OSError:
+                    return
+                except Exception as e:
+                    logger.error(f"Emulator error handling {line!r}: {e}")
+
+
+class _EmulatorTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class EmulatorServer:
+    """
+    Loopback TCP server hosting an emulated instrument.
+
+    Every client connection shares the same instrument state. Use as a
+    context manager, or call start() and stop().
+
+    Args:
+        instrument: The emulated instrument personality
+        host: Interface to listen on
+        port: TCP port (0 picks a free port)
+    """
+
+    def __init__(self, instrument: EmulatedInstrument, host: str = "127.0.0.1", port: int = 0):
+        self.instrument = instrument
+        self._server = _EmulatorTCPServer((host, port), _EmulatorHandler)
+        self._server.instrument = instrument
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def resource(self) -> str:
+        """VISA-style socket resource string for this server."""
+        return f"TCPIP::{self.host}::{self.port}::SOCKET"
+
+    def start(self) -> 'EmulatorServer':
+        """Serve on a background daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name=f"emulator-{self.port}", daemon=True)
+        self._thread.start()
+        logger.debug(f"Emulator {type(self.instrument).__name__} listening on {self.resource}")
+        return self
+
+    def serve_forever(self):
+        """Serve on the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(1.0)
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'EmulatorServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an emulated SCPI instrument over TCP.")
+    parser.add_argument('model', choices=sorted(EMULATORS), help="Instrument personality")
+    parser.add_argument('--host', default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=5025, help="TCP port (0 = any free port)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added per command")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Max random extra seconds per command")
+    parser.add_argument('--points', type=int, help="Waveform / trace points")
+    args = parser.parse_args()
+
+    options = dict(latency=args.latency, jitter=args.jitter)
+    if args.points and args.model != "hs9000":
+        options['points'] = args.points
+    server = EmulatorServer(EMULATORS[args.model](**options), args.host, args.port)
+    print(f"Serving {args.model} on {server.resource} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
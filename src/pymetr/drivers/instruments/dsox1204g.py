@@ -14,6 +14,10 @@ communication is now asynchronous.
 """
 
 import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
 import numpy as np
 
 from pymetr.drivers.base import SCPIInstrument
@@ -25,12 +29,35 @@ from pymetr.drivers.base.properties import (
     SelectProperty,
     ValueProperty,
     DataProperty,
-    DataBlockProperty
+    DataBlockProperty,
+    parse_numbers,
+    scale_codes
 )
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SegmentedWaveform:
+    """
+    All segments of one segmented-memory acquisition.
+
+    Plain arrays rather than Trace models, so thousands of bursts can be
+    analyzed without creating a model per segment.
+
+    Attributes:
+        source: Channel the segments were read from
+        time: Time axis shared by every segment, shape (points,)
+        data: Segment voltages, one row per segment, shape (segments, points)
+        timestamps: Trigger time of each segment relative to the first,
+            shape (segments,)
+    """
+    source: str
+    time: np.ndarray
+    data: np.ndarray
+    timestamps: np.ndarray
+
+
 class Dsox1204g(SCPIInstrument):
     """
     Driver for Keysight DSOX1204G. Demonstrates:
@@ -39,13 +66,17 @@ class Dsox1204g(SCPIInstrument):
      - fetch_trace() example using DataBlockProperty
     """
 
-    def __init__(self, connection):
+    # Acquisition control leaves every cached setting valid
+    cache_preserving_commands = (":DIGitize", ":SINGle", ":RUN", ":STOP")
+
+    def __init__(self, connection, **kwargs):
         """
         Args:
             connection: a ConnectionInterface object 
                         (PyVisaConnection, RawSocketConnection, etc.).
+            **kwargs: Passed to SCPIInstrument (threaded_mode, cache_properties, ...)
         """
-        super().__init__(connection)
+        super().__init__(connection, **kwargs)
 
         self._format = "BYTE"  # Global data format
         self.sources = Sources(['CHAN1', 'CHAN2', 'CHAN3', 'CHAN4'])
@@ -161,6 +192,9 @@ class Dsox1204g(SCPIInstrument):
         2) *OPC? wait or manual check (we can do query_operation_complete here).
         3) read the waveforms for each active channel, build a list of Trace objects, return them.
 
+        Each source costs one round-trip (see _fetch_waveforms), and time axes
+        are reused across channels and acquisitions with the same timebase.
+
         Because of the @trace_thread decorator, the returning data 
         is automatically emitted to `traceDataReady` signal as well.
         """
@@ -170,74 +204,182 @@ class Dsox1204g(SCPIInstrument):
             sources = self.sources.source
 
         traces = []
-        for source in sources:
-            time_vals = self._fetch_time(source)
-            data_vals = self._fetch_data(source)
-            trace_obj = Trace(data_vals, x_data=time_vals, label=source)
-            traces.append(trace_obj)
-
+        for source, (time_vals, data_vals) in zip(sources, self._fetch_waveforms(sources)):
+            traces.append(Trace(time_vals, data_vals, name=source))
         return traces
 
-    def _fetch_time(self, source=None):
+    def _fetch_waveforms(self, sources):
         """
-        Gets the horizontal scale info from the waveform preamble, builds time array.
+        Yield (time, volts) for each source.
+
+        The format settings are checked once per fetch and :WAVeform:FORMat is
+        only written when it differs from self.format; with the property
+        cache enabled the check costs nothing until a setting changes. Each
+        source is then one compound message, ":WAVeform:SOURce <src>;
+        :WAVeform:DATa?;:WAVeform:PREamble?", whose reply is the data block
+        followed by the preamble used to scale it. The source write is
+        recorded as a Waveform.source write, so it keeps the cache intact.
         """
-        if source:
-            self.waveform.source = source
+        dtype = self._prepare_waveform_format()
+        for source in sources:
+            for attempt in range(2):
+                command = f":WAVeform:SOURce {source};:WAVeform:DATa?;:WAVeform:PREamble?"
+                with self._setting_write(self.waveform, Waveform.source, source):
+                    block = self.query_block(command, dtype=np.uint8 if dtype is None else dtype,
+                                             expect_terminator=False)
+                preamble = [float(v) for v in self._read_after_block().split(',')]
+                if int(preamble[0]) == _FORMAT_CODES[self._format] or attempt:
+                    break
+                # The format was changed behind our back; set it and read again
+                dtype = self._prepare_waveform_format()
+
+            if dtype is None:
+                data = parse_numbers(block.tobytes().decode('ascii'), np.float64)
+            else:
+                data = scale_codes(block, preamble[7], preamble[8], preamble[9])
+            yield self._time_axis(preamble, len(data)), data
+
+    def _read_after_block(self) -> str:
+        """
+        Read the rest of a compound reply that follows a binary block.
 
-        try:
-            preamble = self.waveform.preamble
-            self._x_increment, self._x_origin, self._x_reference = preamble[4], preamble[5], int(preamble[6])
-            self._y_increment, self._y_origin, self._y_reference = preamble[7], preamble[8], int(preamble[9])
-            self.waveform.format = self._format
-
-            count_points = self.waveform.points
-            timestamps = (np.arange(count_points) - self._x_reference) * self._x_increment + self._x_origin
-            return timestamps
-        except Exception as e:
-            raise ValueError(f"Issue fetching or parsing preamble: {e}")
-
-    def _fetch_data(self, source=None):
+        The block is read with expect_terminator=False, so the reply continues
+        with the ';' separating it from the next query's response.
         """
-        Fetch raw data from self.waveform.data, convert if binary, etc.
+        reply = self.read()
+        if not reply.startswith(';'):
+            raise ValueError(f"Expected ';' after the binary block, got {reply[:16]!r}")
+        return reply[1:]
+
+    # ------------------------------------------------
+    # Segmented memory
+    # ------------------------------------------------
+    def acquire_segments(self, segments: int, source: str = "CHAN1") -> SegmentedWaveform:
         """
-        if source:
-            self.waveform.source = source
+        Capture a burst of trigger events in segmented memory and read it back.
 
-        self.waveform.format = self.format
-        is_unsigned = self.waveform.unsigned
+        Switches the acquisition to segmented mode with the given segment
+        count, digitizes the source, waits for *OPC? and returns
+        read_segments(). The acquisition stays in segmented mode afterwards.
 
-        if self._format in ["BYTE", "WORD"]:
-            # e.g. 'B' vs 'b' for data_type
-            data_type = 'B' if is_unsigned else 'b'
-            self.data_type = data_type
-            self.data_mode = "BINARY"
-        else:
-            self.data_type = 'B'
-            self.data_mode = "ASCII"
+        Args:
+            segments: Number of trigger events to capture
+            source: Channel to digitize
 
-        # read the raw data
-        raw_data = self.waveform.data
+        Returns:
+            SegmentedWaveform with data shaped (segments, points)
+        """
+        with self.batch():
+            self.acquire.mode = "SEGMented"
+            self.acquire.segment_count = segments
+        self.write(f":DIGitize {source}")
+        self.query_operation_complete()
+        return self.read_segments(source)
 
-        # Convert if binary:
-        if self._format in ["BYTE", "WORD"]:
-            voltages = (raw_data - self._y_reference) * self._y_increment + self._y_origin
-        elif self._format == "ASCII":
-            voltages = raw_data
-        else:
-            raise ValueError(f"Unsupported data format: {self.format}")
+    def read_segments(self, source: str = "CHAN1") -> SegmentedWaveform:
+        """
+        Read every segment of the current segmented acquisition.
 
-        return voltages
+        One compound query reads the segment count and preamble. After that,
+        each segment is one message, ":ACQuire:SEGMented:INDex <n>;
+        :WAVeform:DATa?;:WAVeform:SEGMented:TTAG?", recorded as an
+        Acquire.segment_index write. Its block is copied
+        into a preallocated (segments, points) code array, which is scaled
+        to volts in one pass at the end.
+
+        Args:
+            source: Channel to read
+
+        Returns:
+            SegmentedWaveform with data shaped (segments, points)
+        """
+        if self._format == "ASCII":
+            raise ValueError("Segmented transfers need the BYTE or WORD format")
+        dtype = self._prepare_waveform_format()
+
+        with self._setting_write(self.waveform, Waveform.source, source):
+            reply = self.query(f":WAVeform:SOURce {source};:WAVeform:SEGMented:COUNt?;:WAVeform:PREamble?")
+        count, _, preamble = reply.partition(';')
+        count = int(float(count))
+        preamble = [float(v) for v in preamble.split(',')]
+        logger.debug(f"Reading {count} segments of {source}")
+
+        codes = None
+        timestamps = np.empty(count, dtype=np.float64)
+        for row in range(count):
+            with self._setting_write(self.acquire, Acquire.segment_index, row + 1):
+                block = self.query_block(
+                    f":ACQuire:SEGMented:INDex {row + 1};:WAVeform:DATa?;:WAVeform:SEGMented:TTAG?",
+                    dtype=dtype, expect_terminator=False
+                )
+            timestamps[row] = float(self._read_after_block())
+            if codes is None:
+                codes = np.empty((count, len(block)), dtype=block.dtype)
+            codes[row] = block
+
+        if codes is None:
+            codes = np.empty((0, int(preamble[2])), dtype=dtype)
+        data = scale_codes(codes, preamble[7], preamble[8], preamble[9])
+        return SegmentedWaveform(source, self._time_axis(preamble, codes.shape[1]), data, timestamps)
+
+    @contextmanager
+    def _setting_write(self, owner, prop, value):
+        """
+        Record a setting sent at the head of a compound query as a property write.
+
+        The property cache keeps its other entries and stores value for prop
+        once the message has been sent.
+        """
+        try:
+            with self.property_write(owner, prop):
+                yield
+        except Exception:
+            self.property_cache.discard(owner, prop)
+            raise
+        self.property_cache.store(owner, prop, value)
+
+    def _prepare_waveform_format(self) -> Optional[np.dtype]:
+        """Make :WAVeform:FORMat match self.format and return its block dtype."""
+        waveform = self.waveform
+        fmt, byte_order, unsigned = self.query_properties([
+            (waveform, Waveform.format),
+            (waveform, Waveform.byte_order),
+            (waveform, Waveform.unsigned),
+        ])
+        if fmt != self._format:
+            waveform.format = self._format
+        self.data_mode = "ASCII" if self._format == "ASCII" else "BINARY"
+        return _block_dtype(self._format, byte_order, unsigned)
+
+    def _time_axis(self, preamble, points: int) -> np.ndarray:
+        """
+        Time values for a preamble, cached in self.x_data.
+
+        Keyed by x increment, origin, reference and point count, so channels
+        of one acquisition and repeated acquisitions share one read-only array.
+        """
+        x_increment, x_origin, x_reference = preamble[4], preamble[5], preamble[6]
+        key = (x_increment, x_origin, x_reference, points)
+        timestamps = self.x_data.get(key)
+        if timestamps is None:
+            if len(self.x_data) >= 8:
+                self.x_data.clear()
+            timestamps = (np.arange(points) - x_reference) * x_increment + x_origin
+            timestamps.flags.writeable = False
+            self.x_data[key] = timestamps
+        return timestamps
 
 
 # ---------------------------------------------------------------------------
 # Subsystems
 # ---------------------------------------------------------------------------
 class Acquire(Subsystem):
-    mode         = SelectProperty(":MODE", ['RTIMe', 'SEGMmented'], "Acquisition mode")
+    mode         = SelectProperty(":MODE", ['RTIMe', 'SEGMented'], "Acquisition mode")
     type         = SelectProperty(":TYPE", ['NORMal','AVERage','HRESolution','PEAK'], "Acq type")
     sample_rate  = ValueProperty(":SRATe",  type="float", range=[0.1, 1e9], units="S/s", doc_str="Sample rate")
     count        = ValueProperty(":COUNt", type="int",   range=[1, 10000],  doc_str="Averaging count / acquisitions")
+    segment_count = ValueProperty(":SEGMented:COUNt", type="int", range=[2, 1000], doc_str="Segments per segmented acquisition")
+    segment_index = ValueProperty(":SEGMented:INDex", type="int", range=[1, 1000], doc_str="Segment shown and transferred")
 
 class Channel(Subsystem):
     coupling = SelectProperty(":COUPling", ['AC', 'DC'], "Channel coupling")
@@ -267,6 +409,41 @@ class WaveGen(Subsystem):
     amplitude  = ValueProperty(":VOLT",  type="float", range=[1e-3,10],  units="V",  doc_str="Wavegen amplitude")
     offset     = ValueProperty(":VOLT:OFFS",type="float",range=[-5,5],   units="V",  doc_str="Wavegen offset")
 
+# Format field (first value) of the :WAVeform:PREamble? reply
+_FORMAT_CODES = {"BYTE": 0, "WORD": 1, "ASCII": 4}
+
+
+def _block_dtype(fmt: Optional[str], byte_order: Optional[str], unsigned) -> Optional[np.dtype]:
+    """
+    Block dtype for a waveform format, byte order and signedness.
+
+    Returns None for ASCII, whose blocks hold comma-separated values in volts.
+    """
+    fmt = (fmt or "BYTE").upper()
+    if fmt.startswith("ASC"):
+        return None
+    kind = 'u' if unsigned else 'i'
+    if fmt.startswith("WORD"):
+        order = '<' if (byte_order or "").upper().startswith("LSB") else '>'
+        return np.dtype(f"{order}{kind}2")
+    return np.dtype(f"{kind}1")
+
+
+def _waveform_dtype(waveform) -> Optional[np.dtype]:
+    """Block dtype for the scope's current :WAVeform settings (one compound query)."""
+    return _block_dtype(*waveform.instr.query_properties([
+        (waveform, Waveform.format),
+        (waveform, Waveform.byte_order),
+        (waveform, Waveform.unsigned),
+    ]))
+
+
+def _waveform_scale(waveform) -> Tuple[float, float, float]:
+    """(y increment, y origin, y reference) from the waveform preamble."""
+    preamble = waveform.preamble
+    return float(preamble[7]), float(preamble[8]), float(preamble[9])
+
+
 class Waveform(Subsystem):
     source       = SelectProperty(":SOURce", ['CHAN1','CHAN2','CHAN3','CHAN4','FUNC','MATH','FFT','WMEM','BUS1','BUS2','EXT'], "Waveform src")
     format       = SelectProperty(":FORMat", ['ASCII','WORD','BYTE'],  "Waveform data fmt")
@@ -281,4 +458,7 @@ class Waveform(Subsystem):
     y_origin     = DataProperty(":YORigin",     doc_str="Waveform Y origin")
     y_reference  = DataProperty(":YREFerence",  doc_str="Waveform Y ref")
     preamble     = DataProperty(":PREamble", access='read', doc_str="Pre info")
-    data         = DataBlockProperty(":DATa",   access='read', ieee_header=True, doc_str="Waveform data array")
+    data         = DataBlockProperty(":DATa",   access='read', ieee_header=True, dtype=_waveform_dtype,
+                                     doc_str="Waveform data array (raw codes)")
+    voltage      = DataBlockProperty(":DATa",   access='read', ieee_header=True, dtype=_waveform_dtype,
+                                     scale=_waveform_scale, doc_str="Waveform data in volts")
@@ -5,14 +5,18 @@ HP 8563A Spectrum Analyzer Driver with improved non-blocking trace acquisition
 """
 
 import logging
+import time
 from enum import Enum
+from typing import Optional
+
 import numpy as np
 
-from pymetr.drivers.base.subsystem import Subsystem
-from pymetr.drivers.base.scpi_instrument import SCPIInstrument
+from pymetr.drivers.base import SCPIInstrument
+from pymetr.drivers.base import Subsystem
 from pymetr.drivers.base.properties import (
-    ValueProperty, SelectProperty, SwitchProperty, DataProperty
+    ValueProperty, SelectProperty, SwitchProperty, DataProperty, DataBlockProperty, scale_codes
 )
+from pymetr.models import Trace
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,12 @@ class DetectorMode(Enum):
     NEGATIVE = "NEG"
     SAMPLE = "SMP"
 
+class TraceFormat(Enum):
+    REAL = "P"          # ASCII amplitudes in dBm
+    MEASUREMENT = "M"   # ASCII measurement units
+    BINARY = "B"        # Two-byte words ended by EOI only
+    A_BLOCK = "A"       # Two-byte words in an '#A' block
+
 class FrequencySubsystem(Subsystem):
     """Frequency control subsystem"""
     center = ValueProperty("CF", type="float", doc_str="Center freq (e.g. '1GHz')")
@@ -45,6 +55,7 @@ class AmplitudeSubsystem(Subsystem):
     reference_level = ValueProperty("RL", type="float", range=(-139.9, 30), units="dBm", doc_str="Reference level")
     attenuation = ValueProperty("AT", type="float", range=(0, 70), units="dB", doc_str="Input attenuation")
     scale_type = SelectProperty("SCAL", ["LIN", "LOG"], doc_str="Amplitude scale type")
+    log_scale = ValueProperty("LG", type="float", range=(0, 20), units="dB", doc_str="Log scale per division")
 
 class BandwidthSubsystem(Subsystem):
     """Resolution and video bandwidth control"""
@@ -61,8 +72,33 @@ class SweepSubsystem(Subsystem):
 class TraceSubsystem(Subsystem):
     """Trace data and display control"""
     detector = SelectProperty("DET", DetectorMode, doc_str="Trace detector mode")
+    format = SelectProperty("TDF", TraceFormat, doc_str="Trace data format")
     data = DataProperty("TRA", access='read', doc_str="Trace A data (601 points)", 
                        container=np.array, converter=float, separator=',', terminator='\r\n')
+    codes = DataBlockProperty("TRA", access='read', dtype='>u2',
+                              doc_str="Trace A in measurement units (TDF A)")
+
+
+def measurement_units_to_amplitude(units: np.ndarray, reference_level: float,
+                                   log_scale: float) -> np.ndarray:
+    """
+    Convert trace measurement units to amplitudes.
+
+    The top graticule line is 600 units and a division is 60 units, so log
+    traces come back in dBm and linear traces in volts (50 ohm).
+
+    Args:
+        units: Measurement units read with TDF M, B or A
+        reference_level: Reference level in dBm
+        log_scale: Log scale in dB per division, 0 for linear scale
+
+    Returns:
+        np.ndarray: float64 amplitudes
+    """
+    if log_scale > 0:
+        return scale_codes(units, log_scale / 60, reference_level, 600)
+    reference_volts = np.sqrt(50 * 1e-3 * 10 ** (reference_level / 10))
+    return scale_codes(units, reference_volts / 600, 0.0, 0)
 
 class HP8563A(SCPIInstrument):
     """
@@ -73,11 +109,23 @@ class HP8563A(SCPIInstrument):
     - Resolution and video bandwidth
     - Reference level and attenuation
     - Sweep and trigger controls
-    - Non-blocking trace data acquisition
+    - Binary trace transfer and sweep-time-aware completion
+
+    Args:
+        connection: Connection to the analyzer
+        binary_transfer: Read traces as '#A' blocks of measurement units
+            (1.2 kB) instead of ASCII dBm values
+        **kwargs: Passed to SCPIInstrument (threaded_mode, cache_properties, ...)
     """
 
-    def __init__(self, connection):
-        super().__init__(connection)
+    # HP-IB mnemonics answer each query on its own line, so no compound queries
+    compound_max_length = 0
+
+    # Seconds beyond the sweep time before a sweep is reported as lost
+    sweep_timeout_margin = 2.0
+
+    def __init__(self, connection, binary_transfer: bool = True, **kwargs):
+        super().__init__(connection, **kwargs)
         logger.debug("Initializing HP8563A Spectrum Analyzer Driver")
 
         # Build subsystems
@@ -90,69 +138,119 @@ class HP8563A(SCPIInstrument):
         logger.debug("Subsystems initialized successfully")
 
         # Initialize state
+        self.binary_transfer = binary_transfer
+        self._trace_format: Optional[TraceFormat] = None
         self._sweep_in_progress = False
         self._sweep_complete = False
+        self._sweep_started = 0.0
+        self._sweep_time = 0.0
 
     def fetch_trace(self):
         """
-        Start trace acquisition and emit signal when complete.
-        Uses non-blocking reads to prevent UI blocking.
+        Take a sweep and return trace A.
+
+        The sweep parameters are read while the analyzer sweeps, and DONE? is
+        only polled once the queried sweep time has elapsed. In continuous
+        mode the next sweep is started as soon as the trace has been read, so
+        it runs while this one is decoded and handed to the caller.
+
+        Returns:
+            List[Trace]: The trace, in dBm on log scale
         """
         try:
             logger.debug("Starting trace acquisition")
-            
-            # Clear any previous sweep state
-            self._sweep_in_progress = False
-            self._sweep_complete = False
-            
-            # Put in single sweep mode and start sweep
-            self.sweep.trigger_mode = TriggerMode.SINGLE
-            self.write("SNGLS")
-            self._sweep_in_progress = True
-            
-            # Get sweep parameters using property system
+            if not (self.continuous_mode and self._sweep_in_progress):
+                self._start_sweep()
+
             start_freq = self.frequency.start
             stop_freq = self.frequency.stop
-            sweep_time = self.sweep.time
-            
-            # Now read the trace data - this will use our non-blocking read implementation
-            amp_data = self.trace.data
-            
-            # Create frequency axis
+            if self.binary_transfer:
+                reference_level = self.amplitude.reference_level
+                log_scale = self.amplitude.log_scale
+
+            self.wait_for_sweep()
+            self._select_trace_format(TraceFormat.A_BLOCK if self.binary_transfer else TraceFormat.REAL)
+            raw_data = self.trace.codes if self.binary_transfer else self.trace.data
+
+            if self.continuous_mode:
+                self._start_sweep()
+
+            if self.binary_transfer:
+                amp_data = measurement_units_to_amplitude(raw_data, reference_level, log_scale)
+            else:
+                amp_data = raw_data
             freq_points = len(amp_data)
             freq_axis = np.linspace(start_freq, stop_freq, freq_points)
-            
-            # Emit the data
+
             self.traceDataReady.emit(freq_axis, amp_data)
             logger.debug(f"Emitted trace data: {freq_points} points")
-            
-            self._sweep_complete = True
-            self._sweep_in_progress = False
-            
-            return freq_axis, amp_data
-        
+            return [Trace(freq_axis, amp_data, name="TRA")]
+
         except Exception as e:
             self._sweep_in_progress = False
             logger.error(f"Error in fetch_trace: {e}")
             self.exceptionOccured.emit(str(e))
             raise
 
+    def _start_sweep(self):
+        """Start a single sweep and note when it should end."""
+        self._sweep_time = self.sweep.time
+        self.write("SNGLS")
+        self._sweep_started = time.monotonic()
+        self._sweep_in_progress = True
+        self._sweep_complete = False
+
+    def _select_trace_format(self, trace_format: TraceFormat):
+        """Send TDF only when the format differs from the last one written."""
+        if self._trace_format is not trace_format:
+            self.trace.format = trace_format
+            self._trace_format = trace_format
+
+    def wait_for_sweep(self, timeout: Optional[float] = None):
+        """
+        Wait for the sweep started by fetch_trace() or single_sweep().
+
+        Waits out the sweep time first, then polls DONE? at a fraction of
+        the sweep time, so a sweep usually costs a single status query. On
+        the GUI thread the waits keep the event loop running (see pause()).
+
+        Args:
+            timeout: Seconds allowed beyond the sweep time (default:
+                sweep_timeout_margin)
+
+        Raises:
+            TimeoutError: If DONE? does not report completion in time
+            Exception: Any error raised by the DONE? query
+        """
+        if not self._sweep_in_progress:
+            return
+        sweep_end = self._sweep_started + self._sweep_time
+        deadline = sweep_end + (self.sweep_timeout_margin if timeout is None else timeout)
+        interval = min(max(self._sweep_time / 20, 0.001), 0.05)
+        try:
+            self.pause(sweep_end - time.monotonic())
+            while not self._poll_sweep_done():
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Sweep not complete {self._sweep_time:.3g} s after SNGLS")
+                self.pause(interval)
+        except Exception:
+            self._sweep_in_progress = False
+            raise
+
+    def _poll_sweep_done(self) -> bool:
+        """Query DONE? for a sweep in progress; errors propagate."""
+        if self._sweep_in_progress and self.query("DONE?").strip() == "1":
+            self._sweep_in_progress = False
+            self._sweep_complete = True
+        return self._sweep_complete
+
     def is_sweep_complete(self) -> bool:
         """Check if the current sweep operation is complete."""
-        if not self._sweep_in_progress:
-            return self._sweep_complete
-            
         try:
-            # Check sweep status
-            response = self.query("DONE?")
-            if response.strip() == "1":
-                self._sweep_in_progress = False
-                self._sweep_complete = True
-                
+            return self._poll_sweep_done()
         except Exception as e:
             logger.error(f"Error checking sweep status: {e}")
             self._sweep_in_progress = False
-            
         return self._sweep_complete
 
     def abort_sweep(self):
@@ -169,10 +267,7 @@ class HP8563A(SCPIInstrument):
         """Initiates a single sweep."""
         logger.debug("Initiating single sweep")
         try:
-            self.sweep.trigger_mode = TriggerMode.SINGLE
-            self.write("SNGLS")
-            self._sweep_in_progress = True
-            self._sweep_complete = False
+            self._start_sweep()
         except Exception as e:
             logger.error(f"Error initiating single sweep: {e}")
             raise
@@ -194,6 +289,7 @@ class HP8563A(SCPIInstrument):
         logger.debug("Presetting instrument to default state")
         try:
             self.write("IP")
+            self._trace_format = None
             self._sweep_in_progress = False
             self._sweep_complete = False
         except Exception as e:
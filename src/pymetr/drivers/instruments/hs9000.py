@@ -48,8 +48,8 @@ class Channel(Subsystem):
     """
     # Frequency settings with unit suffixes
     frequency = ValueProperty(":FREQ", type="float", range=(10e6, 6e9), units="Hz", doc_str="Channel output frequency", join_char=":")
-    freq_min = DataProperty(":FREQ:MIN", access='read', doc_str="Min freq for this channel", join_char=":")
-    freq_max = DataProperty(":FREQ:MAX", access='read', doc_str="Max freq for this channel", join_char=":")
+    freq_min = DataProperty(":FREQ:MIN", access='read', doc_str="Min freq for this channel", join_char=":", cache="immutable")
+    freq_max = DataProperty(":FREQ:MAX", access='read', doc_str="Max freq for this channel", join_char=":", cache="immutable")
 
     # Power settings
     power = ValueProperty(":PWR", type="float", range=(-20, 20), units="dBm",doc_str="Channel output power", join_char=":")
@@ -61,7 +61,7 @@ class Channel(Subsystem):
     phase_max = DataProperty(":PHASE:MAX", access='read', doc_str="Max phase for current freq", join_char=":")
 
     # Temperature monitoring
-    temperature = DataProperty(":TEMP", access='read', converter="float", doc_str="Channel temperature in °C", join_char=":")
+    temperature = DataProperty(":TEMP", access='read', converter=float, doc_str="Channel temperature in °C", join_char=":")
 
 class Reference(Subsystem):
     """
@@ -1,98 +1,253 @@
 """
 Registry mapping instrument model numbers to their driver implementations.
+
+Drivers are registered as lightweight metadata: the model patterns they
+serve, their module and class names, the interfaces they support and a
+default socket port. Nothing is imported until a driver class is asked
+for, normally when a matching device connects.
+
+Third-party packages add drivers through the ``pymetr.drivers`` entry-point
+group. The entry-point name is a model pattern and the value names the
+driver class, for example in pyproject.toml::
+
+    [project.entry-points."pymetr.drivers"]
+    "N9020*" = "acme_pymetr.mxa:N9020"
+
+Entry points are read once, on the first lookup, and may override the
+built-in drivers. Model patterns use shell-style wildcards ("HS90*",
+"DSOX12?4G") and are matched case-insensitively; exact models resolve with
+a dictionary lookup and wildcard results are memoized per model.
 """
 
-from typing import Dict
-
-DRIVER_REGISTRY: Dict[str, Dict[str, str]] = {
-    "HP8563A": {
-        "module": "drivers.hp8563a",
-        "class": "HP8563A"
-    },
-    "HP8564E": {
-        "module": "drivers.hp8564e",
-        "class": "HP8564E"
-    },
-    "HP8657B": {
-        "module": "drivers.hp8657b",
-        "class": "HP8657B"
-    },
-    "HP437B": {
-        "module": "drivers.hp437b",
-        "class": "HP437B"
-    },
-    "HS9001B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9002B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9003B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9004B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9005B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9006B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9007B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9008B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9009B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9010B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9011B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9012B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9013B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9014B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9015B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    },
-    "HS9016B": {
-        "module": "drivers.hs9000.py",
-        "class": "HS9000"
-    }
-    # Add more models as needed
-}
-
-def get_driver_info(model: str) -> Dict[str, str]:
+import fnmatch
+import importlib
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from importlib import metadata
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "pymetr.drivers"
+
+
+class ConnectionType(Enum):
+    """Known connection interface types"""
+    VISA = auto()
+    SOCKET = auto()
+    SERIAL = auto()
+
+
+@dataclass
+class DriverInfo:
+    """Driver configuration information"""
+    module: str                                      # Driver module path
+    class_name: str                                 # Driver class name
+    interfaces: List[ConnectionType] = field(default_factory=lambda: [ConnectionType.VISA])
+    socket_port: Optional[int] = None              # Default socket port if applicable
+    discovery_config: Optional[Dict[str, Any]] = None  # Discovery protocol config
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Driver info in the {'module', 'class', ...} form used by Device."""
+        return {
+            'module': self.module,
+            'class': self.class_name,
+            'interfaces': [interface.name for interface in self.interfaces],
+            'socket_port': self.socket_port,
+            'discovery_config': self.discovery_config,
+        }
+
+
+class DriverRegistry:
+    """
+    Thread-safe registry of driver metadata with lazy driver imports.
+
+    Args:
+        load_entry_points: Read the ``pymetr.drivers`` entry points on the
+            first lookup
+    """
+
+    def __init__(self, load_entry_points: bool = True):
+        self._exact: Dict[str, DriverInfo] = {}
+        self._patterns: Dict[str, DriverInfo] = {}
+        self._pattern_regex: Optional[re.Pattern] = None
+        self._pattern_infos: List[DriverInfo] = []
+        self._resolved: Dict[str, Optional[DriverInfo]] = {}
+        self._classes: Dict[tuple, Type] = {}
+        self._lock = threading.RLock()
+        self._entry_points_loaded = not load_entry_points
+
+    def register(self, models: Union[str, Iterable[str]], info: DriverInfo) -> None:
+        """
+        Register a driver for one or more model patterns.
+
+        Later registrations win over earlier ones for the same pattern, and
+        exact models win over wildcard patterns.
+
+        Args:
+            models: Model number or shell-style pattern(s)
+            info: Driver metadata
+        """
+        if isinstance(models, str):
+            models = [models]
+        with self._lock:
+            for model in models:
+                model = model.upper()
+                if any(char in model for char in "*?["):
+                    self._patterns.pop(model, None)  # re-insert so it is tried first
+                    self._patterns[model] = info
+                    self._pattern_regex = None
+                else:
+                    self._exact[model] = info
+                logger.debug(f"Registered driver {info.module}.{info.class_name} for {model}")
+            self._resolved.clear()
+
+    def resolve(self, model: str) -> Optional[DriverInfo]:
+        """
+        Find the driver metadata for a model without importing anything.
+
+        Args:
+            model: Model number as reported by the instrument
+
+        Returns:
+            Optional[DriverInfo]: The driver, or None if no pattern matches
+        """
+        key = model.strip().upper()
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        self._load_entry_points()
+        with self._lock:
+            info = self._exact.get(key)
+            if info is None and self._patterns:
+                if self._pattern_regex is None:
+                    self._compile_patterns()
+                match = self._pattern_regex.match(key)
+                if match:
+                    info = self._pattern_infos[int(match.lastgroup[1:])]
+            self._resolved[key] = info
+        return info
+
+    def get_driver_info(self, model: str) -> DriverInfo:
+        """
+        Get the driver metadata for a model.
+
+        Raises:
+            ValueError: If no driver is registered for the model
+        """
+        info = self.resolve(model)
+        if info is None:
+            raise ValueError(f"No driver registered for model: {model}")
+        return info
+
+    def load_driver_class(self, model: str) -> Type:
+        """
+        Import and return the driver class for a model.
+
+        Raises:
+            ValueError: If no driver is registered for the model
+            ImportError, AttributeError: If the driver cannot be loaded
+        """
+        info = self.get_driver_info(model)
+        key = (info.module, info.class_name)
+        driver_class = self._classes.get(key)
+        if driver_class is None:
+            module = importlib.import_module(info.module)
+            driver_class = getattr(module, info.class_name)
+            self._classes[key] = driver_class
+            logger.debug(f"Loaded driver {info.module}.{info.class_name}")
+        return driver_class
+
+    def is_loaded(self, model: str) -> bool:
+        """Whether the driver class for a model has been imported already."""
+        info = self.resolve(model)
+        return info is not None and (info.module, info.class_name) in self._classes
+
+    def models(self) -> List[str]:
+        """All registered model numbers and patterns."""
+        self._load_entry_points()
+        with self._lock:
+            return list(self._exact) + list(self._patterns)
+
+    def _compile_patterns(self):
+        """Build one alternation over all wildcard patterns, newest first."""
+        patterns = list(reversed(self._patterns.items()))
+        self._pattern_infos = [info for _, info in patterns]
+        self._pattern_regex = re.compile("|".join(
+            f"(?P<p{index}>{fnmatch.translate(pattern)})"
+            for index, (pattern, _) in enumerate(patterns)
+        ))
+
+    def _load_entry_points(self):
+        """Register third-party drivers from entry points, once."""
+        if self._entry_points_loaded:
+            return
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+            try:
+                found = metadata.entry_points()
+                entry_points = (found.select(group=ENTRY_POINT_GROUP) if hasattr(found, 'select')
+                                else found.get(ENTRY_POINT_GROUP, []))
+            except Exception as e:
+                logger.warning(f"Could not read driver entry points: {e}")
+                return
+            for entry_point in entry_points:
+                module, _, class_name = entry_point.value.partition(':')
+                if not class_name:
+                    logger.warning(f"Ignoring driver entry point {entry_point.name!r}: "
+                                   f"expected 'module:Class', got {entry_point.value!r}")
+                    continue
+                self.register(entry_point.name, DriverInfo(
+                    module=module.strip(),
+                    class_name=class_name.strip(),
+                    interfaces=[ConnectionType.VISA, ConnectionType.SOCKET],
+                ))
+
+
+def _register_builtin_drivers(registry: DriverRegistry):
+    """Register the drivers shipped with pymetr."""
+    registry.register(["DSOX1204G", "DSO-X 1204G"], DriverInfo(
+        module="pymetr.drivers.instruments.dsox1204g",
+        class_name="Dsox1204g",
+        interfaces=[ConnectionType.VISA, ConnectionType.SOCKET],
+        socket_port=5025,
+    ))
+    registry.register("HP8563A", DriverInfo(
+        module="pymetr.drivers.instruments.hp8563a",
+        class_name="HP8563A",
+        interfaces=[ConnectionType.VISA],
+    ))
+    registry.register("HS90*", DriverInfo(
+        module="pymetr.drivers.instruments.hs9000",
+        class_name="HS9000",
+        interfaces=[ConnectionType.VISA, ConnectionType.SOCKET],
+        socket_port=9760,
+        discovery_config={
+            "udp_port": 30303,
+            "protocol": "MICROCHIP"
+        }
+    ))
+
+
+DRIVER_REGISTRY = DriverRegistry()
+_register_builtin_drivers(DRIVER_REGISTRY)
+
+
+def get_driver_info(model: str) -> Dict[str, Any]:
     """
     Get driver module and class information for a given model.
     Raises ValueError if model not found.
     """
-    if model not in DRIVER_REGISTRY:
-        raise ValueError(f"No driver registered for model: {model}")
-    return DRIVER_REGISTRY[model]
\ No newline at end of file
+    return DRIVER_REGISTRY.get_driver_info(model).as_dict()
+
+
+def load_driver_class(model: str) -> Type:
+    """Import and return the driver class registered for a model."""
+    return DRIVER_REGISTRY.load_driver_class(model)
@@ -3,6 +3,7 @@ Data models for PyMetr
 """
 
 from .base import BaseModel
+from .lite import LiteModel
 from .cursor import Cursor
 from .device import Device, AcquisitionMode
 from .marker import Marker
@@ -24,7 +25,7 @@ from .analysis_dual import DualTraceAnalysis, TraceMath, CrossCorrelation, Cross
 
 __all__ = [
     # Base
-    "BaseModel",
+    "BaseModel", "LiteModel",
     # Core models
     "Cursor", "Device", "Marker", "Measurement", "Plot", "DataTable", "Trace",
     # Test models
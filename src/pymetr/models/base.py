@@ -1,13 +1,134 @@
 # pymetr/models/base.py
 from PySide6.QtCore import QObject, Signal
-from typing import Optional, Any
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Dict, Optional
 import uuid
 import pandas as pd
 from pymetr.core.logging import logger
 
-class BaseModel(QObject):
+# Values cheap and safe to compare before emitting; anything else (arrays,
+# DataFrames, lists, dicts) is treated as changed and versioned instead.
+_SCALAR_TYPES = (str, int, float, bool, complex, type(None), Enum)
+
+
+def _is_scalar(value: Any) -> bool:
+    """True for scalars and tuples of scalars."""
+    if isinstance(value, tuple):
+        return all(isinstance(item, _SCALAR_TYPES) for item in value)
+    return isinstance(value, _SCALAR_TYPES)
+
+
+class ModelProperties:
+    """
+    Property storage, change detection and batching shared by all models.
+
+    Subclasses provide the storage attributes (_properties, _versions,
+    _batch_depth, _pending_updates) and deliver notifications in
+    _notify_change() and _notify_changes().
+    """
+
+    __slots__ = ()
+
+    def set_property(self, name: str, value: object) -> None:
+        """
+        Store a property value and notify listeners of the change.
+
+        Scalars (and tuples of scalars) equal to the current value are
+        ignored. Arrays, DataFrames and other containers are never compared:
+        every assignment counts as a change and bumps the property version.
+        Inside begin_update()/end_update() the change is held back and
+        emitted with the rest of the batch.
+        """
+        if _is_scalar(value) and name in self._properties:
+            current = self._properties[name]
+            if type(current) is type(value) and current == value:
+                return
+
+        # If it's a DataFrame, store a copy so we don't accidentally mutate the original
+        if isinstance(value, pd.DataFrame):
+            self._properties[name] = value.copy()
+        else:
+            self._properties[name] = value
+        if self._versions is None:
+            self._versions = {}
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+        if self._batch_depth:
+            # Keep the latest value, ordered by last change
+            self._pending_updates.pop(name, None)
+            self._pending_updates[name] = value
+            return
+        self._notify_change(name, value)
+
+    def get_property(self, prop: str, default: Any = None) -> Any:
+        """Get a property value with optional default."""
+        return self._properties.get(prop, default)
+
+    def get_property_version(self, prop: str) -> int:
+        """
+        Number of changes stored for a property (0 if never set after creation).
+
+        Views can compare versions instead of comparing array or DataFrame
+        values to find out whether they are up to date.
+        """
+        return self._versions.get(prop, 0) if self._versions else 0
+
+    def begin_update(self) -> None:
+        """Begin batch update mode; batches may be nested."""
+        if self._pending_updates is None:
+            self._pending_updates = {}
+        self._batch_depth += 1
+
+    def end_update(self) -> None:
+        """End batch update mode and emit changes once the outermost batch ends."""
+        if self._batch_depth == 0:
+            logger.warning(f"end_update() without begin_update() on {self.id}")
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._process_pending_updates()
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Group property changes into one notification.
+
+        Example:
+            with trace.batch_update():
+                trace.color = "red"
+                trace.width = 2
+        """
+        self.begin_update()
+        try:
+            yield self
+        finally:
+            self.end_update()
+
+    def _process_pending_updates(self) -> None:
+        """Deliver the batched changes: one change, or one grouped change for several."""
+        if not self._pending_updates:
+            return
+
+        changes = self._pending_updates
+        self._pending_updates = {}
+        if len(changes) == 1:
+            (prop, value), = changes.items()
+            self._notify_change(prop, value)
+        else:
+            self._notify_changes(changes)
+
+    def _notify_change(self, prop: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def _notify_changes(self, changes: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class BaseModel(QObject, ModelProperties):
     # Updated signal to include model_type
     property_changed = Signal(str, str, str, object)  # model_id, model_type, property, value
+    properties_changed = Signal(str, str, object)     # model_id, model_type, {property: value}
     child_added = Signal(str, str)              # parent_id, child_id
 
     def __init__(self, model_type: str, state=None, model_id: Optional[str] = None, name: Optional[str] = None):
@@ -23,18 +144,18 @@ class BaseModel(QObject):
         object_name = f"{safe_name}_{self._id}"
         self.setObjectName(object_name)  # Set QObject name
         
-        self._properties = {}
+        # Store both name and objectName as properties. Initial values need
+        # no notification: nothing can be listening to the model yet.
+        self._properties = {'name': self._name, 'objectName': object_name}
+        self._versions = {}
         self._children = {}
         self._connections = []
-        self._batch_mode = False
+        self._batch_depth = 0
         self._pending_updates = {}
         self.state = state
         if self.state is not None:
             self.state.register_model(self)
         logger.debug(f"{self.model_type} created with ID: {self._id}, name: {self._name}, objectName: {object_name}")
-        # Store both name and objectName as properties
-        self.set_property('name', self._name)
-        self.set_property('objectName', object_name)
 
     @property
     def id(self) -> str:
@@ -45,46 +166,11 @@ class BaseModel(QObject):
         """Return the human-readable name of the model."""
         return self._name
 
-    def set_property(self, name: str, value: object) -> None:
-        """
-        Assign value to self._properties[name] unconditionally
-        and emit self.property_changed(...) with (model_id, model_type, name, value).
-        Skips all array/DataFrame comparison logic, so it may emit even if unchanged.
-        """
+    def _notify_change(self, prop: str, value: Any) -> None:
+        self.property_changed.emit(self.id, self.model_type, prop, value)
 
-        # If it's a DataFrame, store a copy so we don't accidentally mutate the original
-        if isinstance(value, pd.DataFrame):
-            self._properties[name] = value.copy()
-        else:
-            self._properties[name] = value
-
-        # Always emit the signal (no old/new comparison)
-        self.property_changed.emit(self.id, self.model_type, name, value)
-
-    def get_property(self, prop: str, default: Any = None) -> Any:
-        """Get a property value with optional default."""
-        return self._properties.get(prop, default)
-
-    def begin_update(self) -> None:
-        """Begin batch update mode."""
-        self._batch_mode = True
-        self._pending_updates.clear()
-
-    def end_update(self) -> None:
-        """End batch update mode and emit changes."""
-        self._batch_mode = False
-        self._process_pending_updates()
-
-    def _process_pending_updates(self) -> None:
-        """Process all pending updates."""
-        if not self._pending_updates:
-            return
-
-        # Emit all pending changes
-        for prop, value in self._pending_updates.items():
-            self.property_changed.emit(self.id, self.model_type, prop, value)
-        
-        self._pending_updates.clear()
+    def _notify_changes(self, changes: Dict[str, Any]) -> None:
+        self.properties_changed.emit(self.id, self.model_type, changes)
 
     def add_child(self, child_model: 'BaseModel') -> None:
         """Add a child model with proper cleanup handling."""
@@ -112,6 +198,7 @@ class BaseModel(QObject):
         """Clean up resources and connections."""
         # Clear all properties and pending updates
         self._properties.clear()
+        self._versions.clear()
         self._pending_updates.clear()
         
         # Clean up children
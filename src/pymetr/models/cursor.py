@@ -34,7 +34,8 @@ class Cursor(BaseModel):
             raise ValueError("Cursor axis must be 'x' or 'y'.")
 
         # Initialize all properties
-        self._init_properties(name, axis, position, color, style, width, visible)
+        with self.batch_update():
+            self._init_properties(name, axis, position, color, style, width, visible)
 
     def _init_properties(self, name, axis, position, color, style, width, visible):
         """Initialize all cursor properties."""
@@ -1,16 +1,18 @@
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from collections import deque
-import importlib
 import inspect
+import re
 import time
+from concurrent.futures import Future
 import numpy as np
 from PySide6.QtCore import Signal, QTimer
 
 from pymetr.models.base import BaseModel
 from pymetr.models.plot import Plot
 from pymetr.models.trace import Trace
-from pymetr.drivers.instruments.plugin import get_driver_info
+from pymetr.drivers.base.properties import Property
+from pymetr.drivers.instruments.registry import get_driver_info, load_driver_class
 from pymetr.core.logging import logger
 
 class AcquisitionMode(Enum):
@@ -51,20 +53,23 @@ class Device(BaseModel):
         self._error_message: Optional[str] = None
         
         # Set basic device properties
-        name = f"{model}-{serial_number}" if model and serial_number else "Unnamed Device"
-        self.set_property('name', name)
-        self.set_property('model', model or '')
-        self.set_property('manufacturer', manufacturer or '')
-        self.set_property('serial', serial_number or '')
-        self.set_property('firmware', firmware or '')
-        self.set_property('resource', resource or '')
-        self.set_property('connection_string', resource or '')
-        self.set_property('is_connected', False)
-        
-        # Acquisition settings
-        self.set_property('acquisition_mode', AcquisitionMode.SINGLE.value)
-        self.set_property('averaging_count', 10)
-        self.set_property('is_acquiring', False)
+        # The device is registered already; announce its properties as one change
+        with self.batch_update():
+            self.set_property('model', model or '')
+            self.set_property('manufacturer', manufacturer or '')
+            self.set_property('serial', serial_number or '')
+            self.set_property('firmware', firmware or '')
+            self.set_property('resource', resource or '')
+            self.set_property('connection_string', resource or '')
+            self.set_property('is_connected', False)
+
+            # Acquisition settings
+            self.set_property('acquisition_mode', AcquisitionMode.SINGLE.value)
+            self.set_property('averaging_count', 10)
+            self.set_property('is_acquiring', False)
+
+            # Opt-in: cached settings miss front-panel changes until a sync
+            self.set_property('cache_properties', False)
         
         # Acquisition state
         self._acquisition_timer = QTimer()
@@ -246,6 +251,11 @@ class Device(BaseModel):
             self._avg_data.clear()
 
         self.set_property('is_acquiring', True)
+
+        # Lets drivers start the next sweep while the last trace is processed
+        continuous = mode not in [AcquisitionMode.SINGLE, AcquisitionMode.STACK]
+        if self.instrument is not None:
+            self.instrument.set_continuous_mode(continuous)
         
         # Emit signal for instrument to respond
         self.acquire_requested.emit(self.id)
@@ -259,6 +269,8 @@ class Device(BaseModel):
         """Stop any ongoing acquisition."""
         self._acquisition_timer.stop()
         self.set_property('is_acquiring', False)
+        if self.instrument is not None:
+            self.instrument.set_continuous_mode(False)
 
     def _load_driver_info(self) -> None:
         """Load driver information and build parameter tree."""
@@ -271,17 +283,9 @@ class Device(BaseModel):
             logger.debug(f"Device._load_driver_info: Retrieved driver info: {driver_info}")
             self._driver_info = driver_info
             
-            # Import driver module
-            module_name = driver_info['module']
-            logger.debug(f"Device._load_driver_info: Importing module '{module_name}'")
-            module = importlib.import_module(module_name)
-            logger.debug(f"Device._load_driver_info: Module '{module_name}' imported successfully")
-            
-            # Retrieve driver class
-            class_name = driver_info['class']
-            logger.debug(f"Device._load_driver_info: Retrieving driver class '{class_name}'")
-            driver_class = getattr(module, class_name)
-            logger.debug(f"Device._load_driver_info: Driver class '{class_name}' retrieved successfully")
+            # Import the driver module on first use
+            driver_class = load_driver_class(model)
+            logger.debug(f"Device._load_driver_info: Driver class '{driver_info['class']}' loaded")
             
             # Find the actual path to the driver file
             try:
@@ -354,6 +358,10 @@ class Device(BaseModel):
             if not self.instrument:
                 connection.close()  # Clean up the connection
                 raise RuntimeError("Failed to create instrument driver")
+
+            # With caching enabled, settings read or written through the
+            # parameter tree are cached so refreshes only query volatile values
+            self.instrument.property_cache.enabled = self.cache_properties
                 
             # Check connection by querying IDN
             try:
@@ -432,9 +440,27 @@ class Device(BaseModel):
         if value:
             self.error_occurred.emit(value)
 
+    @property
+    def cache_properties(self) -> bool:
+        """Whether the instrument's property cache is enabled (off by default)."""
+        return bool(self.get_property('cache_properties', False))
+
+    @cache_properties.setter
+    def cache_properties(self, enabled: bool):
+        """Enable or disable property caching, now and on later connects."""
+        self.set_property('cache_properties', bool(enabled))
+        if self.instrument is not None:
+            self.instrument.property_cache.enabled = bool(enabled)
+            if not enabled:
+                self.instrument.property_cache.invalidate()
+
     def update_parameter(self, path: str, value: Any, validate: bool = True) -> None:
         """
-        Update a parameter value in the device's state and optionally validate.
+        Update a parameter value on the device without blocking the caller.
+
+        The write (and optional read-back) run on the instrument's background
+        thread; the validated value is emitted through property_changed on
+        the GUI thread once it arrives.
         
         Args:
             path: Path in format "subsystem[index].property"
@@ -443,48 +469,134 @@ class Device(BaseModel):
         """
         try:
             logger.debug(f"Device.update_parameter: Updating parameter '{path}' with value '{value}'")
-            
-            # Parse path with support for indexed subsystems
-            import re
-            match = re.match(r'(\w+)(?:\[(\d+)\])?\.(\w+)', path)
-            if not match:
-                raise ValueError(f"Invalid property path format: {path}")
-                
-            subsystem_name, index_str, prop_name = match.groups()
-            
-            # Get the subsystem
-            if not hasattr(self.instrument, subsystem_name):
-                raise ValueError(f"Subsystem '{subsystem_name}' not found")
-                
-            subsystem = getattr(self.instrument, subsystem_name)
-            
-            # Handle indexed subsystems
-            if index_str is not None:
-                index = int(index_str)
-                if not isinstance(subsystem, (list, tuple)) or index >= len(subsystem):
-                    raise ValueError(f"Invalid index {index} for subsystem {subsystem_name}")
-                subsystem = subsystem[index]
-            
-            # Set the property value
-            if hasattr(subsystem, prop_name):
-                # This will use the property descriptor's __set__ method
-                setattr(subsystem, prop_name, value)
-                
-                # If validation is requested, read back the value
+            subsystem, prop_name = self._resolve_parameter(path)
+
+            def on_error(error):
+                logger.error(f"Device.update_parameter: Error updating parameter {path}: {error}")
+                self.error_message = f"Failed to update {path}: {str(error)}"
+
+            def on_written(_):
+                logger.debug(f"Device.update_parameter: Successfully updated {path} to {value}")
                 if validate:
-                    # Use the property descriptor's __get__ method (issues a query)
-                    updated_value = getattr(subsystem, prop_name)
-                    # Update UI with the actual device value
-                    self.property_changed.emit(self.id, self.model_type, path, updated_value)
+                    # Read back the value so the UI shows what the device
+                    # accepted; the cache only holds what was written
+                    self.read_parameter_async(
+                        path,
+                        callback=lambda updated: self.property_changed.emit(
+                            self.id, self.model_type, path, updated),
+                        errback=on_error,
+                        use_cache=False
+                    )
+
+            descriptor = getattr(type(subsystem), prop_name, None)
+            if isinstance(descriptor, Property):
+                descriptor.set_async(subsystem, value, callback=on_written, errback=on_error)
             else:
-                raise ValueError(f"Property '{prop_name}' not found in subsystem {subsystem_name}")
-                
-            logger.debug(f"Device.update_parameter: Successfully updated {path} to {value}")
+                self.instrument.call_async(setattr, subsystem, prop_name, value,
+                                           callback=on_written, errback=on_error)
             
         except Exception as e:
             logger.error(f"Device.update_parameter: Error updating parameter {path}: {e}")
             self.error_message = f"Failed to update {path}: {str(e)}"
 
+    def read_parameter_async(self, path: str, callback=None, errback=None,
+                             use_cache: bool = True) -> Future:
+        """
+        Read a parameter from the device without blocking the caller.
+
+        Args:
+            path: Path in format "subsystem[index].property"
+            callback: Called with the value on the GUI thread
+            errback: Called with the exception on the GUI thread
+            use_cache: Allow a value from the property cache; False queries the device
+
+        Returns:
+            Future: Resolved with the parameter value
+        """
+        subsystem, prop_name = self._resolve_parameter(path)
+        descriptor = getattr(type(subsystem), prop_name, None)
+        if isinstance(descriptor, Property):
+            return descriptor.get_async(subsystem, callback, errback, use_cache=use_cache)
+        return self.instrument.call_async(getattr, subsystem, prop_name,
+                                          callback=callback, errback=errback)
+
+    def read_parameters_async(self, paths, callback=None, errback=None,
+                              use_cache: bool = True) -> Future:
+        """
+        Read several parameters with batched compound queries.
+
+        Args:
+            paths: Paths in format "subsystem[index].property"
+            callback: Called on the GUI thread with a {path: value} dict;
+                parameters that could not be read are missing or None
+            errback: Called with the exception on the GUI thread
+            use_cache: Allow values from the property cache; False queries the device
+
+        Returns:
+            Future: Resolved with the {path: value} dict
+        """
+        items, item_paths, others = [], [], {}
+        for path in paths:
+            try:
+                subsystem, prop_name = self._resolve_parameter(path)
+            except ValueError as e:
+                logger.warning(f"Skipping parameter {path}: {e}")
+                continue
+            descriptor = getattr(type(subsystem), prop_name, None)
+            if isinstance(descriptor, Property):
+                items.append((subsystem, descriptor))
+                item_paths.append(path)
+            else:
+                others[path] = (subsystem, prop_name)
+
+        def read_all():
+            values = dict(zip(item_paths, self.instrument.query_properties(items, use_cache)))
+            for path, (subsystem, prop_name) in others.items():
+                try:
+                    values[path] = getattr(subsystem, prop_name)
+                except Exception as e:
+                    logger.warning(f"Error reading parameter {path}: {e}")
+            return values
+
+        return self.instrument.call_async(read_all, callback=callback, errback=errback)
+
+    def _resolve_parameter(self, path: str):
+        """
+        Resolve a parameter path to its subsystem and property name.
+
+        Args:
+            path: Path in format "subsystem[index].property"
+
+        Returns:
+            Tuple of (subsystem, property name)
+
+        Raises:
+            ValueError: If the path does not name an existing property
+        """
+        match = re.match(r'(\w+)(?:\[(\d+)\])?\.(\w+)', path)
+        if not match:
+            raise ValueError(f"Invalid property path format: {path}")
+            
+        subsystem_name, index_str, prop_name = match.groups()
+        
+        # Get the subsystem
+        if not hasattr(self.instrument, subsystem_name):
+            raise ValueError(f"Subsystem '{subsystem_name}' not found")
+            
+        subsystem = getattr(self.instrument, subsystem_name)
+        
+        # Handle indexed subsystems
+        if index_str is not None:
+            index = int(index_str)
+            if not isinstance(subsystem, (list, tuple)) or index >= len(subsystem):
+                raise ValueError(f"Invalid index {index} for subsystem {subsystem_name}")
+            subsystem = subsystem[index]
+
+        # Check the class so resolving never triggers a descriptor's query
+        if not hasattr(type(subsystem), prop_name) and prop_name not in vars(subsystem):
+            raise ValueError(f"Property '{prop_name}' not found in subsystem {subsystem_name}")
+        return subsystem, prop_name
+
     def set_connection_state(self, connected: bool) -> None:
         """
         Update device connection state.
@@ -564,15 +676,17 @@ class Device(BaseModel):
 
     def _create_connection(self) -> 'ConnectionInterface':
         """Create appropriate connection based on resource string."""
-        from pymetr.drivers.base.connections import PyVisaConnection, RawSocketConnection
+        from pymetr.drivers.base.connections import PyVisaConnection
+        from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
         
         resource = self.get_property('resource')
         if not resource:
             raise ValueError("No resource string available")
             
-        # Determine connection type from resource string
+        # Determine connection type from resource string. Socket instruments
+        # share one asyncio I/O thread instead of a worker thread each.
         if resource.startswith('TCPIP') and '::SOCKET' in resource:
-            return RawSocketConnection(resource)
+            return AsyncRawSocketConnection(resource)
         else:
             return PyVisaConnection(resource)
         
@@ -0,0 +1,95 @@
+# pymetr/models/lite.py
+"""
+Compact models for high-cardinality results.
+
+A LiteModel stores and batches properties exactly like BaseModel but is a
+plain ``__slots__`` object: no QObject, no per-object signals, no
+objectName and a counter-based ID instead of a uuid4. Changes are reported
+to the ApplicationState the model is registered with, which delivers them
+to subscribers like any other model change (coalesced when made off the
+main thread). Lite models are leaves: they can be children of BaseModel
+containers but have no children of their own.
+"""
+
+import itertools
+import uuid
+from typing import Any, Dict, List, Optional
+
+from pymetr.models.base import ModelProperties
+from pymetr.core.logging import logger
+
+# One random prefix per process keeps counter IDs globally unique
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_id_counter = itertools.count(1)
+
+
+def _next_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):x}"
+
+
+class LiteModel(ModelProperties):
+    """
+    Slotted, signal-free model for results recorded in bulk.
+
+    Args:
+        model_type: Model type name
+        state: Optional ApplicationState to register with
+        model_id: Model ID; generated if omitted
+        name: Human-readable name, "Untitled" if omitted
+        properties: Initial property values, stored without notification
+    """
+
+    __slots__ = ('model_type', '_id', '_properties', '_versions', '_batch_depth',
+                 '_pending_updates', 'state')
+
+    def __init__(self, model_type: str, state=None, model_id: Optional[str] = None,
+                 name: Optional[str] = None, properties: Optional[Dict[str, Any]] = None):
+        self.model_type = model_type
+        self._id = model_id or _next_id()
+        self._properties = {'name': name if name is not None else "Untitled"}
+        if properties:
+            self._properties.update(properties)
+        self._versions = None          # created on the first change
+        self._batch_depth = 0
+        self._pending_updates = None   # created by the first begin_update()
+        self.state = state
+        if state is not None:
+            state.register_model(self)
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        """Return the human-readable name of the model."""
+        return self._properties.get('name')
+
+    def _notify_change(self, prop: str, value: Any) -> None:
+        if self.state is not None:
+            self.state.notify_model_change(self._id, self.model_type, prop, value)
+
+    def _notify_changes(self, changes: Dict[str, Any]) -> None:
+        if self.state is not None:
+            self.state.notify_model_changes(self._id, self.model_type, changes)
+
+    def get_children(self) -> List[Any]:
+        """Lite models have no children."""
+        return []
+
+    def cleanup(self) -> None:
+        """Release properties and the state reference."""
+        self._properties.clear()
+        self._versions = None
+        self._pending_updates = None
+        self.state = None
+
+    def show(self) -> None:
+        """Request model view activation."""
+        if self.state:
+            self.state.set_active_model(self._id)
+        else:
+            logger.warning(f"Cannot show model {self._id} - no state manager attached")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.model_type} {self._id}>"
@@ -35,7 +35,8 @@ class Marker(BaseModel):
         model_id: Optional[str] = None,
     ):
         super().__init__(model_type='Marker', model_id=model_id, name=name)
-        self._init_properties(x, y, name, color, size, symbol, visible)
+        with self.batch_update():
+            self._init_properties(x, y, name, color, size, symbol, visible)
 
     def _init_properties(self, x, y, name, color, size, symbol, visible):
         """Initialize all marker properties."""
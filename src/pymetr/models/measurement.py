@@ -1,19 +1,24 @@
 from typing import Optional
-from pymetr.models.base import BaseModel
-from pymetr.core.logging import logger
+from pymetr.models.lite import LiteModel
 
-class Measurement(BaseModel):
+class Measurement(LiteModel):
     """
     A single measurement value with optional limits for validation.
+
+    Scripts record measurements by the thousand, so this is a lite model:
+    no QObject or per-object signals; changes reach views through the
+    state it is registered with.
     """
+    __slots__ = ()
+
     def __init__(self, name: str, value: float, units: str = "", model_id: Optional[str] = None):
-        super().__init__(model_type='Measurement', model_id=model_id)
-        self.set_property("name", name)
-        self.set_property("value", value)
-        self.set_property("units", units)
-        self.set_property("timestamp", None)
-        self.set_property("limits", None)  # Optional (min, max) tuple
-        self.set_property("status", "Valid")  # 'Valid', 'Invalid', or 'Warning'
+        super().__init__('Measurement', model_id=model_id, name=name, properties={
+            "value": value,
+            "units": units,
+            "timestamp": None,
+            "limits": None,        # Optional (min, max) tuple
+            "status": "Valid",     # 'Valid', 'Invalid', or 'Warning'
+        })
 
     @property
     def name(self) -> str:
@@ -25,15 +30,16 @@ class Measurement(BaseModel):
 
     @value.setter
     def value(self, val: float):
-        self.set_property("value", val)
-        # Check limits if present
-        limits = self.get_property("limits")
-        if limits:
-            min_val, max_val = limits
-            if not (min_val <= val <= max_val):
-                self.set_property("status", "Invalid")
-            else:
-                self.set_property("status", "Valid")
+        with self.batch_update():
+            self.set_property("value", val)
+            # Check limits if present
+            limits = self.get_property("limits")
+            if limits:
+                min_val, max_val = limits
+                if not (min_val <= val <= max_val):
+                    self.set_property("status", "Invalid")
+                else:
+                    self.set_property("status", "Valid")
 
     @property
     def units(self) -> str:
@@ -41,11 +47,12 @@ class Measurement(BaseModel):
 
     def set_limits(self, min_val: float, max_val: float):
         """Set measurement limits and validate current value."""
-        self.set_property("limits", (min_val, max_val))
-        # Re-check current value
-        curr_val = self.value
-        if not (min_val <= curr_val <= max_val):
-            self.set_property("status", "Invalid")
+        with self.batch_update():
+            self.set_property("limits", (min_val, max_val))
+            # Re-check current value
+            curr_val = self.value
+            if not (min_val <= curr_val <= max_val):
+                self.set_property("status", "Invalid")
 
     def to_string(self) -> str:
         """Simple string representation (e.g. '12.34 V')."""
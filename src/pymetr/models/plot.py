@@ -50,7 +50,8 @@ class Plot(BaseModel):
         # If name is not provided, use title as the name
         name_to_use = name if name is not None else title
         super().__init__(model_type='Plot', model_id=model_id, name=name_to_use)
-        self._init_properties(title)
+        with self.batch_update():
+            self._init_properties(title)
 
     def _init_properties(self, title: str):
         """Initialize all plot properties with defaults."""
@@ -447,24 +448,25 @@ class Plot(BaseModel):
             self.add_child(new_trace)
             return new_trace
         else:
-            # Always update data
-            existing_trace.data = (x_data, y_data)
-
-            # Only update properties that were explicitly passed (not None)
-            if mode is not None:
-                existing_trace.set_property('mode', mode)
-            if color is not None:
-                existing_trace.set_property('color', color)
-            if style is not None:
-                existing_trace.set_property('style', style)
-            if width is not None:
-                existing_trace.set_property('width', width)
-            if marker_style is not None:
-                existing_trace.set_property('marker_style', marker_style)
-            if visible is not None:
-                existing_trace.set_property('visible', visible)
-            if opacity is not None:
-                existing_trace.set_property('opacity', opacity)
+            with existing_trace.batch_update():
+                # Always update data
+                existing_trace.data = (x_data, y_data)
+
+                # Only update properties that were explicitly passed (not None)
+                if mode is not None:
+                    existing_trace.set_property('mode', mode)
+                if color is not None:
+                    existing_trace.set_property('color', color)
+                if style is not None:
+                    existing_trace.set_property('style', style)
+                if width is not None:
+                    existing_trace.set_property('width', width)
+                if marker_style is not None:
+                    existing_trace.set_property('marker_style', marker_style)
+                if visible is not None:
+                    existing_trace.set_property('visible', visible)
+                if opacity is not None:
+                    existing_trace.set_property('opacity', opacity)
                 
             return existing_trace
 
@@ -15,11 +15,12 @@ class DataTable(BaseModel):
         model_id: Optional[str] = None
     ):
         super().__init__(model_type='DataTable', model_id=model_id, name=title)
-        self.set_property("title", title)
-        # Store column names and create an empty DataFrame with those columns.
-        columns = columns or []
-        self.set_property("columns", columns)
-        self.set_property("data", pd.DataFrame(columns=columns))
+        with self.batch_update():
+            self.set_property("title", title)
+            # Store column names and create an empty DataFrame with those columns.
+            columns = columns or []
+            self.set_property("columns", columns)
+            self.set_property("data", pd.DataFrame(columns=columns))
         logger.debug(f"DataTable '{title}' created with id {self.id}")
 
     # --- Pythonic Property Accessors ---
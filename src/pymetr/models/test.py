@@ -91,11 +91,12 @@ class TestScript(BaseModel):
 
         super().__init__(model_type='TestScript', model_id=model_id, name=name)
         
-        self.set_property('script_path', script_path)
-        self.set_property('status', 'READY')
-        self.set_property('start_time', None)
-        self.set_property('elapsed_time', 0)
-        self.set_property('progress', 0.0)
+        with self.batch_update():
+            self.set_property('script_path', script_path)
+            self.set_property('status', 'READY')
+            self.set_property('start_time', None)
+            self.set_property('elapsed_time', 0)
+            self.set_property('progress', 0.0)
         # Now, the 'name' property is automatically set in BaseModel.
 
     @property
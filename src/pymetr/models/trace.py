@@ -32,15 +32,16 @@ class Trace(BaseModel):
         self._x_data = np.asarray(x_data)
         self._y_data = np.asarray(y_data)
 
-        # Basic trace properties
-        self.set_property("name", name)
-        self.set_property("color", kwargs.get("color", None))  # Let view pick default if None
-        self.set_property("style", kwargs.get("style", "solid"))  # 'solid', 'dash', 'dot', 'dash-dot'
-        self.set_property("width", kwargs.get("width", 1))
-        self.set_property("marker_style", kwargs.get("marker_style", ""))  # e.g. 'o' for circles
-        self.set_property("mode", kwargs.get("mode", "Group"))  # or "Isolate"
-        self.set_property("visible", kwargs.get("visible", True))
-        self.set_property("opacity", kwargs.get("opacity", 1.0))  # 1.0 => fully opaque
+        # Basic trace properties, announced as one change
+        with self.batch_update():
+            self.set_property("name", name)
+            self.set_property("color", kwargs.get("color", None))  # Let view pick default if None
+            self.set_property("style", kwargs.get("style", "solid"))  # 'solid', 'dash', 'dot', 'dash-dot'
+            self.set_property("width", kwargs.get("width", 1))
+            self.set_property("marker_style", kwargs.get("marker_style", ""))  # e.g. 'o' for circles
+            self.set_property("mode", kwargs.get("mode", "Group"))  # or "Isolate"
+            self.set_property("visible", kwargs.get("visible", True))
+            self.set_property("opacity", kwargs.get("opacity", 1.0))  # 1.0 => fully opaque
 
     # -- Pythonic Property Accessors --
 
@@ -54,4 +54,9 @@ class DiscoveryDialog(QDialog):
     def _handle_connect(self, info):
         """Handle instrument connection."""
         self.result_info = info
-        self.accept()  # Uses QDialog.accept() method
\ No newline at end of file
+        self.accept()  # Uses QDialog.accept() method
+
+    def done(self, result):
+        """Cancel any discovery still running when the dialog closes."""
+        self.state.stop_discovery()
+        super().done(result)
\ No newline at end of file
@@ -68,61 +68,45 @@ class DeviceTreeView(BaseWidget):
 
 
     def _sync_all_parameters(self):
-        """Read and update all parameters from the device."""
+        """Read and update all parameters from the device without blocking the UI."""
         if not self.model or not self.model.get_property('is_connected', False):
             return
         
         logger.debug("Syncing all parameters from device")
         
-        # Disable UI during sync
+        # Disable UI until the values have come back
         self._parameter_tree.setEnabled(False)
         self.sync_button.setEnabled(False)
-        
-        # Use QTimer to give the UI a chance to update
-        from PySide6.QtCore import QTimer
-        
-        def perform_sync():
-            try:
-                for path, param in self._parameters.items():
-                    if not param.opts.get('readonly', False):
-                        try:
-                            # Parse path with regex to get subsystem, index, and property
-                            import re
-                            match = re.match(r'(\w+)(?:\[(\d+)\])?\.(\w+)', path)
-                            if match:
-                                subsystem_name, index_str, prop_name = match.groups()
-                                
-                                # Get the subsystem
-                                if hasattr(self.model.instrument, subsystem_name):
-                                    subsystem = getattr(self.model.instrument, subsystem_name)
-                                    
-                                    # Handle indexed subsystems
-                                    if index_str is not None:
-                                        index = int(index_str)
-                                        if isinstance(subsystem, (list, tuple)) and index < len(subsystem):
-                                            subsystem = subsystem[index]
-                                        else:
-                                            continue  # Skip if index is invalid
-                                    
-                                    # Read the property value
-                                    if hasattr(subsystem, prop_name):
-                                        # This triggers the property descriptor's __get__ method
-                                        value = getattr(subsystem, prop_name)
-                                        # Update the parameter with the new value
-                                        param.setValue(value, blockSignal=self._handle_parameter_change)
-                        except Exception as e:
-                            logger.warning(f"Error syncing parameter {path}: {e}")
-                
-                logger.debug("Parameter sync completed")
-            except Exception as e:
-                logger.error(f"Error during parameter sync: {e}")
-            finally:
-                # Re-enable UI
-                self._parameter_tree.setEnabled(True)
-                self.sync_button.setEnabled(True)
-        
-        # Schedule the sync to run after UI updates
-        QTimer.singleShot(100, perform_sync)
+
+        def finish():
+            logger.debug("Parameter sync completed")
+            self._parameter_tree.setEnabled(True)
+            self.sync_button.setEnabled(True)
+
+        def on_values(values):
+            for path, value in values.items():
+                param = self._parameters.get(path)
+                if param is not None and value is not None:
+                    param.setValue(value, blockSignal=self._handle_parameter_change)
+            finish()
+
+        def on_error(error):
+            logger.warning(f"Error syncing parameters: {error}")
+            finish()
+
+        # One batched read (a few compound queries) for the whole tree;
+        # the result arrives on the GUI thread. Sync always asks the device,
+        # so front-panel changes show up even for cached settings
+        paths = [path for path, param in self._parameters.items()
+                 if not param.opts.get('readonly', False)]
+        if not paths:
+            finish()
+            return
+        try:
+            self.model.read_parameters_async(paths, callback=on_values, errback=on_error,
+                                             use_cache=False)
+        except Exception as e:
+            on_error(e)
 
     def _on_instrument_connected(self, device_id: str):
         logger.debug(f"DeviceTreeView received instrument_connected signal for device ID: {device_id}")
@@ -124,7 +124,8 @@ class ModelTreeView(BaseWidget):
         # State signals
         self.state.model_registered.connect(self._handle_model_registered)
         self.state.models_linked.connect(self._handle_models_linked)
-        self.state.model_changed.connect(self._queue_model_change)
+        # The tree shows every model, so it takes every change, a batch at a time
+        self.state.subscribe(self._queue_model_changes, owner=self, grouped=True)
         self.state.model_removed.connect(self._handle_model_removed)
     
     def _preload_icons(self):
@@ -220,12 +221,10 @@ class ModelTreeView(BaseWidget):
         except Exception as e:
             logger.error(f"Error linking models: {e}")
     
-    def _queue_model_change(self, model_id: str, model_type: str, prop: str, value: Any):
-        """Queue model updates for batch processing."""
-        if model_id not in self._pending_updates:
-            self._pending_updates[model_id] = {}
-        self._pending_updates[model_id][prop] = value
-        
+    def _queue_model_changes(self, model_id: str, model_type: str, changes: Dict[str, Any]):
+        """Queue a batch of model updates for processing."""
+        self._pending_updates.setdefault(model_id, {}).update(changes)
+
         if not self._update_timer.isActive():
             self._update_timer.start(self._throttle_interval)
     
@@ -304,11 +303,12 @@ class ModelTreeView(BaseWidget):
     
     def _find_viewable_parent(self, model_id: str) -> Optional[BaseModel]:
         """Find first parent that has a view."""
-        parent = self.state.get_parent(model_id)
-        while parent:
+        for parent_id in self.state.get_ancestor_ids(model_id):
+            parent = self.state.get_model(parent_id)
+            if parent is None:
+                break
             if hasattr(parent, 'show'):
                 return parent
-            parent = self.state.get_parent(parent.id)
         return None
     
     def cleanup(self):
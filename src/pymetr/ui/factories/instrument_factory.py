@@ -1,19 +1,169 @@
 import json
 import os
 import ast
+import copy
+import hashlib
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
 from pymetr.core.logging import logger
+from ...drivers.base import visitor as visitor_module
 from ...drivers.base.visitor import InstrumentVisitor
 
+DEFAULT_CACHE_DIR = Path.home() / ".pymetr" / "driver_cache"
+CACHE_FORMAT = 1
+
+
+def _generator_version() -> str:
+    """Identify the code that builds UI configurations, for cache keys."""
+    try:
+        version = metadata.version("pymetr")
+    except metadata.PackageNotFoundError:
+        version = "dev"
+    # Source checkouts keep one version string, so the generator modules count too
+    stamps = ":".join(str(os.stat(module).st_mtime_ns) for module in (__file__, visitor_module.__file__))
+    return f"{version}:{CACHE_FORMAT}:{stamps}"
+
+
+class DriverConfigCache:
+    """
+    Memory and disk cache of the UI configurations built from driver files.
+
+    Entries are keyed by driver path and generator version. A driver whose
+    mtime and size are unchanged is served without being read; otherwise
+    its SHA-256 decides whether the cached configuration still applies.
+    Callers get a deep copy, so they may modify what they receive.
+
+    Args:
+        directory: Folder holding one JSON file per driver, or None to keep
+            the cache in memory only
+    """
+
+    def __init__(self, directory: Optional[Path] = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory) if directory is not None else None
+        self.version = _generator_version()
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, build: Callable[[str], dict]) -> dict:
+        """
+        Get the configuration for a driver file, building it on a miss.
+
+        Args:
+            path: Driver source file
+            build: Called with the driver source to build the configuration
+
+        Returns:
+            dict: The UI configuration
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None:
+            entry = self._load(path)
+
+        if entry is not None and (entry['mtime_ns'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+            config = entry['config']
+        else:
+            with open(path, 'rb') as file:
+                source = file.read()
+            digest = hashlib.sha256(source).hexdigest()
+            if entry is not None and entry['sha256'] == digest:
+                config = entry['config']  # touched but unchanged
+            else:
+                logger.debug(f"Building UI configuration from driver source: {path}")
+                config = build(source.decode('utf-8'))
+            entry = {
+                'version': self.version,
+                'path': path,
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': digest,
+                'config': config,
+            }
+            self._save(entry)
+
+        with self._lock:
+            self._entries[path] = entry
+        return copy.deepcopy(config)
+
+    def clear(self):
+        """Forget all entries, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None:
+            for cache_file in self.directory.glob("*.json"):
+                cache_file.unlink(missing_ok=True)
+
+    def _file_for(self, path: str) -> Path:
+        name = hashlib.sha1(path.encode('utf-8')).hexdigest()
+        return self.directory / f"{Path(path).stem}-{name[:16]}.json"
+
+    def _load(self, path: str) -> Optional[dict]:
+        """Read the disk entry for path, ignoring missing, stale or corrupt files."""
+        if self.directory is None:
+            return None
+        try:
+            with open(self._file_for(path), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get('version') != self.version or entry.get('path') != path:
+                return None
+            if not {'mtime_ns', 'size', 'sha256', 'config'} <= entry.keys():
+                return None
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable driver cache for {path}: {e}")
+            return None
+
+    def _save(self, entry: dict):
+        """Write an entry to disk atomically."""
+        if self.directory is None:
+            return
+        cache_file = self._file_for(entry['path'])
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save driver cache {cache_file}: {e}")
+
+
+_default_cache: Optional[DriverConfigCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_config_cache() -> DriverConfigCache:
+    """The process-wide cache shared by InstrumentFactory instances."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DriverConfigCache()
+        return _default_cache
+
+
 class InstrumentFactory:
-    def __init__(self):
+    def __init__(self, cache: Optional[DriverConfigCache] = None):
         self.current_instrument = None
+        self.cache = cache
 
-    def create_instrument_data_from_driver(self, path: str) -> dict:
+    def create_instrument_data_from_driver(self, path: str, use_cache: bool = True) -> dict:
         """
         Reads the driver source code from the given file path,
         extracts the raw instrument data model using the visitor,
         and then transforms that data model into a UI configuration.
+        Results are cached in memory and on disk until the file changes.
         """
+        if use_cache:
+            cache = self.cache if self.cache is not None else default_config_cache()
+            return cache.get(path, self.create_ui_configuration_from_source)
+
         logger.debug(f"Building UI configuration from driver source: {path}")
         with open(path, 'r') as file:
             source = file.read()
@@ -28,7 +28,7 @@ class TabManager(QTabWidget):
         # Connect to state
         self.state.model_registered.connect(self._handle_model_registered)
         self.state.active_model_changed.connect(self._handle_active_model)
-        self.state.model_changed.connect(self._handle_model_changed)
+        self.state.subscribe(self._handle_model_changed, prop='name', owner=self)
         self.state.model_removed.connect(self._handle_model_removed)
         
         # Open welcome tab
@@ -114,8 +114,7 @@ class TabManager(QTabWidget):
             if not self._tabs or len(self._tabs) == 1 and 'welcome' in self._tabs:
                 self.show_welcome()
 
-    @Slot(str, str, object)
-    def _handle_model_changed(self, model_id: str, prop: str, value: object):
+    def _handle_model_changed(self, model_id: str, model_type: str, prop: str, value: object):
         """Handle model property changes."""
         if prop == 'name' and model_id in self._tabs:
             # Update tab title
@@ -216,7 +216,7 @@ class DeviceTab(BaseTab):
         model = self.state.get_model(self.model_id)
         if model and hasattr(model, 'instrument') and model.instrument:
             try:
-                model.instrument.write(command)
+                model.instrument.write_async(command)
             except Exception as e:
                 self.device_view.append_output(f"Error: {str(e)}", "error")
         else:
@@ -227,7 +227,7 @@ class DeviceTab(BaseTab):
         model = self.state.get_model(self.model_id)
         if model and hasattr(model, 'instrument') and model.instrument:
             try:
-                model.instrument.read()
+                model.instrument.read_async()
             except Exception as e:
                 self.device_view.append_output(f"Error: {str(e)}", "error")
         else:
@@ -240,7 +240,7 @@ class DeviceTab(BaseTab):
         model = self.state.get_model(self.model_id)
         if model and hasattr(model, 'instrument') and model.instrument:
             try:
-                model.instrument.query(command)
+                model.instrument.query_async(command)
             except Exception as e:
                 self.device_view.append_output(f"Error: {str(e)}", "error")
         else:
@@ -151,8 +151,9 @@ class PlotTab(BaseTab):
 
         super().__init__(state, model_id, parent)
         
-        # Connect to state signals for ROI sync and updates
-        self.state.model_changed.connect(self._handle_model_changed)
+        # Subscribe to the plot properties mirrored by the toolbar
+        self.state.subscribe(self._handle_model_changed, model_id=model_id,
+                             prop=('roi', 'roi_visible', 'grid_enabled'), owner=self)
         
         # Connect to our own signals
         self.analysis_requested.connect(self._create_analysis)
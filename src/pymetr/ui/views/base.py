@@ -17,6 +17,7 @@ class BaseWidget(QWidget):
         super().__init__(parent)
         self.state = state
         self._model_id = None
+        self._model_subscription = None
         self._updating = False  # Prevent update loops
         
     @property
@@ -39,11 +40,16 @@ class BaseWidget(QWidget):
             #     if old_model:
             #         old_model.property_changed.disconnect(self._handle_property_change)
             
-            # Connect to new model
+            # Subscribe to the new model through the state, which also
+            # reports changes of lite (non-QObject) models
             self._model_id = model_id
+            self.state.unsubscribe(self._model_subscription)
+            self._model_subscription = None
             model = self.state.get_model(model_id)
             if model:
-                model.property_changed.connect(self._handle_property_change)
+                self._model_subscription = self.state.subscribe(
+                    self._handle_property_change, model_id=model_id, owner=self
+                )
                 self.update_from_model(model)
                 self.model_changed.emit(model)
                 
@@ -90,8 +96,7 @@ class BaseWidget(QWidget):
         
     def closeEvent(self, event):
         """Clean up model connections on close."""
-        if self._model_id:
-            model = self.state.get_model(self._model_id)
-            if model:
-                model.property_changed.disconnect(self._handle_property_change)
+        if self._model_subscription is not None:
+            self.state.unsubscribe(self._model_subscription)
+            self._model_subscription = None
         super().closeEvent(event)
\ No newline at end of file
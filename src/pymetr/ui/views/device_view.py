@@ -30,8 +30,11 @@ class DeviceView(BaseWidget):
         """Connect to model signals."""
         model = self.state.get_model(self._model_id)
         if model:
-            # Connect to property changes
-            model.property_changed.connect(self._handle_property_change)
+            # Subscribe to property changes
+            self.state.unsubscribe(self._model_subscription)
+            self._model_subscription = self.state.subscribe(
+                self._handle_property_change, model_id=self._model_id, owner=self
+            )
             
             # Initial connection check
             is_connected = model.get_property('is_connected', False)
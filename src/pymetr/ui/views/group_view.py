@@ -69,6 +69,7 @@ class GroupView(BaseWidget):
         logger.debug(f"Initializing ResultView for model_id: {model_id}")
         super().__init__(state, parent)
         self._signals_connected = False
+        self._change_subscription = None
         
         self.child_views = {}
         self.layout_mode = LayoutMode.GridAuto
@@ -128,9 +129,14 @@ class GroupView(BaseWidget):
         
         # Connect signals only once
         if not self._signals_connected:
-            self.state.model_changed.connect(self._handle_model_changed)
             self.state.models_linked.connect(self._handle_models_linked)
             self._signals_connected = True
+
+        # Receive changes of this model and its children only
+        self.state.unsubscribe(self._change_subscription)
+        self._change_subscription = self.state.subscribe(
+            self._handle_model_changed, subtree=self.model.id, owner=self
+        )
         
         # Add existing children
         for child in self.model.get_children():
@@ -285,7 +291,7 @@ class GroupView(BaseWidget):
             if child:
                 self._add_child_view(child)
     
-    def _handle_model_changed(self, model_id: str, prop: str, value: Any):
+    def _handle_model_changed(self, model_id: str, model_type: str, prop: str, value: Any):
         """Handle model property changes."""
         if not self.model:
             return
@@ -312,9 +318,11 @@ class GroupView(BaseWidget):
     
     def cleanup(self):
         """Clean up signal connections and resources."""
+        if self.state:
+            self.state.unsubscribe(self._change_subscription)
+            self._change_subscription = None
         if self._signals_connected and self.state:
             try:
-                self.state.model_changed.disconnect(self._handle_model_changed)
                 self.state.models_linked.disconnect(self._handle_models_linked)
             except:
                 pass  # Ignore if already disconnected
@@ -38,7 +38,10 @@ class PlotView(BaseWidget):
         # Connect state signals with proper routing
         self.state.model_registered.connect(self._handle_model_registered)
         self.state.models_linked.connect(self._handle_model_linked)
-        self.state.model_changed.connect(self._handle_model_changed)
+        # Only changes of this plot and its descendants are delivered
+        self._change_subscription = self.state.subscribe(
+            self._handle_model_changed, subtree=self.model_id, owner=self
+        )
         self.state.model_removed.connect(self._handle_model_removed)
 
         # Geometry update handling with debouncing (for ~60fps updates)
@@ -220,12 +223,7 @@ class PlotView(BaseWidget):
 
     def _is_descendant(self, model_id: str, ancestor_id: str) -> bool:
         """Return True if the model with model_id is a descendant of the model with ancestor_id."""
-        current = self.state.get_parent(model_id)
-        while current:
-            if current.id == ancestor_id:
-                return True
-            current = self.state.get_parent(current.id)
-        return False
+        return self.state.is_descendant(model_id, ancestor_id)
 
     def _initialize_plot(self) -> None:
         """Update all plot settings from model."""
@@ -296,11 +294,6 @@ class PlotView(BaseWidget):
                 self.change_plot(prop, value)
                 return
 
-            # Process changes only if the model is a descendant of this plot.
-            if model_id != self.model_id and not self._is_descendant(model_id, self.model_id):
-                logger.debug(f"Model {model_id} is not a descendant of plot {self.model_id}, ignoring change")
-                return
-
             logger.debug(f"Handling change for model {model_id} (type: {model_type}): {prop}")
 
             if model_type == "Marker":
@@ -550,8 +543,8 @@ class PlotView(BaseWidget):
             
             # Disconnect state signals
             try:
+                self.state.unsubscribe(self._change_subscription)
                 self.state.model_registered.disconnect(self._handle_model_registered)
-                self.state.model_changed.disconnect(self._handle_model_changed)
                 self.state.model_removed.disconnect(self._handle_model_removed)
             except Exception:
                 pass
@@ -666,8 +659,8 @@ class PlotView(BaseWidget):
             
             # Disconnect state signals
             try:
+                self.state.unsubscribe(self._change_subscription)
                 self.state.model_registered.disconnect(self._handle_model_registered)
-                self.state.model_changed.disconnect(self._handle_model_changed)
                 self.state.model_removed.disconnect(self._handle_model_removed)
             except Exception:
                 pass
@@ -165,10 +165,10 @@ class SCPIConsole(QWidget):
         if self.device and hasattr(self.device, 'instrument'):
             instrument = self.device.instrument
             
-        # Send the command
+        # Send the command without waiting on the instrument
         if instrument:
             try:
-                instrument.write(command)
+                instrument.write_async(command)
                 # Command will be displayed through signal handler
             except Exception as e:
                 self._append_text(f"Error: {str(e)}", "error")
@@ -182,7 +182,7 @@ class SCPIConsole(QWidget):
         """Handle Read button click."""
         if self.device and self.device.instrument:
             try:
-                self.device.instrument.read()
+                self.device.instrument.read_async()
                 # Display will happen through signal handler
             except Exception as e:
                 self._append_text(f"Error: {str(e)}", "error")
@@ -198,7 +198,7 @@ class SCPIConsole(QWidget):
         # Send the command
         if self.device and self.device.instrument:
             try:
-                self.device.instrument.query(command)
+                self.device.instrument.query_async(command)
                 # Display will happen through signal handler
             except Exception as e:
                 self._append_text(f"Error: {str(e)}", "error")
@@ -1,10 +1,13 @@
 # tests/conftest.py
+import os
+
 import pytest
 from PySide6.QtWidgets import QApplication
-from pymetr.state import ApplicationState
+from pymetr.core.state import ApplicationState
 from pymetr.models.base import BaseModel
-from pymetr.ui.views.manager import ViewType  # Add this import
-from pymetr.actions.commands import Result
+
+# Run without a display unless the environment picks a platform
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 # Base test models that can be used across all tests
 @pytest.mark.no_collect
@@ -32,10 +35,10 @@ class TestResult(BaseModel):
 @pytest.fixture(scope="session")
 def qapp():
     """Create the Qt Application"""
-    return QApplication([])
+    return QApplication.instance() or QApplication([])
 
 @pytest.fixture
-def state():
+def state(qapp):
     """Create a fresh application state for each test"""
     return ApplicationState()
 
@@ -63,9 +66,11 @@ def test_result(state):
 @pytest.fixture
 def success_result():
     """Fixture for successful command result"""
+    from pymetr.actions.commands import Result
     return Result(success=True)
 
 @pytest.fixture
 def failed_result():
     """Fixture for failed command result"""
+    from pymetr.actions.commands import Result
     return Result(success=False, error="Test error")
\ No newline at end of file
@@ -0,0 +1,504 @@
+# tests/test_connections.py
+import contextlib
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+import pyvisa
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.connections import PyVisaConnection, RawSocketConnection
+
+
+def ieee_block(payload: bytes) -> bytes:
+    length = str(len(payload)).encode()
+    return b'#' + str(len(length)).encode() + length + payload + b'\n'
+
+
+@pytest.fixture
+def loopback():
+    """
+    Single-client TCP server that replies to each line with queued responses.
+
+    A reply given as a tuple of chunks is sent as separate segments, 50 ms apart.
+    A chunk given as a (bytes, delay) pair is followed by that delay instead.
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    replies = []
+
+    def serve():
+        client, _ = server.accept()
+        with client:
+            pending = b''
+            while True:
+                try:
+                    data = client.recv(65536)
+                except OSError:
+                    break
+                if not data:
+                    break
+                pending += data
+                while b'\n' in pending:
+                    _, pending = pending.split(b'\n', 1)
+                    reply = replies.pop(0)
+                    chunks = reply if isinstance(reply, tuple) else (reply,)
+                    delay = 0.05
+                    for index, chunk in enumerate(chunks):
+                        if index:
+                            time.sleep(delay)
+                        chunk, delay = chunk if isinstance(chunk, tuple) else (chunk, 0.05)
+                        client.sendall(chunk)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield server.getsockname()[1], replies
+    server.close()
+
+
+def test_read_block_with_embedded_terminators(loopback):
+    port, replies = loopback
+    samples = np.arange(-5000, 5000, dtype='>i2')
+    payload = samples.tobytes()
+    assert b'\n' in payload
+
+    replies.append(ieee_block(payload))
+    replies.append(b'DONE\n')
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        data = conn.query_block(':WAV:DATA?', dtype='>i2')
+        assert np.array_equal(data, samples)
+        assert conn.query('*OPC?') == 'DONE'
+    finally:
+        conn.close()
+
+
+def test_read_block_drains_buffered_bytes(loopback):
+    port, replies = loopback
+    payload = bytes(range(256)) * 8
+
+    # Text reply and block arrive together, so the block starts in the read buffer
+    replies.append(b'1\n' + ieee_block(payload))
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        assert conn.query('*OPC?') == '1'
+        data = conn.read_block()
+        assert data.tobytes() == payload
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+@pytest.mark.parametrize("header", [b'#0', b'#A'])
+def test_read_indefinite_length_and_hp_blocks(loopback, use_async, header):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    samples = np.arange(0, 4000, dtype='>u2')  # contains 0x0A bytes
+    if header == b'#A':
+        header += samples.nbytes.to_bytes(2, 'big')
+    replies.extend([header + samples.tobytes() + b'\n', b'1\n'])
+
+    conn = AsyncRawSocketConnection(f"TCPIP::127.0.0.1::{port}::SOCKET", timeout=2.0) \
+        if use_async else RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        assert np.array_equal(conn.query_block(':WAV:DATA?', dtype='>u2'), samples)
+        assert conn.query('*OPC?') == '1'
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_indefinite_block_survives_pause_after_terminator_byte(loopback, use_async):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    payload = bytes(range(256)) * 4
+    assert payload[10] == 0x0A
+    # The first segment ends on a payload 0x0A byte; the rest follows 5 ms later
+    replies.append(((b'#0' + payload[:11], 0.005), payload[11:] + b'\n'))
+    replies.append(b'1\n')
+
+    conn = AsyncRawSocketConnection(f"TCPIP::127.0.0.1::{port}::SOCKET", timeout=2.0) \
+        if use_async else RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        assert conn.query_block(':WAV:DATA?').tobytes() == payload
+        assert conn.query('*OPC?') == '1'
+    finally:
+        conn.close()
+
+
+class EndTerminatedResource:
+    """VISA resource stub holding one message that ends with END."""
+
+    chunk_size = 20 * 1024
+
+    def __init__(self, message: bytes):
+        self.message = message
+        self.read_termination = '\n'
+
+    @contextlib.contextmanager
+    def read_termination_context(self, termination):
+        previous, self.read_termination = self.read_termination, termination
+        yield
+        self.read_termination = previous
+
+    def read_bytes(self, count, break_on_termchar=False):
+        if len(self.message) < count and not break_on_termchar:
+            raise pyvisa.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        data, self.message = self.message[:count], self.message[count:]
+        return data
+
+    def read_raw(self):
+        end = len(self.message)
+        if self.read_termination:
+            end = self.message.find(self.read_termination.encode()) + 1 or end
+        data, self.message = self.message[:end], self.message[end:]
+        return data
+
+
+def test_pyvisa_indefinite_block_reads_to_end():
+    samples = np.arange(0, 300, dtype='>u2')  # contains 0x0A bytes, smaller than a chunk
+    conn = PyVisaConnection('TCPIP::stub::INSTR', resource_manager=object())
+    conn.inst = EndTerminatedResource(b'#0' + samples.tobytes() + b'\n')
+    conn._srq_supported = False
+
+    assert np.array_equal(conn.read_block(dtype='>u2'), samples)
+    assert conn.inst.message == b''
+    assert conn.inst.read_termination == '\n'
+
+
+def test_large_indefinite_block_grows_receive_buffer(loopback):
+    port, replies = loopback
+    samples = np.arange(300000, dtype='>u4')  # several buffer doublings
+    replies.extend([b'#0' + samples.tobytes() + b'\n', b'1\n'])
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        data = conn.query_block(':WAV:DATA?', dtype='>u4')
+        assert np.array_equal(data, samples)
+        assert conn.query('*OPC?') == '1'
+    finally:
+        conn.close()
+
+
+def test_read_block_rejects_bad_header(loopback):
+    port, replies = loopback
+    replies.append(b'1.0,2.0\n')
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        with pytest.raises(ValueError):
+            conn.query_block(':WAV:DATA?')
+    finally:
+        conn.close()
+
+
+def test_receive_buffer_scan_and_compaction():
+    from pymetr.drivers.base.connections import ReceiveBuffer
+
+    buf = ReceiveBuffer(capacity=16)
+    buf.extend(b'ab')
+    assert buf.find_terminator(b'\r\n') == -1
+    buf.extend(b'c\r')
+    assert buf.find_terminator(b'\r\n') == -1
+    buf.extend(b'\nde')
+    pos = buf.find_terminator(b'\r\n')
+    assert pos == 3
+    assert buf.consume(pos) == b'abc'
+    buf.skip(2)
+    assert len(buf) == 2
+
+    # Force compaction and growth past the initial capacity
+    buf.extend(b'x' * 40 + b'\n')
+    pos = buf.find_terminator(b'\n')
+    assert buf.consume(pos) == b'de' + b'x' * 40
+    buf.skip(1)
+    assert not buf
+
+    # A drained buffer rescans from the front after a partial scan
+    buf.extend(b'abcdef')
+    assert buf.find_terminator(b'\n') == -1
+    buf.skip(6)
+    buf.extend(b'1\n')
+    assert buf.find_terminator(b'\n') == 1
+
+
+def test_read_after_drained_buffer_rescans_from_front(loopback):
+    port, replies = loopback
+    payload = bytes(range(64))
+    # The first reply is scanned before its terminator arrives, then drained
+    # completely. The text after the block lands in the drained buffer
+    # without a scan in between and must still be found.
+    replies.append((b'abcdefgh', b'ijkl\n'))
+    replies.append(ieee_block(payload) + b'1\n')
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        assert conn.query('*IDN?') == 'abcdefghijkl'
+        assert conn.query_block(':DATA?').tobytes() == payload
+        result = []
+        reader = threading.Thread(target=lambda: result.append(conn.read()), daemon=True)
+        reader.start()
+        reader.join(3.0)
+        assert result == ['1']
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_block_terminator_in_late_segment(loopback, use_async):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    payload = bytes(range(64))
+    # The terminator trails the payload in its own, delayed segment
+    replies.append((ieee_block(payload)[:-1], b'\n'))
+    replies.append(b'1\n')
+
+    conn = AsyncRawSocketConnection(f"TCPIP::127.0.0.1::{port}::SOCKET", timeout=2.0) \
+        if use_async else RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        assert conn.query_block(':DATA?').tobytes() == payload
+        assert conn.query('*OPC?') == '1'
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_block_without_terminator_is_returned(loopback, caplog, use_async):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    payload = bytes(range(64))
+    replies.append(ieee_block(payload)[:-1])
+    replies.append(b'1\n')
+
+    conn = AsyncRawSocketConnection(f"TCPIP::127.0.0.1::{port}::SOCKET", timeout=0.3) \
+        if use_async else RawSocketConnection('127.0.0.1', port=port, timeout=0.3)
+    conn.open()
+    try:
+        with caplog.at_level('WARNING', logger='pymetr.drivers'):
+            assert conn.query_block(':DATA?').tobytes() == payload
+        assert any('terminator' in r.getMessage() for r in caplog.records)
+        assert conn.query('*OPC?') == '1'
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+@pytest.mark.parametrize("expect_terminator", [False, True])
+def test_block_in_compound_reply_keeps_separator(loopback, caplog, use_async, expect_terminator):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    payload = bytes(range(64))
+    replies.append(ieee_block(payload)[:-1] + b';1.5,2.5\n')
+    replies.append(b'1\n')
+
+    conn = AsyncRawSocketConnection(f"TCPIP::127.0.0.1::{port}::SOCKET", timeout=2.0) \
+        if use_async else RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        with caplog.at_level('WARNING', logger='pymetr.drivers'):
+            block = conn.query_block(':DATA?;:PRE?', expect_terminator=expect_terminator)
+        assert block.tobytes() == payload
+        assert conn.read() == ';1.5,2.5'
+        assert conn.query('*OPC?') == '1'
+        assert not [r for r in caplog.records if 'binary block' in r.getMessage()]
+    finally:
+        conn.close()
+
+
+def test_async_socket_sync_and_awaitable_api(loopback):
+    import asyncio
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    payload = np.arange(1000, dtype='<u2')
+    replies.extend([b'ID,1\n', ieee_block(payload.tobytes()), b'ID,2\n'])
+
+    conn = AsyncRawSocketConnection(f"TCPIP::127.0.0.1::{port}::SOCKET", timeout=2.0)
+    conn.open()
+    try:
+        assert conn.query('*IDN?') == 'ID,1'
+        assert np.array_equal(conn.query_block(':WAV:DATA?', dtype='<u2'), payload)
+
+        async def run():
+            return await asyncio.wrap_future(conn.submit(conn.aquery('*IDN?')))
+
+        assert asyncio.run(run()) == 'ID,2'
+    finally:
+        conn.close()
+
+
+def test_async_instruments_share_one_io_thread(loopback):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+    from pymetr.drivers.base.instrument import SCPIInstrument
+
+    class Generic(SCPIInstrument):
+        def fetch_trace(self):
+            return None
+
+    port, replies = loopback
+    replies.append(b'1\n')
+
+    conn = AsyncRawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    instr = Generic(conn, threaded_mode=True)
+    try:
+        assert instr._worker is None
+        assert instr.query('*OPC?') == '1'
+    finally:
+        instr.close()
+
+
+def test_async_instrument_block_reads_outlast_read_timeout(loopback):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+    from pymetr.drivers.base.instrument import SCPIInstrument
+
+    class Generic(SCPIInstrument):
+        def fetch_trace(self):
+            return None
+
+    port, replies = loopback
+    payload = bytes(range(256)) * 64
+    block = ieee_block(payload)
+    # The block trickles in over ~0.35 s, the late reply after 50 ms
+    replies.append(tuple(block[i:i + 2048] for i in range(0, len(block), 2048)))
+    replies.append((b'', b'late\n'))
+    replies.append(b'1\n')
+
+    conn = AsyncRawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    instr = Generic(conn)
+    instr.read_timeout = 0.02
+    try:
+        assert instr.query_block(':DATA?').tobytes() == payload
+        with pytest.raises(TimeoutError):
+            instr.query('*IDN?')
+        # The cancelled query's reply was drained and is not taken for this one
+        assert instr.query('*OPC?') == '1'
+    finally:
+        instr.close()
+
+
+def test_worker_sleeps_until_woken(loopback):
+    import time
+    from PySide6.QtCore import Qt
+    from pymetr.drivers.base.instrument import ConnectionWorker
+
+    port, replies = loopback
+    replies.append(b'1\n')
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    worker = ConnectionWorker(conn)
+    responses = []
+    worker.command_finished.connect(lambda cmd, resp: responses.append((cmd, resp)),
+                                    Qt.DirectConnection)
+    thread = threading.Thread(target=worker.process_commands, daemon=True)
+    thread.start()
+    try:
+        # Idle worker blocks in the selector and burns no CPU
+        cpu_start = time.process_time()
+        time.sleep(0.3)
+        assert time.process_time() - cpu_start < 0.05
+
+        worker.query('*OPC?')
+        deadline = time.monotonic() + 2.0
+        while not responses and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert responses == [('*OPC?', '1')]
+    finally:
+        worker.stop()
+        thread.join(1.0)
+        conn.close()
+    assert not thread.is_alive()
+
+
+def test_worker_matches_responses_to_requests(loopback):
+    from pymetr.drivers.base.instrument import ConnectionWorker
+
+    port, replies = loopback
+    replies.extend([b'first\n', b'second\n'] + [f'{i}\n'.encode() for i in range(8)])
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    worker = ConnectionWorker(conn, pipeline_depth=4)
+    thread = threading.Thread(target=worker.process_commands, daemon=True)
+    thread.start()
+    try:
+        # Identical concurrent queries each resolve with their own response
+        first, second = worker.query('*OPC?'), worker.query('*OPC?')
+        assert (first.result(2.0), second.result(2.0)) == ('first', 'second')
+
+        futures = [worker.query(f'Q{i}?') for i in range(8)]
+        assert [f.result(2.0) for f in futures] == [str(i) for i in range(8)]
+    finally:
+        worker.stop()
+        thread.join(1.0)
+        conn.close()
+
+
+def test_async_query_many_pipelines_in_order(loopback):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+
+    port, replies = loopback
+    replies.extend(f'{i}\n'.encode() for i in range(5))
+
+    conn = AsyncRawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    try:
+        commands = [f'Q{i}?' for i in range(5)]
+        assert conn.submit(conn.aquery_many(commands, 2)).result(2.0) == [str(i) for i in range(5)]
+    finally:
+        conn.close()
+
+
+def test_async_api_delivers_callbacks_on_gui_thread(loopback, qapp):
+    import time
+    from pymetr.drivers.base.instrument import SCPIInstrument, Subsystem
+    from pymetr.drivers.base.properties import ValueProperty
+
+    class Timebase(Subsystem):
+        scale = ValueProperty(":SCAL", type="float")
+
+    class Generic(SCPIInstrument):
+        def fetch_trace(self):
+            return None
+
+    port, replies = loopback
+    replies.extend([b'1\n', b'2.5E-3\n'])
+
+    conn = RawSocketConnection('127.0.0.1', port=port, timeout=2.0)
+    conn.open()
+    instr = Generic(conn)
+    timebase = Timebase(instr, ":TIM")
+    results = []
+    try:
+        assert instr._worker is not None
+        instr.query_async('*OPC?', callback=lambda r: results.append((r, threading.current_thread())))
+        Timebase.scale.get_async(timebase, callback=lambda v: results.append((v, threading.current_thread())))
+
+        deadline = time.monotonic() + 5.0
+        while len(results) < 2 and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.001)
+        assert [value for value, _ in results] == ['1', 2.5e-3]
+        assert all(thread is threading.main_thread() for _, thread in results)
+    finally:
+        instr.close()
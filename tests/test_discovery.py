@@ -0,0 +1,133 @@
+# tests/test_discovery.py
+import threading
+import time
+
+import pytest
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.connections import PyVisaConnection, RawSocketConnection
+from pymetr.drivers.base.discovery import (
+    DiscoveryCache, parse_idn, probe_instruments, stream_probes
+)
+from pymetr.drivers.emulator import EmulatorServer, ScopeEmulator, SynthesizerEmulator
+
+
+@pytest.fixture
+def slow_instruments():
+    """Two emulated instruments that take 0.3 s to answer *IDN?."""
+    servers = [
+        EmulatorServer(ScopeEmulator(latencies={r'\*IDN': 0.3})).start(),
+        EmulatorServer(SynthesizerEmulator(latencies={r'\*IDN': 0.3})).start(),
+    ]
+    yield [server.resource for server in servers]
+    for server in servers:
+        server.stop()
+
+
+def test_cache_persists_and_expires(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = DiscoveryCache(path, ttl=60)
+    cache.update("TCPIP::10.0.0.5::5025::SOCKET", parse_idn("ACME,X1,SN1,1.0"))
+    cache.update("TCPIP::10.0.0.6::5025::SOCKET", parse_idn("ACME,X2"), seen_at=time.time() - 120)
+    cache.save()
+
+    reloaded = DiscoveryCache(path, ttl=60)
+    assert list(reloaded.fresh()) == ["TCPIP::10.0.0.5::5025::SOCKET"]
+    assert reloaded.get("TCPIP::10.0.0.5::5025::SOCKET").idn == ("ACME", "X1", "SN1", "1.0")
+
+    path.write_text("not json")
+    assert DiscoveryCache(path).fresh() == {}
+
+
+def test_probe_instruments_runs_concurrently(slow_instruments):
+    start = time.perf_counter()
+    results = dict(probe_instruments(slow_instruments + ["TCPIP::127.0.0.1::1::SOCKET"],
+                                     timeout=1.0))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.55
+    assert results["TCPIP::127.0.0.1::1::SOCKET"] is None
+    assert results[slow_instruments[0]][1] == "DSO-X 1204G"
+    assert results[slow_instruments[1]][1] == "HS9004A"
+
+
+def test_list_instruments_reports_cached_entries_first(tmp_path, monkeypatch, slow_instruments):
+    from pymetr.drivers.base.instrument import Instrument
+
+    scope, synth = slow_instruments
+    monkeypatch.setattr(RawSocketConnection, "_discover_udp",
+                        staticmethod(lambda timeout, ip_range: {synth: synth}))
+    monkeypatch.setattr(PyVisaConnection, "list_instruments", staticmethod(lambda: {}))
+
+    cache = DiscoveryCache(tmp_path / "cache.json")
+    cache.update(scope, parse_idn("KEYSIGHT TECHNOLOGIES,DSO-X 1204G,EMU00000001,02.12"))
+
+    found = []
+    start = time.perf_counter()
+    instruments = Instrument.list_instruments(
+        on_found=lambda info: found.append((info['model'], time.perf_counter() - start)),
+        cache=cache)
+
+    # The cached scope is reported before any probe has had time to answer
+    assert found[0][0] == "DSO-X 1204G" and found[0][1] < 0.1
+    assert {info['model'] for info in instruments.values()} == {"DSO-X 1204G", "HS9004A"}
+    assert synth in DiscoveryCache(tmp_path / "cache.json").fresh()
+
+
+def test_subnet_scanner_streams_open_ports_quickly():
+    from pymetr.drivers.base.discovery import SubnetScanner
+
+    with EmulatorServer(ScopeEmulator()) as server:
+        streamed = []
+        scanner = SubnetScanner(ports=[server.port])
+        start = time.perf_counter()
+        # A /22 of loopback addresses: 1022 hosts, only 127.0.0.1 listens
+        found = scanner.scan_ranges(["127.0.0.0/22"], on_found=streamed.append)
+        elapsed = time.perf_counter() - start
+
+    assert found == {server.resource: server.resource}
+    assert streamed == [server.resource]
+    assert elapsed < 3.0
+    assert scanner.min_timeout <= scanner.timeout <= scanner.max_timeout
+
+
+def test_stream_probes_yields_before_slow_sources_finish(slow_instruments):
+    scope, synth = slow_instruments
+
+    def slow_source():
+        time.sleep(1.0)
+        yield synth
+
+    start = time.perf_counter()
+    stream = stream_probes({"fast": lambda: [scope], "slow": slow_source}, timeout=1.0)
+    resource, idn = next(stream)
+    first = time.perf_counter() - start
+    rest = list(stream)
+
+    assert resource == scope and idn[1] == "DSO-X 1204G"
+    assert first < 0.6
+    assert [r for r, _ in rest] == [synth]
+
+
+def test_iter_instruments_stops_on_request(tmp_path, monkeypatch, slow_instruments):
+    from pymetr.drivers.base.instrument import Instrument
+
+    scope, _ = slow_instruments
+
+    def hanging_udp(timeout, ip_range):
+        time.sleep(5.0)
+        return {}
+
+    monkeypatch.setattr(RawSocketConnection, "_discover_udp", staticmethod(hanging_udp))
+    monkeypatch.setattr(PyVisaConnection, "list_instruments", staticmethod(lambda: {scope: scope}))
+
+    stop = threading.Event()
+    start = time.perf_counter()
+    found = []
+    for unique_id, info in Instrument.iter_instruments(cache=DiscoveryCache(tmp_path / "c.json"),
+                                                       stop_event=stop):
+        found.append(info['resource'])
+        stop.set()
+
+    assert found == [scope]
+    assert time.perf_counter() - start < 1.0
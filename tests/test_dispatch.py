@@ -0,0 +1,85 @@
+# tests/test_dispatch.py
+import pytest
+from PySide6.QtCore import QObject
+
+from pymetr.core.dispatch import ModelChangeDispatcher
+
+PARENTS = {"trace1": "plot1", "marker1": "trace1", "trace2": "plot2"}
+
+
+def ancestors(model_id):
+    chain = []
+    while model_id in PARENTS:
+        model_id = PARENTS[model_id]
+        chain.append(model_id)
+    return tuple(chain), frozenset(chain)
+
+
+@pytest.fixture
+def dispatcher():
+    return ModelChangeDispatcher(ancestors)
+
+
+def recorder(calls, name):
+    return lambda model_id, model_type, prop, value: calls.append((name, model_id, prop))
+
+
+def test_changes_reach_only_matching_subscriptions(dispatcher):
+    calls = []
+    dispatcher.subscribe(recorder(calls, "model"), model_id="trace1")
+    dispatcher.subscribe(recorder(calls, "subtree"), subtree="plot1")
+    dispatcher.subscribe(recorder(calls, "type"), model_type=("Trace", "Marker"), prop="data")
+    dispatcher.subscribe(recorder(calls, "prop"), prop="name")
+    dispatcher.subscribe(recorder(calls, "all"))
+
+    assert dispatcher.dispatch("marker1", "Marker", "data", 1) == 3
+    assert sorted(calls) == [("all", "marker1", "data"), ("subtree", "marker1", "data"),
+                             ("type", "marker1", "data")]
+
+    calls.clear()
+    assert dispatcher.dispatch("trace2", "Trace", "name", "x") == 2
+    assert sorted(calls) == [("all", "trace2", "name"), ("prop", "trace2", "name")]
+
+
+def test_unsubscribe_during_dispatch_and_failing_callbacks(dispatcher):
+    calls = []
+
+    def once(model_id, model_type, prop, value):
+        calls.append("once")
+        subscription.cancel()
+
+    def broken(model_id, model_type, prop, value):
+        raise RuntimeError("boom")
+
+    subscription = dispatcher.subscribe(once, subtree="plot1")
+    dispatcher.subscribe(broken, subtree="plot1")
+    dispatcher.subscribe(recorder(calls, "after"), subtree="plot1")
+
+    dispatcher.dispatch("trace1", "Trace", "data", None)
+    dispatcher.dispatch("trace1", "Trace", "data", None)
+    assert calls == ["once", ("after", "trace1", "data"), ("after", "trace1", "data")]
+    assert dispatcher.subscription_count() == 2
+    dispatcher.unsubscribe(subscription)  # already cancelled: ignored
+    dispatcher.unsubscribe(None)
+
+
+def test_owner_destruction_ends_subscription(dispatcher, qapp):
+    owner = QObject()
+    dispatcher.subscribe(lambda *args: None, model_id="plot1", owner=owner)
+    assert dispatcher.subscription_count() == 1
+
+    del owner  # Python-owned QObject: destroyed here
+    assert dispatcher.subscription_count() == 0
+
+
+def test_dispatch_many_delivers_a_batch_once_per_grouped_subscription(dispatcher):
+    calls = []
+    dispatcher.subscribe(lambda model_id, model_type, changes: calls.append(("grouped", dict(changes))),
+                         subtree="plot1", grouped=True)
+    dispatcher.subscribe(recorder(calls, "prop"), prop=("color", "width"))
+    dispatcher.subscribe(lambda model_id, model_type, changes: calls.append(("none", changes)),
+                         prop="data", grouped=True)
+
+    changes = {"color": "red", "width": 2, "name": "t"}
+    assert dispatcher.dispatch_many("trace1", "Trace", changes) == 3
+    assert calls == [("grouped", changes), ("prop", "trace1", "color"), ("prop", "trace1", "width")]
@@ -0,0 +1,52 @@
+# tests/test_driver_registry.py
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.instruments import registry as registry_module
+from pymetr.drivers.instruments.registry import DRIVER_REGISTRY, DriverInfo, DriverRegistry
+
+
+def test_builtin_models_resolve_without_imports():
+    info = DRIVER_REGISTRY.resolve("hs9004a")
+    assert (info.class_name, info.socket_port) == ("HS9000", 9760)
+    assert DRIVER_REGISTRY.resolve("DSO-X 1204G").class_name == "Dsox1204g"
+    assert DRIVER_REGISTRY.resolve("HP8564E") is None
+    with pytest.raises(ValueError):
+        DRIVER_REGISTRY.get_driver_info("HP437B")
+
+
+def test_wildcards_lazy_loading_and_overrides(monkeypatch):
+    registry = DriverRegistry(load_entry_points=False)
+    registry.register("SA9*", DriverInfo("tests.fake_sa", "Generic"))
+    registry.register("SA9[0-4]??", DriverInfo("tests.fake_sa", "Early"))
+    registry.register("SA9100", DriverInfo("tests.fake_sa", "Exact"))
+    assert registry.resolve("SA9020").class_name == "Early"  # newest pattern first
+    assert registry.resolve("SA9900").class_name == "Generic"
+    assert registry.resolve("sa9100").class_name == "Exact"
+
+    module = SimpleNamespace(Early=type("Early", (), {}))
+    monkeypatch.setitem(sys.modules, "tests.fake_sa", module)
+    assert not registry.is_loaded("SA9020")
+    assert registry.load_driver_class("SA9020") is module.Early
+    assert registry.is_loaded("SA9030")
+
+
+def test_entry_points_register_on_first_lookup(monkeypatch):
+    entry_point = SimpleNamespace(name="N9020*", value="acme_pymetr.mxa:N9020")
+    calls = []
+
+    def entry_points():
+        calls.append(1)
+        return SimpleNamespace(select=lambda group: [entry_point] if group == "pymetr.drivers" else [])
+
+    monkeypatch.setattr(registry_module.metadata, "entry_points", entry_points)
+    registry = DriverRegistry()
+    registry.register("HP8563A", DriverInfo("pymetr.drivers.instruments.hp8563a", "HP8563A"))
+    assert calls == []
+    info = registry.resolve("N9020B")
+    assert (info.module, info.class_name) == ("acme_pymetr.mxa", "N9020")
+    registry.resolve("N9020A")
+    assert calls == [1]
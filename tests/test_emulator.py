@@ -0,0 +1,286 @@
+# tests/test_emulator.py
+import time
+
+import numpy as np
+import pytest
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.connections import RawSocketConnection
+from pymetr.drivers.emulator import (
+    EmulatorServer, ScopeEmulator, SpectrumAnalyzerEmulator, SynthesizerEmulator, scpi_pattern
+)
+
+
+@pytest.fixture
+def emulator():
+    """
+    Factory fixture: emulator(instrument) -> opened RawSocketConnection, or
+    emulator(instrument, driver=Cls) -> driver instance closed on teardown.
+    Pass transport= to connect with another connection class.
+    """
+    servers, connections, drivers = [], [], []
+
+    def start(instrument, driver=None, transport=RawSocketConnection, **conn_kwargs):
+        server = EmulatorServer(instrument).start()
+        conn = transport(server.resource, timeout=2.0, **conn_kwargs)
+        conn.open()
+        servers.append(server)
+        connections.append(conn)
+        if driver is None:
+            return conn
+        # Drivers own a worker QThread that must be stopped before collection
+        drivers.append(driver(conn))
+        return drivers[-1]
+
+    yield start
+    for driver in drivers:
+        driver.close()
+    for conn in connections:
+        conn.close()
+    for server in servers:
+        server.stop()
+
+
+def test_scpi_pattern_accepts_short_and_long_forms():
+    import re
+    pattern = re.compile(scpi_pattern(":WAVeform:PREamble?"), re.IGNORECASE)
+    assert pattern.fullmatch(":WAV:PRE?")
+    assert pattern.fullmatch(":waveform:preamble?")
+    assert not pattern.fullmatch(":WAVE:PRE?")
+
+
+def test_scope_driver_reads_preamble_and_waveform(emulator):
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    scope = emulator(ScopeEmulator(points=5000, seed=1), driver=Dsox1204g)
+    scope.waveform.format = "WORD"
+    scope.waveform.byte_order = "LSBFirst"
+
+    preamble = scope.waveform.preamble
+    assert int(preamble[2]) == 5000
+
+    codes = scope.waveform.query_block(":DATa?", dtype='<u2')
+    assert codes.shape == (5000,)
+    volts = (codes - preamble[9]) * preamble[7] + preamble[8]
+    assert 1.5 < volts.max() < 2.5
+
+
+@pytest.mark.parametrize("fmt, byte_order, unsigned, dtype", [
+    ("BYTE", "MSBFirst", True, 'u1'),
+    ("WORD", "LSBFirst", False, '<i2'),
+    ("WORD", "MSBFirst", True, '>u2'),
+    ("ASCII", "MSBFirst", True, None),
+])
+def test_scope_waveform_dtype_follows_format(emulator, fmt, byte_order, unsigned, dtype):
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    scope = emulator(ScopeEmulator(points=2000, seed=1), driver=Dsox1204g)
+    scope.waveform.format = fmt
+    scope.waveform.byte_order = byte_order
+    scope.waveform.unsigned = unsigned
+
+    if dtype is not None:
+        assert scope.waveform.data.dtype == np.dtype(dtype)
+    volts = scope.waveform.voltage
+    assert volts.dtype == np.float64 and volts.shape == (2000,)
+    assert 1.5 < volts.max() < 2.5 and -2.5 < volts.min() < -1.5
+
+
+def test_spectrum_analyzer_sweep_and_trace(emulator):
+    from pymetr.drivers.instruments.hp8563a import HP8563A
+
+    sa = emulator(SpectrumAnalyzerEmulator(seed=1), driver=HP8563A, read_termination='\r\n')
+    sa.frequency.center = 2.4e9
+    sa.frequency.span = 20e6
+    assert sa.frequency.start == pytest.approx(2.39e9)
+
+    sa.sweep.time = 0.2
+    sa.single_sweep()
+    assert sa.query("DONE?") == "0"
+    time.sleep(0.25)
+    assert sa.query("DONE?") == "1"
+
+    trace = sa.trace.data
+    assert trace.shape == (601,)
+    assert np.argmax(trace) == 300
+
+
+def test_spectrum_analyzer_binary_trace_matches_ascii(emulator):
+    from pymetr.drivers.instruments.hp8563a import HP8563A
+
+    analyzer = SpectrumAnalyzerEmulator(seed=1)
+    sa = emulator(analyzer, driver=HP8563A, read_termination='\r\n')
+    sa.sweep.time = 0.05
+    sa.amplitude.reference_level = -10
+
+    start = time.perf_counter()
+    (trace,) = sa.fetch_trace()
+    assert time.perf_counter() - start >= 0.05
+    assert analyzer.settings["TDF"] == "A"
+    freq, binary = trace.data
+    assert binary.dtype == np.float64 and binary.shape == (601,)
+    assert binary[300] == pytest.approx(-20.0, abs=0.2)
+    assert freq[300] == pytest.approx(1e9)
+
+    sa.binary_transfer = False
+    (trace,) = sa.fetch_trace()
+    assert analyzer.settings["TDF"] == "P"
+    assert np.abs(trace.data[1] - binary).max() < 10
+
+
+def test_spectrum_analyzer_continuous_mode_pipelines_sweeps(emulator):
+    from pymetr.drivers.instruments.hp8563a import HP8563A
+
+    analyzer = SpectrumAnalyzerEmulator(seed=1)
+    sa = emulator(analyzer, driver=HP8563A, read_termination='\r\n')
+    sa.sweep.time = 0.1
+    sa.set_continuous_mode(True)
+    sa.fetch_trace()
+    assert sa._sweep_in_progress  # next sweep already running
+
+    time.sleep(0.1)  # host-side processing overlaps the sweep
+    start = time.perf_counter()
+    sa.fetch_trace()
+    assert time.perf_counter() - start < 0.08
+
+    sa.set_continuous_mode(False)
+    sa.fetch_trace()
+    assert not sa._sweep_in_progress
+
+
+def test_spectrum_analyzer_sweep_wait_keeps_gui_responsive(qapp, emulator):
+    from PySide6.QtCore import QTimer
+    from pymetr.drivers.instruments.hp8563a import HP8563A
+
+    sa = emulator(SpectrumAnalyzerEmulator(seed=1), driver=HP8563A, read_termination='\r\n')
+    sa.sweep.time = 0.3
+    ticks = []
+    timer = QTimer()
+    timer.timeout.connect(lambda: ticks.append(time.monotonic()))
+    timer.start(10)
+    try:
+        (trace,) = sa.fetch_trace()
+    finally:
+        timer.stop()
+    assert trace.data[1].shape == (601,)
+    assert len(ticks) >= 10  # the event loop ran during the sweep
+
+
+def test_spectrum_analyzer_sweep_wait_reports_query_errors(emulator, monkeypatch):
+    from pymetr.drivers.instruments.hp8563a import HP8563A
+
+    sa = emulator(SpectrumAnalyzerEmulator(seed=1), driver=HP8563A, read_termination='\r\n')
+    sa.sweep.time = 0.01
+    sa.single_sweep()
+
+    def broken_query(command):
+        raise ConnectionError("link lost")
+
+    monkeypatch.setattr(sa, "query", broken_query)
+    start = time.monotonic()
+    with pytest.raises(ConnectionError, match="link lost"):
+        sa.wait_for_sweep()
+    assert time.monotonic() - start < sa.sweep_timeout_margin
+    assert not sa._sweep_in_progress
+
+
+def test_synthesizer_channel_frequency_family(emulator):
+    from pymetr.drivers.instruments.hs9000 import HS9000
+
+    synth = emulator(SynthesizerEmulator(), driver=HS9000)
+    synth.channel[2].frequency = 2.105e9
+    assert synth.channel[2].frequency == pytest.approx(2.105e9)
+    assert synth.channel[1].frequency == pytest.approx(1e9)
+    assert synth.channel[2].freq_max[0] == pytest.approx(6e9)
+
+
+def test_latency_and_per_command_overrides(emulator):
+    conn = emulator(ScopeEmulator(latency=0.0, latencies={r'\*OPC': 0.05}))
+    start = time.perf_counter()
+    conn.query("*IDN?")
+    fast = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert conn.query("*OPC?") == "1"
+    assert time.perf_counter() - start >= 0.05 > fast
+
+
+def test_scope_fetch_trace_one_round_trip_per_channel(emulator):
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    scope_emulator = ScopeEmulator(points=3000, seed=1)
+    scope = emulator(scope_emulator, driver=Dsox1204g)
+    scope.format = "WORD"
+    sources = ["CHAN1", "CHAN2", "CHAN3", "CHAN4"]
+
+    first = scope.fetch_trace(*sources)
+    sent = scope_emulator.messages_received
+    second = scope.fetch_trace(*sources)
+
+    # :DIGitize, *OPC?, format check and one message per channel
+    assert scope_emulator.messages_received - sent == 3 + len(sources)
+    assert [trace.name for trace in second] == sources
+    assert second[0].x_data is first[3].x_data  # shared cached time axis
+    assert len(second[0].x_data) == 3000
+    assert 1.5 < second[2].y_data.max() < 2.5
+
+
+def test_scope_fetch_keeps_property_cache(emulator):
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    scope_emulator = ScopeEmulator(points=1000, seed=1)
+    scope = emulator(scope_emulator, driver=Dsox1204g)
+    scope.property_cache.enabled = True  # as Device does at connect
+    scope.format = "WORD"
+    scope.timebase.scale = 2e-3
+    scope.fetch_trace("CHAN1", "CHAN2")
+
+    sent = scope_emulator.messages_received
+    scope.fetch_trace("CHAN1", "CHAN2")
+    # :DIGitize, *OPC? and one message per channel; the format check is cached
+    assert scope_emulator.messages_received - sent == 2 + 2
+    assert scope.waveform.source == "CHAN2"
+    assert scope.timebase.scale == 2e-3
+    assert scope_emulator.messages_received - sent == 2 + 2  # both served from the cache
+
+    scope.acquire_segments(3)
+    sent = scope_emulator.messages_received
+    assert scope.acquire.segment_index == 3
+    assert scope.acquire.mode == "SEGMented"
+    assert scope_emulator.messages_received == sent
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_scope_compound_waveform_reply_parses_cleanly(emulator, caplog, use_async):
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    transport = AsyncRawSocketConnection if use_async else RawSocketConnection
+    scope = emulator(ScopeEmulator(points=2000, seed=1), driver=Dsox1204g, transport=transport)
+    scope.format = "WORD"
+
+    with caplog.at_level('WARNING', logger='pymetr.drivers'):
+        traces = scope.fetch_trace("CHAN1", "CHAN2")
+    assert not [r for r in caplog.records if 'binary block' in r.getMessage()]
+    # The preamble after each block scales the data and builds the time axis
+    assert [len(trace.x_data) for trace in traces] == [2000, 2000]
+    assert 1.5 < traces[0].y_data.max() < 2.5
+    assert scope.query("*OPC?") == "1"
+
+
+def test_scope_segmented_acquisition(emulator):
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    scope_emulator = ScopeEmulator(points=500, seed=1)
+    scope = emulator(scope_emulator, driver=Dsox1204g)
+    scope.format = "WORD"
+    scope.acquire_segments(2)
+    sent = scope_emulator.messages_received
+
+    burst = scope.acquire_segments(50, source="CHAN2")
+    # Settings, :DIGitize, *OPC?, format check, count + preamble, one per segment
+    assert scope_emulator.messages_received - sent <= 5 + 50
+    assert burst.data.shape == (50, 500) and burst.data.flags.c_contiguous
+    assert burst.time.shape == (500,)
+    assert np.allclose(np.diff(burst.timestamps), scope_emulator.segment_period)
+    assert np.array_equal(np.roll(burst.data[0], 3), burst.data[3])
@@ -0,0 +1,39 @@
+# tests/test_instrument_factory.py
+import os
+from pathlib import Path
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.ui.factories.instrument_factory import DriverConfigCache, InstrumentFactory
+
+DRIVER_DIR = Path(__file__).resolve().parents[1] / "src" / "pymetr" / "drivers" / "instruments"
+
+
+def test_driver_config_cache_hits_and_invalidates(tmp_path):
+    driver = tmp_path / "hs9000.py"
+    driver.write_text((DRIVER_DIR / "hs9000.py").read_text())
+    builds = []
+
+    class CountingFactory(InstrumentFactory):
+        def create_ui_configuration_from_source(self, source):
+            builds.append(source)
+            return super().create_ui_configuration_from_source(source)
+
+    cache_dir = tmp_path / "cache"
+    factory = CountingFactory(cache=DriverConfigCache(cache_dir))
+    first = factory.create_instrument_data_from_driver(str(driver))
+    assert first['parameter_tree'] == factory.create_instrument_data_from_driver(str(driver), use_cache=False)['parameter_tree']
+    builds.clear()
+
+    first['parameter_tree'].clear()  # callers get their own copy
+    assert factory.create_instrument_data_from_driver(str(driver))['parameter_tree']
+    restarted = CountingFactory(cache=DriverConfigCache(cache_dir))
+    assert restarted.create_instrument_data_from_driver(str(driver)) == factory.create_instrument_data_from_driver(str(driver))
+    stat = driver.stat()
+    os.utime(driver, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # touched, same content
+    restarted.create_instrument_data_from_driver(str(driver))
+    assert builds == []
+
+    driver.write_text(driver.read_text().replace("class HS9000(", "class HS9001("))
+    tree = restarted.create_instrument_data_from_driver(str(driver))['parameter_tree']
+    assert len(builds) == 1
+    assert tree[0]['name'] == "HS9001"
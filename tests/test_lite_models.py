@@ -0,0 +1,29 @@
+# tests/test_lite_models.py
+from pymetr.models import LiteModel, Measurement
+
+
+def test_measurement_is_slotted_and_cheap():
+    first, second = Measurement("Vpp", 1.2, "V"), Measurement("Vpp", 1.3, "V")
+    assert isinstance(first, LiteModel)
+    assert not hasattr(first, '__dict__')
+    assert first.id != second.id
+    assert first.to_string() == "1.2 V"
+    assert first.get_property_version("value") == 0
+
+
+def test_lite_changes_reach_subscribers_through_state(state):
+    measurement = state.create_model(Measurement, name="Vpp", value=1.0, units="V")
+    received = []
+    state.subscribe(lambda model_id, model_type, prop, value: received.append((model_type, prop, value)),
+                    model_id=measurement.id)
+
+    measurement.set_limits(0.0, 2.0)
+    measurement.value = 3.0
+    measurement.value = 3.0  # unchanged
+    assert received == [("Measurement", "limits", (0.0, 2.0)),
+                        ("Measurement", "value", 3.0), ("Measurement", "status", "Invalid")]
+    assert measurement.get_property_version("value") == 1
+
+    state.remove_model(measurement.id)
+    assert state.get_model(measurement.id) is None
+    assert measurement.state is None
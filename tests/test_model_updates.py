@@ -0,0 +1,104 @@
+# tests/test_model_updates.py
+import numpy as np
+import pytest
+
+import pymetr.core  # noqa: F401 - import core before models to settle import order
+from pymetr.models.base import BaseModel
+from pymetr.models.plot import Plot
+from pymetr.models.trace import Trace
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+def record(model):
+    changes = []
+    model.property_changed.connect(lambda *args: changes.append(args[2:]))
+    model.properties_changed.connect(lambda model_id, model_type, batch: changes.append(dict(batch)))
+    return changes
+
+
+def test_unchanged_scalars_are_suppressed_and_arrays_versioned():
+    model = BaseModel("Test")
+    changes = record(model)
+
+    model.set_property("width", 2)
+    model.set_property("width", 2)
+    model.set_property("width", 2.0)  # different type: still a change
+    model.set_property("x_lim", (0.0, 1.0))
+    model.set_property("x_lim", (0.0, 1.0))
+    data = np.zeros(4)
+    model.set_property("data", data)
+    model.set_property("data", data)  # arrays are never compared
+
+    assert [prop for prop, _ in changes] == ["width", "width", "x_lim", "data", "data"]
+    assert model.get_property_version("width") == 2
+    assert model.get_property_version("data") == 2
+    assert model.get_property_version("missing") == 0
+
+
+def test_batches_emit_one_grouped_change():
+    model = BaseModel("Test")
+    changes = record(model)
+
+    with model.batch_update():
+        model.set_property("color", "red")
+        with model.batch_update():  # nested batches flush with the outermost
+            model.set_property("width", 3)
+        model.set_property("color", "blue")
+        assert changes == []
+    assert changes == [{"width": 3, "color": "blue"}]
+
+    changes.clear()
+    model.begin_update()
+    model.set_property("width", 3)  # unchanged: nothing to emit
+    model.set_property("style", "dash")
+    model.end_update()
+    assert changes == [("style", "dash")]
+
+
+def test_constructors_announce_properties_once(monkeypatch):
+    unbatched, flushes = [], []
+    set_property = BaseModel.set_property
+    flush = BaseModel._process_pending_updates
+
+    def checked_set_property(self, name, value):
+        if not self._batch_depth:
+            unbatched.append(name)
+        set_property(self, name, value)
+
+    def counted_flush(self):
+        flushes.append(len(self._pending_updates))
+        flush(self)
+
+    monkeypatch.setattr(BaseModel, "set_property", checked_set_property)
+    monkeypatch.setattr(BaseModel, "_process_pending_updates", counted_flush)
+
+    trace = Trace(np.arange(3), np.arange(3), name="t", color="red")
+    plot = Plot("Spectrum")
+    assert unbatched == []
+    assert len(flushes) == 2 and min(flushes) > 1
+    assert trace.get_property("color") == "red"
+    assert plot.get_property("name") == "Spectrum"
+
+
+def test_state_delivers_constructor_batch_as_one_unit():
+    from pymetr.core.state import ApplicationState
+    from pymetr.models.device import Device
+
+    state = ApplicationState()
+    grouped, single, signals = [], [], []
+    state.subscribe(lambda model_id, model_type, changes: grouped.append(dict(changes)),
+                    model_type="Device", grouped=True)
+    state.subscribe(lambda model_id, model_type, prop, value: single.append(prop),
+                    model_type="Device", prop=("model", "serial"))
+    state.model_changed.connect(lambda *args: signals.append(args[2]))
+    state.model_properties_changed.connect(lambda model_id, model_type, changes: signals.append(len(changes)))
+
+    device = Device(model="DSOX1204G", serial_number="1234", state=state)
+    # The constructor batch, then the default plot it creates afterwards
+    assert [sorted(changes) for changes in grouped[1:]] == [["default_plot_id"]]
+    batch = grouped[0]
+    assert len(batch) > 1 and batch["model"] == "DSOX1204G"
+    assert sorted(single) == ["model", "serial"]
+    assert signals == [len(batch), "default_plot_id"]
+    device.cleanup()
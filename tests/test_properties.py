@@ -0,0 +1,265 @@
+# tests/test_properties.py
+import time
+
+import numpy as np
+import pytest
+
+import pymetr.core  # noqa: F401 - import core before drivers to settle import order
+from pymetr.drivers.base.connections import RawSocketConnection
+from pymetr.drivers.base.properties import CachePolicy, DataProperty, ValueProperty, parse_numbers
+from pymetr.drivers.emulator import EmulatorServer, SynthesizerEmulator
+
+
+@pytest.fixture
+def synth():
+    """HS9000 driver with the property cache enabled, plus its emulator."""
+    from pymetr.drivers.instruments.hs9000 import HS9000
+
+    emulator = SynthesizerEmulator()
+    with EmulatorServer(emulator) as server:
+        conn = RawSocketConnection(server.resource, timeout=2.0)
+        conn.open()
+        driver = HS9000(conn, threaded_mode=False, cache_properties=True)
+        yield driver, emulator
+        driver.close()
+
+
+def test_default_cache_policies():
+    assert ValueProperty(":FREQ").cache == CachePolicy.CACHE_UNTIL_WRITE
+    assert ValueProperty(":TEMP", access='read').cache == CachePolicy.VOLATILE
+    with pytest.raises(ValueError):
+        ValueProperty(":FREQ", cache="forever")
+
+
+def test_cache_serves_reads_per_channel(synth):
+    driver, emulator = synth
+    ch1, ch2 = driver.channel[1], driver.channel[2]
+
+    ch1.frequency = 2.1e9
+    driver.query("*OPC?")  # the emulator has processed the write
+    sent = emulator.commands_received
+    assert ch1.frequency == pytest.approx(2.1e9)
+    assert emulator.commands_received == sent  # written value is cached
+
+    ch2.frequency  # separate entry per channel instance
+    ch2.frequency
+    ch2.temperature  # volatile
+    ch2.temperature
+    assert emulator.commands_received == sent + 3
+
+    ch1.freq_min
+    ch1.freq_min
+    assert emulator.commands_received == sent + 4
+
+
+def test_raw_writes_and_reset_invalidate(synth):
+    driver, emulator = synth
+    ch1 = driver.channel[1]
+    ch1.frequency
+    ch1.freq_min
+    sent = emulator.commands_received
+
+    driver.write("*RST")
+    ch1.frequency  # answered after *RST, which the emulator counts too
+    ch1.freq_min  # immutable values survive a reset
+    assert emulator.commands_received == sent + 2
+
+    driver.property_cache.enabled = False
+    ch1.freq_min
+    assert emulator.commands_received == sent + 3
+
+
+def test_uncached_reads_see_front_panel_changes(synth):
+    driver, emulator = synth
+    ch1 = driver.channel[1]
+    power = type(ch1).power
+
+    ch1.power = 5  # cached as written
+    driver.query("*OPC?")
+    emulator.channels[1]["PWR"] = -7.0  # changed on the front panel
+    assert ch1.power == pytest.approx(5)
+    assert driver.query_properties([(ch1, power)]) == [pytest.approx(5)]
+
+    assert power.get_async(ch1, use_cache=False).result(2.0) == pytest.approx(-7)
+    emulator.channels[1]["PWR"] = -9.0
+    assert driver.query_properties([(ch1, power)], use_cache=False) == [pytest.approx(-9)]
+    assert ch1.power == pytest.approx(-9)  # the fresh value refreshed the cache
+
+
+def test_cache_ttl_expires(synth):
+    driver, emulator = synth
+    prop = ValueProperty(":CH1:FREQ", type="float", join_char=":", cache_ttl=0.05)
+    prop.__get__(driver, type(driver))
+    sent = emulator.commands_received
+    prop.__get__(driver, type(driver))
+    assert emulator.commands_received == sent
+    time.sleep(0.06)
+    prop.__get__(driver, type(driver))
+    assert emulator.commands_received == sent + 1
+
+
+def test_snapshot_batches_compound_queries():
+    from pymetr.drivers.emulator import ScopeEmulator
+    from pymetr.drivers.instruments.dsox1204g import Dsox1204g
+
+    emulator = ScopeEmulator()
+    with EmulatorServer(emulator) as server:
+        conn = RawSocketConnection(server.resource, timeout=2.0)
+        conn.open()
+        scope = Dsox1204g(conn)
+        try:
+            snapshot = scope.snapshot()
+            assert emulator.messages_received <= 5
+            assert emulator.commands_received == len(snapshot) > 40
+            assert 'waveform.data' not in snapshot
+            assert snapshot['channel[1].scale'] == 1.0
+            assert snapshot['channel[2].display'] is False
+            assert snapshot['timebase.reference'] == 'CENTer'
+
+            assert scope.channel[3].snapshot()['probe'] == 10.0
+        finally:
+            scope.close()
+
+
+def test_split_compound_response_respects_quotes():
+    from pymetr.drivers.base.instrument import _split_compound_response
+
+    assert _split_compound_response('1;"a;b";OFF') == ['1', '"a;b"', 'OFF']
+
+
+def test_batch_coalesces_setter_writes(synth):
+    driver, emulator = synth
+    channels = driver.channel[1:]
+    sent, commands = emulator.messages_received, emulator.commands_received
+
+    with driver.batch():
+        for channel in channels:
+            channel.frequency = 1e9
+            channel.power = 0
+        for channel in channels:
+            channel.frequency = 2.5e9  # last write wins
+        assert emulator.messages_received == sent
+
+    driver.query("*OPC?")
+    assert emulator.messages_received <= sent + 3
+    assert emulator.commands_received == commands + 2 * len(channels) + 1
+    assert all(state["FREQ"] == pytest.approx(2.5e9) for state in emulator.channels.values())
+
+
+def test_batch_defers_read_back_and_drops_on_error(synth):
+    driver, emulator = synth
+    ch1 = driver.channel[1]
+    ch1.read_after_write = True
+
+    with driver.batch():
+        ch1.frequency = 3e9
+        ch1.power = 5
+    assert ch1.frequency == pytest.approx(3e9)
+    assert type(ch1).power.last_response(ch1).value == pytest.approx(5)
+    # Responses are per channel, not shared through the descriptor
+    ch2 = driver.channel[2]
+    ch2.power = -3
+    assert type(ch1).power.last_response(ch2).value == pytest.approx(-3)
+    assert type(ch1).power.last_response(ch1).value == pytest.approx(5)
+
+    sent = emulator.messages_received
+    with pytest.raises(RuntimeError):
+        with driver.batch():
+            ch1.frequency = 4e9
+            raise RuntimeError("abort")
+    assert emulator.messages_received == sent
+    assert ch1.frequency == pytest.approx(3e9)
+
+
+def test_queries_inside_batch_are_sent_immediately(synth):
+    import threading
+
+    driver, emulator = synth
+    ch1, ch2 = driver.channel[1], driver.channel[2]
+    results = []
+
+    def run():
+        with driver.batch():
+            ch1.frequency = 2e9
+            results.append(ch2.frequency)  # uncached property read
+            results.append(driver.query("*OPC?"))
+            ch1.power = 3
+
+    # A query queued with the batch writes would never be answered
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(5.0)
+    assert not worker.is_alive()
+    assert results[1] == "1"
+    assert emulator.channels[1]["FREQ"] == pytest.approx(2e9)
+    assert emulator.channels[1]["PWR"] == pytest.approx(3)
+
+
+def test_async_api_inside_batch_follows_queued_writes():
+    from pymetr.drivers.base.async_connections import AsyncRawSocketConnection
+    from pymetr.drivers.instruments.hs9000 import HS9000
+
+    emulator = SynthesizerEmulator()
+    with EmulatorServer(emulator) as server:
+        conn = AsyncRawSocketConnection(server.resource, timeout=2.0)
+        conn.open()
+        driver = HS9000(conn)
+        try:
+            sent = emulator.messages_received
+            with driver.batch():
+                driver.write_async(":CH1:PWR:4").result(2.0)
+                driver.write_async(":CH1:FREQ:2E9")
+                assert emulator.messages_received == sent  # queued with the batch
+                # The query goes out after the writes queued before it
+                assert float(driver.query_async(":CH1:FREQ?").result(2.0)) == pytest.approx(2e9)
+            assert emulator.channels[1]["PWR"] == pytest.approx(4)
+        finally:
+            driver.close()
+
+
+def test_sync_mode_io_is_serialized_with_call_async(synth):
+    driver, emulator = synth
+    emulator.channels[1]["FREQ"] = 1.5e9
+    emulator.channels[2]["FREQ"] = 2.5e9
+
+    # Executor-thread queries interleave with queries on this thread
+    futures = [driver.query_async(":CH1:FREQ?") for _ in range(40)]
+    direct = [driver.query(":CH2:FREQ?") for _ in range(40)]
+    assert all(float(f.result(5.0)) == pytest.approx(1.5e9) for f in futures)
+    assert all(float(value) == pytest.approx(2.5e9) for value in direct)
+
+
+@pytest.mark.parametrize("response, expected", [
+    ("-1.0E+01, 2.5,3\n", [-10.0, 2.5, 3.0]),
+    ("1,2,", [1.0, 2.0]),
+    ("1,,2", [1.0, 2.0]),  # empty field: per-element fallback
+])
+def test_data_property_parses_numbers(response, expected):
+    result = DataProperty("TRA", access='read').parse(response)
+    assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("text", ["1,,2", "1,2 V", "1,2,x"])
+def test_parse_numbers_detects_partial_parse_without_warnings(text, monkeypatch):
+    # NumPy versions that stop at the bad field and only warn (or stay
+    # silent under -W ignore) return the numbers read so far
+    monkeypatch.setattr(np, "fromstring", lambda text, dtype, sep: np.array([1.0], dtype=dtype))
+    assert parse_numbers(text, np.float64) is None
+
+
+def test_parse_numbers_counts_fields():
+    assert parse_numbers(" 1 2\t3 ", np.float64, separator="").tolist() == [1.0, 2.0, 3.0]
+    assert parse_numbers("1,2,", np.float64).tolist() == [1.0, 2.0]
+    # NumPy appends a bogus -1 for a blank trailing field; the count catches it
+    assert parse_numbers("1,2, \n", np.float64) is None
+    assert parse_numbers("", np.float64).tolist() == []
+
+
+def test_data_property_custom_converter_and_container():
+    assert DataProperty("X", converter=int, container=list).parse("1, 2") == [1, 2]
+    assert DataProperty("X", converter=str.lower, container=list).parse("A,B") == ["a", "b"]
+    with pytest.raises(ValueError):
+        DataProperty("X").parse("1,OFF")
+    swapped = parse_numbers("1,2", '>i2')
+    assert swapped.dtype == np.dtype('>i2') and swapped.tolist() == [1, 2]
@@ -0,0 +1,41 @@
+# tests/test_state_index.py
+from pymetr.models.base import BaseModel
+
+
+def test_parent_index_follows_links_and_removal(state):
+    plot, trace, marker = (BaseModel(kind, state=state) for kind in ("Plot", "Trace", "Marker"))
+    state.link_models(plot.id, trace.id)
+    state.link_models(trace.id, marker.id)
+
+    assert state.get_parent(marker.id) is trace
+    assert state.get_ancestor_ids(marker.id) == (trace.id, plot.id)
+    assert state.is_descendant(marker.id, plot.id)
+    assert not state.is_descendant(plot.id, marker.id)
+    assert state.find_ancestor(marker.id, BaseModel) is trace
+
+    other = BaseModel("Plot", state=state)
+    state.unlink_models(plot.id, trace.id)  # re-parent: cached ancestors must not survive
+    state.link_models(other.id, trace.id)
+    assert state.get_ancestor_ids(marker.id) == (trace.id, other.id)
+    assert not state.is_descendant(marker.id, plot.id)
+
+    state.remove_model(trace.id)
+    assert state.get_parent(marker.id) is None
+    assert state.get_parent_id(trace.id) is None
+    assert state.get_children(other.id) == []
+
+
+def test_relinked_child_falls_back_to_remaining_parent(state):
+    group_a, group_b, measurement = (BaseModel(kind, state=state) for kind in ("Group", "Group", "Measurement"))
+    state.link_models(group_a.id, measurement.id)
+    state.link_models(group_b.id, measurement.id)
+    assert state.get_parent(measurement.id) is group_b
+
+    state.unlink_models(group_b.id, measurement.id)
+    assert state.get_parent(measurement.id) is group_a
+    assert state.get_children(group_a.id) == [measurement]
+    assert state.is_descendant(measurement.id, group_a.id)
+
+    state.link_models(group_b.id, measurement.id)
+    state.remove_model(measurement.id)
+    assert state.get_children(group_a.id) == [] and state.get_children(group_b.id) == []
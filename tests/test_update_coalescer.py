@@ -0,0 +1,49 @@
+# tests/test_update_coalescer.py
+import threading
+
+from PySide6.QtCore import QEventLoop, QTimer
+
+from pymetr.models.base import BaseModel
+
+
+def run_until_flushed(state, timeout_ms=2000):
+    loop = QEventLoop()
+    state.updates_flushed.connect(lambda *_: loop.quit())
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+
+
+def in_thread(target):
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+
+
+def test_worker_updates_are_coalesced_per_frame(state):
+    model = BaseModel("Trace", state=state)
+    received = []
+    state.subscribe(lambda model_id, model_type, prop, value: received.append((model_type, prop, value)),
+                    model_id=model.id)
+
+    def push():
+        for value in range(500):
+            state.queue_model_update(model.id, "data", value)
+        model.set_property("width", 3)  # emitted off the main thread: coalesced too
+
+    in_thread(push)
+    assert received == []  # nothing is delivered outside the main thread's event loop
+    run_until_flushed(state)
+
+    assert sorted(received) == [("Trace", "data", 499), ("Trace", "width", 3)]
+    stats = state.get_update_stats()
+    assert (stats['queued'], stats['delivered'], stats['dropped'], stats['frames']) == (501, 2, 499, 1)
+
+
+def test_main_thread_changes_are_delivered_immediately(state):
+    model = BaseModel("Plot", state=state)
+    received = []
+    state.subscribe(lambda *args: received.append(args[2:]), model_id=model.id)
+
+    model.set_property("title", "Spectrum")
+    assert received == [("title", "Spectrum")]
+    assert state.get_update_stats()['queued'] == 0